@@ -0,0 +1,725 @@
+"""
+    Benchmark suite for the hot paths of nlptools: every function of comparison,
+    parsing.remove_tildes, parsing.retokenizer, the number and date conversions and 
+    scanners of parsing, the generators of data_augmentation, the construction 
+    and index augmentation of TaggedDoc and the address index, and the cold import
+    time of every submodule.
+
+    Every benchmark runs over a synthetic corpus made with the generators of the
+    package, at several sizes. For each one the suite reports the operations per
+    second of the best repetition and the peak memory allocated by Python, and stores
+    everything in a JSON file so runs of different versions can be compared.
+
+Usage
+-----
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --sizes 100 1000 --groups comparison parsing
+    python benchmarks/run_benchmarks.py --output new.json --compare old.json
+    python benchmarks/run_benchmarks.py --groups import --repeat 5
+"""
+import argparse
+import contextlib
+import datetime
+import io
+import json
+from importlib import metadata
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'src'))
+
+from nlptools import addresses, comparison, data_augmentation, parsing
+
+
+BENCHMARKS = []
+
+DEFAULT_SIZES = [100, 1000, 10000]
+
+KEYWORDS = [
+    'sociedad', 'capital', 'gerente', 'mandato', 'duración', 'acciones',
+    'cuotas', 'domicilio', 'objeto', 'socios', 'administración', 'vigencia'
+]
+
+TOKENIZER_STYLES = ['alphanumeric', 'alphabetic', 'numeric', 'Name', None]
+
+IMPORT_MODULES = [
+    'nlptools', 'nlptools.parsing', 'nlptools.comparison', 'nlptools.corpus', 'nlptools.datasets',
+    'nlptools.addresses', 'nlptools.data_augmentation', 'nlptools.resolver', 'nlptools.deduplication',
+    'nlptools.training',
+]
+
+HEAVY_DEPENDENCIES = ['pandas', 'spacy', 'num2words', 'spa2num', 'tqdm']
+
+
+def benchmark(group: str, name: str = None, max_size: Optional[int] = None) -> Callable:
+    """ Registers a benchmark in the suite.
+
+    Parameters
+    ----------
+    group : str
+        The group of the benchmark, usually the module it measures.
+    name : str, optional
+        The name of the benchmark, by default the name of the decorated function.
+    max_size : Optional[int], optional
+        The biggest size the benchmark runs at, for the functions that are quadratic
+        or too slow to run at every size, by default None.
+
+    Returns
+    -------
+    Callable
+        A decorator for functions that receive the corpus and the size, and return a
+        function without arguments that performs `size` operations.
+    """
+    def register(setup: Callable) -> Callable:
+        BENCHMARKS.append({
+            'group': group,
+            'name': name or setup.__name__,
+            'setup': setup,
+            'max_size': max_size,
+        })
+        return setup
+
+    return register
+
+
+class SyntheticCorpus:
+    """
+        Synthetic sentences, words and tagged documents made with the generators
+        of nlptools.data_augmentation, so benchmarks do not depend on private data.
+
+    Attributes
+    --------
+    - SyntheticCorpus.sentences
+        Sentences of a typical company statute.
+    - SyntheticCorpus.words
+        The tokens of every sentence.
+    - SyntheticCorpus.documents
+        Tagged documents with the format expected by TaggedDoc.
+    """
+    def __init__(self, size: int, seed: int = 0):
+        random.seed(seed)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.addresses = data_augmentation.address_generator(max(size // 10, 10))
+        self.sentences = [self._sentence() for _ in range(size)]
+        self.words = [
+            word
+            for sentence in self.sentences
+            for word in parsing.retokenizer(sentence, style='alphanumeric')
+        ][:size]
+        self.documents = [self._document(i) for i in range(size)]
+
+
+    def _fields(self) -> List[Tuple[str, str]]:
+        """ Generates the tagged values of a document.
+        """
+        date = data_augmentation.random_date_generator()
+        return [
+            ('tipicidad', data_augmentation.tipicidad_generator()),
+            ('cuit', data_augmentation.id_generator(cuit=True)),
+            ('domicilio', random.choice(self.addresses)),
+            ('fecha', data_augmentation.date_formatter(date)),
+            ('capital', str(data_augmentation.capital_generator())),
+            ('aporte', str(data_augmentation.aporte_generator())),
+            ('mandato', str(data_augmentation.mandato_generator())),
+            ('vigencia', str(data_augmentation.vigencia_generator())),
+        ]
+
+
+    def _sentence(self) -> str:
+        """ Generates a sentence joining the tagged values of a document.
+        """
+        return ' '.join(
+            f'{name} {value},'
+            for name, value in self._fields()
+        )
+
+
+    def _document(self, index: int) -> dict:
+        """ Generates a tagged document with a new value for every entity.
+        """
+        text = ''
+        tags = []
+        for (name, value), (_, new_value) in zip(self._fields(), self._fields()):
+            text += f'La {name} de la sociedad es '
+            tags.append({
+                'tag': name,
+                'start': len(text),
+                'end': len(text) + len(value),
+                'text': value,
+                'new_text': new_value,
+            })
+            text += f'{value}. '
+
+        return {'doc_id': f'doc_{index}', 'text': text, 'entities': {'tags': tags}}
+
+
+def _measure(func: Callable, repeat: int) -> Tuple[List[float], int]:
+    """ Times a function several times and measures its peak memory in an extra run.
+
+    Parameters
+    ----------
+    func : Callable
+        The function without arguments to measure.
+    repeat : int
+        How many times the function is timed.
+
+    Returns
+    -------
+    Tuple[List[float], int]
+        The seconds of every repetition and the peak of memory allocated, in bytes.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return timings, peak
+
+
+def _measure_import(module: str, repeat: int) -> dict:
+    """ Imports a module in new interpreters, so every import is cold.
+
+    Parameters
+    ----------
+    module : str
+        The module intended to import, such as 'nlptools.parsing'.
+    repeat : int
+        How many interpreters import it.
+
+    Returns
+    -------
+    dict
+        The seconds of every import, the peak of memory allocated by the import in an
+        extra interpreter, and the heavy dependencies that the import loaded.
+    """
+    code = (
+        'import sys, time, tracemalloc\n'
+        'trace = len(sys.argv) > 1\n'
+        'if trace:\n'
+        '    tracemalloc.start()\n'
+        'start = time.perf_counter()\n'
+        f'import {module}\n'
+        'seconds = time.perf_counter() - start\n'
+        'peak = tracemalloc.get_traced_memory()[1] if trace else 0\n'
+        f'loaded = [name for name in {HEAVY_DEPENDENCIES!r} if type(sys.modules.get(name)).__name__ == \'module\']\n'
+        'print(seconds, peak, *loaded)\n'
+    )
+    source = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'src')
+    env = {**os.environ, 'PYTHONPATH': os.pathsep.join(filter(None, [source, os.environ.get('PYTHONPATH')]))}
+
+    def interpreter(*args: str) -> List[str]:
+        return subprocess.run(
+            [sys.executable, '-c', code, *args], capture_output=True, text=True, check=True, env=env
+        ).stdout.split()
+
+    timings = [float(interpreter()[0]) for _ in range(repeat)]
+    _, peak, *loaded = interpreter('trace')
+
+    return {'timings': timings, 'peak': int(peak), 'loaded': loaded}
+
+
+def run(
+        sizes: List[int],
+        groups: Optional[List[str]] = None,
+        repeat: int = 3,
+        seed: int = 0,
+        verbose: bool = True
+    ) -> List[dict]:
+    """ Runs every registered benchmark at every size.
+
+    Parameters
+    ----------
+    sizes : List[int]
+        The number of operations of every run.
+    groups : Optional[List[str]], optional
+        Only the benchmarks of these groups run. If None, all of them run, by default None.
+    repeat : int, optional
+        How many times every benchmark is timed, by default 3.
+    seed : int, optional
+        The seed of the synthetic corpus, by default 0.
+    verbose : bool, optional
+        If True, every result is printed as soon as it is measured, by default True.
+
+    Returns
+    -------
+    List[dict]
+        A result for every benchmark and size. Benchmarks that fail keep the error message.
+        The `import` group has one result of size 1 for every module of IMPORT_MODULES.
+    """
+    results = []
+    if not groups or 'import' in groups:
+        for module in IMPORT_MODULES:
+            result = {'group': 'import', 'name': module, 'size': 1}
+            try:
+                measured = _measure_import(module, repeat)
+                result.update({
+                    'best_seconds': min(measured['timings']),
+                    'mean_seconds': sum(measured['timings']) / len(measured['timings']),
+                    'ops_per_second': 1 / min(measured['timings']),
+                    'peak_memory_bytes': measured['peak'],
+                    'loaded_dependencies': measured['loaded'],
+                })
+            except (subprocess.CalledProcessError, ValueError) as error:
+                result['error'] = f'{type(error).__name__}: {error}'
+            results.append(result)
+            if verbose:
+                print(_format_result(result))
+        if groups and set(groups) == {'import'}:
+            return results
+
+    corpus = SyntheticCorpus(max(sizes), seed)
+    for bench in BENCHMARKS:
+        if groups and bench['group'] not in groups:
+            continue
+        for size in sizes:
+            if bench['max_size'] and size > bench['max_size']:
+                continue
+            result = {'group': bench['group'], 'name': bench['name'], 'size': size}
+            try:
+                random.seed(seed)
+                timings, peak = _measure(bench['setup'](corpus, size), repeat)
+                result.update({
+                    'best_seconds': min(timings),
+                    'mean_seconds': sum(timings) / len(timings),
+                    'ops_per_second': size / min(timings) if min(timings) else float('inf'),
+                    'peak_memory_bytes': peak,
+                })
+            except Exception as error:
+                result['error'] = f'{type(error).__name__}: {error}'
+            results.append(result)
+            if verbose:
+                print(_format_result(result))
+
+    return results
+
+
+def _format_result(result: dict, baseline: Optional[dict] = None) -> str:
+    """ Formats a result as a line of the report, comparing it with a baseline if given.
+    """
+    label = f"{result['group']}.{result['name']}[{result['size']}]"
+    if 'error' in result:
+        return f'{label:<60} ERROR {result["error"]}'
+
+    line = f"{label:<60} {result['ops_per_second']:>14,.1f} ops/s {result['peak_memory_bytes'] / 1024:>12,.1f} KiB"
+    if result.get('loaded_dependencies'):
+        line += f"  loads {', '.join(result['loaded_dependencies'])}"
+    if baseline and 'ops_per_second' in baseline:
+        line += f"  x{result['ops_per_second'] / baseline['ops_per_second']:.2f}"
+
+    return line
+
+
+def _environment() -> dict:
+    """ Describes the versions and machine of the run, so results can be compared.
+    """
+    versions = {}
+    for package in ['nlptools', 'numpy', 'pandas', 'rapidfuzz', 'spacy', 'num2words', 'spa2num']:
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = None
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip() or None
+    except OSError:
+        commit = None
+
+    return {
+        'date': datetime.datetime.now().isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'versions': versions,
+    }
+
+
+def compare(results: List[dict], baseline_path: str) -> Dict[Tuple[str, str, int], dict]:
+    """ Loads a previous run and indexes its results by group, name and size.
+
+    Parameters
+    ----------
+    results : List[dict]
+        The results of the current run.
+    baseline_path : str
+        The JSON file written by a previous run.
+
+    Returns
+    -------
+    Dict[Tuple[str, str, int], dict]
+        The previous result of every benchmark that is also in the current run.
+    """
+    with open(baseline_path) as file:
+        baseline = json.load(file)['results']
+    keys = {(r['group'], r['name'], r['size']) for r in results}
+
+    return {
+        (r['group'], r['name'], r['size']): r
+        for r in baseline
+        if (r['group'], r['name'], r['size']) in keys
+    }
+
+
+@benchmark('comparison')
+def is_similar_word(corpus, size):
+    pairs = list(zip(corpus.words[:size], corpus.words[1:size + 1]))
+    return lambda: [comparison.is_similar_word(a, b) for a, b in pairs]
+
+
+@benchmark('comparison')
+def is_similar_sentence(corpus, size):
+    pairs = list(zip(corpus.sentences[:size], corpus.sentences[1:size + 1]))
+    return lambda: [comparison.is_similar_sentence(a, b) for a, b in pairs]
+
+
+@benchmark('comparison')
+def similar_word_in_sentence(corpus, size):
+    words = corpus.words[:size]
+    return lambda: [comparison.similar_word_in_sentence(k, words) for k in KEYWORDS]
+
+
+@benchmark('comparison')
+def get_similar_word_in_sentence(corpus, size):
+    words = corpus.words[:size]
+    return lambda: [comparison.get_similar_word_in_sentence(k, words) for k in KEYWORDS]
+
+
+@benchmark('comparison')
+def is_sentence_contained_in_longer_sentence(corpus, size):
+    sentences = corpus.sentences[:size]
+    return lambda: [comparison.is_sentence_contained_in_longer_sentence('capital social', s) for s in sentences]
+
+
+@benchmark('comparison')
+def any_word_in_sentence(corpus, size):
+    words = corpus.words[:size]
+    return lambda: comparison.any_word_in_sentence(['inexistente'] + KEYWORDS[-1:], words)
+
+
+@benchmark('comparison')
+def any_word_in_sentences(corpus, size):
+    sentences = [parsing.retokenizer(s, style='alphanumeric') for s in corpus.sentences[:size]]
+    return lambda: comparison.any_word_in_sentences(KEYWORDS, sentences)
+
+
+@benchmark('comparison')
+def score_matrix(corpus, size):
+    words = corpus.words[:size]
+    return lambda: comparison.score_matrix(KEYWORDS, words, 0.8)
+
+
+@benchmark('comparison')
+def similar_pairs(corpus, size):
+    words = corpus.words[:size]
+    return lambda: comparison.similar_pairs(KEYWORDS, words, 0.8)
+
+
+@benchmark('comparison')
+def extract_best_words(corpus, size):
+    words = corpus.words[:size]
+    return lambda: [comparison.extract_best_words(k, words, 5, 0.6) for k in KEYWORDS]
+
+
+@benchmark('comparison')
+def get_best_similar_word(corpus, size):
+    words = corpus.words[:size]
+    return lambda: [comparison.get_best_similar_word(k, words) for k in KEYWORDS]
+
+
+@benchmark('comparison')
+def prepared_corpus(corpus, size):
+    words = corpus.words[:size]
+    return lambda: comparison.PreparedCorpus(words, remove_accents=True).processed('QRatio')
+
+
+@benchmark('comparison')
+def fuzzy_index_build(corpus, size):
+    words = corpus.words[:size]
+    return lambda: comparison.FuzzyIndex(words)
+
+
+@benchmark('comparison')
+def fuzzy_index_search(corpus, size):
+    index = comparison.FuzzyIndex(corpus.words[:size])
+    return lambda: [index.search(k) for k in KEYWORDS]
+
+
+@benchmark('comparison')
+def keyword_scanner(corpus, size):
+    scanner = comparison.KeywordScanner(KEYWORDS, 0.8)
+    sentences = [parsing.retokenizer(s, style='alphanumeric') for s in corpus.sentences[:size]]
+    return lambda: scanner.contains_many(sentences)
+
+
+@benchmark('comparison', max_size=1000)
+def locate_sentence(corpus, size):
+    text = ' '.join(corpus.sentences[:size // 10 + 1])
+    queries = [s[:60] for s in corpus.sentences[:10]]
+    return lambda: [comparison.locate_sentence(q, text) for q in queries]
+
+
+@benchmark('comparison', max_size=1000)
+def locate_entities(corpus, size):
+    documents = corpus.documents[:size // 10 + 1]
+    return lambda: [comparison.locate_entities(d['entities']['tags'], d['text']) for d in documents]
+
+
+@benchmark('parsing')
+def remove_tildes(corpus, size):
+    sentences = corpus.sentences[:size]
+    return lambda: [parsing.remove_tildes(s) for s in sentences]
+
+
+@benchmark('parsing')
+def normalize_many(corpus, size):
+    normalizer = parsing.TextNormalizer(lowercase=True)
+    sentences = corpus.sentences[:size]
+    return lambda: normalizer.normalize_many(sentences)
+
+
+@benchmark('parsing')
+def number_to_words(corpus, size):
+    rng = random.Random(size)
+    numbers = [rng.choice([rng.randint(1, 31), rng.randint(1900, 2050), rng.randint(1, 200) * 5000]) for _ in range(size)]
+    return lambda: [parsing.number_to_words(n) for n in numbers]
+
+
+@benchmark('parsing')
+def words_to_numbers_many(corpus, size):
+    rng = random.Random(size)
+    vocabulary = []
+    for number in range(1, 3001):
+        words = parsing.number_to_words(number)
+        try:
+            parsing.words_to_numbers(words)
+        except ValueError:
+            continue
+        vocabulary.append(words)
+    texts = [rng.choice(vocabulary) for _ in range(size)]
+    return lambda: parsing.words_to_numbers_many(texts)
+
+
+@benchmark('parsing')
+def find_amounts_many(corpus, size):
+    documents = [d['text'] for d in corpus.documents[:size]]
+    return lambda: list(parsing.find_amounts_many(documents))
+
+
+@benchmark('parsing')
+def parse_dates(corpus, size):
+    rng = random.Random(size)
+    styles = ['basic', 'basic2', 'mixed', 'mixed2', 'regular', 'formal', 'veryformal']
+    texts = [
+        data_augmentation.date_formatter(data_augmentation.random_date_generator(), rng.choice(styles))
+        for _ in range(size)
+    ]
+    return lambda: [parsing.parse_date(text) for text in texts]
+
+
+@benchmark('parsing')
+def find_dates_many(corpus, size):
+    documents = [d['text'] for d in corpus.documents[:size]]
+    return lambda: list(parsing.find_dates_many(documents))
+
+
+@benchmark('parsing')
+def merge_pages_many(corpus, size):
+    documents = [
+        [page.replace('. ', '.\n').replace('s ', 's-\n\n') for page in sentences]
+        for sentences in zip(corpus.sentences[:size:2], corpus.sentences[1:size:2])
+    ]
+    return lambda: list(parsing.merge_pages_many(documents))
+
+
+@benchmark('parsing')
+def find_ids_many(corpus, size):
+    documents = [d['text'] for d in corpus.documents[:size]]
+    return lambda: list(parsing.find_ids_many(documents))
+
+
+def _retokenizer_benchmark(style):
+    def setup(corpus, size):
+        sentences = corpus.sentences[:size]
+        return lambda: [parsing.retokenizer(s, style=style) for s in sentences]
+    return setup
+
+
+def _tokenizer_benchmark(style):
+    def setup(corpus, size):
+        tokenizer = parsing.get_tokenizer(style)
+        sentences = corpus.sentences[:size]
+        return lambda: list(tokenizer.tokenize_many(sentences))
+    return setup
+
+
+for _style in TOKENIZER_STYLES:
+    benchmark('parsing', f'retokenizer_{_style or "split"}')(_retokenizer_benchmark(_style))
+    benchmark('parsing', f'tokenize_many_{_style or "split"}')(_tokenizer_benchmark(_style))
+
+
+@benchmark('data_augmentation')
+def random_date_generator(corpus, size):
+    return lambda: [data_augmentation.random_date_generator() for _ in range(size)]
+
+
+@benchmark('data_augmentation')
+def date_formatter(corpus, size):
+    dates = [data_augmentation.random_date_generator() for _ in range(size)]
+    return lambda: [data_augmentation.date_formatter(d) for d in dates]
+
+
+@benchmark('data_augmentation')
+def id_generator(corpus, size):
+    return lambda: [data_augmentation.id_generator(cuit=i % 2 == 0) for i in range(size)]
+
+
+@benchmark('data_augmentation')
+def capital_generator(corpus, size):
+    return lambda: [data_augmentation.capital_generator() for _ in range(size)]
+
+
+@benchmark('data_augmentation')
+def aporte_generator(corpus, size):
+    return lambda: [data_augmentation.aporte_generator() for _ in range(size)]
+
+
+@benchmark('data_augmentation')
+def mandato_generator(corpus, size):
+    return lambda: [data_augmentation.mandato_generator() for _ in range(size)]
+
+
+@benchmark('data_augmentation')
+def vigencia_generator(corpus, size):
+    return lambda: [data_augmentation.vigencia_generator() for _ in range(size)]
+
+
+@benchmark('data_augmentation')
+def tipicidad_generator(corpus, size):
+    return lambda: [data_augmentation.tipicidad_generator() for _ in range(size)]
+
+
+@benchmark('data_augmentation')
+def random_date_generator_batch(corpus, size):
+    return lambda: data_augmentation.random_date_generator(n=size)
+
+
+@benchmark('data_augmentation')
+def date_formatter_batch(corpus, size):
+    dates = data_augmentation.random_date_generator(n=size)
+    return lambda: data_augmentation.date_formatter(dates)
+
+
+@benchmark('data_augmentation')
+def id_generator_batch(corpus, size):
+    return lambda: [data_augmentation.id_generator(cuit=cuit, n=size // 2) for cuit in (True, False)]
+
+
+@benchmark('data_augmentation')
+def capital_generator_batch(corpus, size):
+    return lambda: data_augmentation.capital_generator(n=size)
+
+
+@benchmark('data_augmentation')
+def aporte_generator_batch(corpus, size):
+    return lambda: data_augmentation.aporte_generator(n=size)
+
+
+@benchmark('data_augmentation')
+def mandato_generator_batch(corpus, size):
+    return lambda: data_augmentation.mandato_generator(n=size)
+
+
+@benchmark('data_augmentation')
+def vigencia_generator_batch(corpus, size):
+    return lambda: data_augmentation.vigencia_generator(n=size)
+
+
+@benchmark('data_augmentation')
+def tipicidad_generator_batch(corpus, size):
+    return lambda: data_augmentation.tipicidad_generator(n=size)
+
+
+@benchmark('data_augmentation')
+def address_generator(corpus, size):
+    def generate():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return data_augmentation.address_generator(size)
+    return generate
+
+
+@benchmark('data_augmentation')
+def random_name_generator(corpus, size):
+    return lambda: data_augmentation.random_name_generator(size, 'company')
+
+
+@benchmark('data_augmentation', max_size=1000)
+def tagged_doc(corpus, size):
+    documents = corpus.documents[:size]
+    return lambda: [data_augmentation.TaggedDoc(_copy_document(d)) for d in documents]
+
+
+@benchmark('data_augmentation', max_size=1000)
+def index_augmentation(corpus, size):
+    documents = [data_augmentation.TaggedDoc(_copy_document(d)) for d in corpus.documents[:size]]
+    return lambda: [d.index_augmentation() for d in documents]
+
+
+@benchmark('addresses')
+def address_index_sample(corpus, size):
+    index = addresses.address_index()
+    return lambda: index.take(index.sample(size))
+
+
+@benchmark('addresses')
+def normalize_addresses(corpus, size):
+    index = addresses.address_index()
+    texts = (corpus.addresses * (size // len(corpus.addresses) + 1))[:size]
+    return lambda: [index.normalize(text) for text in texts]
+
+
+def _copy_document(document: dict) -> dict:
+    """ Copies a document, since TaggedDoc modifies the entities of the one it receives.
+    """
+    return {**document, 'entities': {'tags': [dict(tag) for tag in document['entities']['tags']]}}
+
+
+def main(argv: Optional[List[str]] = None) -> List[dict]:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help='Operations of every run.')
+    parser.add_argument('--groups', nargs='+', default=None, help='Only run these groups.')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed repetitions of every benchmark.')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the synthetic corpus.')
+    parser.add_argument('--output', default='benchmark_results.json', help='JSON file to store the results.')
+    parser.add_argument('--compare', default=None, help='JSON file of a previous run to compare with.')
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.groups, args.repeat, args.seed, verbose=not args.compare)
+    if args.compare:
+        baseline = compare(results, args.compare)
+        for result in results:
+            print(_format_result(result, baseline.get((result['group'], result['name'], result['size']))))
+
+    with open(args.output, 'w') as file:
+        json.dump({'environment': _environment(), 'results': results}, file, indent=2)
+
+    return results
+
+
+if __name__ == '__main__':
+    main()
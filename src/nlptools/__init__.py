@@ -0,0 +1,109 @@
+"""
+    Suite of tools for training models and mining text.
+
+    The submodules, and their public functions and classes, are imported the first
+    time they are used, so `import nlptools` is immediate and a job that only needs
+    `nlptools.remove_tildes` never imports pandas or spacy. The heavy dependencies of
+    every submodule are imported lazily too.
+
+Examples
+-------
+>>> import nlptools
+>>> nlptools.remove_tildes('Razón Social')
+'Razon Social'
+>>> nlptools.parsing.parse_date('3 de marzo de 2020')
+datetime.date(2020, 3, 3)
+"""
+import importlib
+import importlib.util
+import sys
+from types import ModuleType
+
+
+_SUBMODULES = {
+    'addresses': ['AddressIndex', 'address_index', 'normalize_addresses'],
+    'comparison': [
+        'PreparedQuery', 'PreparedCorpus', 'is_similar_word', 'is_similar_sentence',
+        'similar_word_in_sentence', 'is_sentence_contained_in_longer_sentence',
+        'get_similar_word_in_sentence', 'any_word_in_sentence', 'score_matrix', 'similar_pairs',
+        'any_word_in_sentences', 'extract_best_words', 'get_best_similar_word', 'FuzzyIndex',
+        'KeywordScanner', 'locate_sentence', 'locate_entities',
+    ],
+    'corpus': ['is_corpus', 'to_tagged_document', 'ShardedCorpus', 'CorpusWriter'],
+    'data_augmentation': [
+        'TaggedDoc', 'random_date_generator', 'date_formatter', 'random_name_generator',
+        'mandato_generator', 'vigencia_generator', 'tipicidad_generator', 'id_generator',
+        'capital_generator', 'aporte_generator', 'address_generator',
+    ],
+    'datasets': [
+        'StringColumn', 'ColumnarDataset', 'columnar_cache_dir', 'load_columnar', 'DatasetCache',
+        'dataset_cache_info', 'clear_dataset_cache', 'set_dataset_cache_budget', 'sample_positions',
+        'load_source', 'SharedDatasetsHandle', 'SharedDatasets', 'share_datasets', 'estatutos_dir',
+        'load_dataset',
+    ],
+    'deduplication': ['DuplicateReport', 'find_duplicates'],
+    'parsing': [
+        'words_to_numbers', 'number_to_words', 'number_to_words_many', 'words_to_numbers_many',
+        'conversion_cache_info', 'clear_conversion_cache', 'TextNormalizer', 'remove_tildes',
+        'Tokenizer', 'register_tokenizer', 'get_tokenizer', 'retokenizer', 'find_amounts',
+        'find_amounts_many', 'parse_date', 'parse_dates', 'find_dates', 'find_dates_many',
+        'OffsetMap', 'merge_pages', 'merge_pages_many', 'validate_cuits', 'find_ids', 'find_ids_many',
+    ],
+    'resolver': ['normalize_company_name', 'CompanyResolver'],
+    'training': ['create_blank_ner', 'train_new_model'],
+}
+
+_EXPORTS = {
+    name: submodule
+    for submodule, names in _SUBMODULES.items()
+    for name in names
+}
+
+__all__ = sorted(_SUBMODULES) + sorted(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        return importlib.import_module(f'{__name__}.{name}')
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f'{__name__}.{_EXPORTS[name]}'), name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+def _lazy_module(name: str) -> ModuleType:
+    """ Returns a module that is imported the first time one of its attributes is used.
+
+    Parameters
+    ----------
+    name : str
+        The name of the module, such as 'pandas'.
+
+    Returns
+    -------
+    ModuleType
+        The module, already imported if it was, or a lazy module registered in
+        `sys.modules`, so later imports of the same module share it.
+
+    Raises
+    ------
+    ModuleNotFoundError
+        If the module is not installed.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f'No module named {name!r}', name=name)
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+
+    return module
@@ -0,0 +1,492 @@
+"""
+    A hierarchical index of the streets of the bundled `calles` dataset, grouped by
+    provincia and departamento, to generate consistent addresses and to normalize the
+    addresses extracted from documents, such as the `*_domicilio` entities.
+
+    Every level is stored as integer codes sorted by provincia, departamento and street,
+    so the streets of a provincia or a departamento are one contiguous range, a random
+    street is one integer draw, and the streets starting with a prefix are found with a
+    binary search.
+
+Classes
+-------
+- AddressIndex
+    The provincias, departamentos and streets of a dataset as integer-coded arrays.
+"""
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from nlptools import _lazy_module
+from nlptools.datasets import SharedDatasetsHandle, load_source
+from nlptools.parsing import TextNormalizer
+
+pd = _lazy_module('pandas')
+
+
+_NORMALIZER = TextNormalizer('unicode', lowercase=True)
+
+_NON_ALPHANUMERIC = re.compile(r'[\W_]+')
+
+_NON_ALPHANUMERIC_LINE = re.compile(r'(?:[^\w\n]|_)+')
+
+_LINE_EDGES = re.compile(r'^ | $', re.MULTILINE)
+
+_STREET_ABBREVIATIONS = {
+    'avenida': 'av',
+    'avda': 'av',
+    'pasaje': 'pje',
+    'general': 'grl',
+    'gral': 'grl',
+    'doctor': 'dr',
+    'diagonal': 'diag',
+    'provincial': 'pcial',
+}
+
+_ABBREVIATION_PATTERN = re.compile(r'\b(?:' + '|'.join(_STREET_ABBREVIATIONS) + r')\b')
+
+_PROVINCIA_ALIASES = {
+    'Ciudad Autónoma de Buenos Aires': ['caba', 'capital federal', 'ciudad de buenos aires'],
+}
+
+_DEPARTAMENTO_PREFIX = re.compile(
+    r'^(?:de )?(?:la )?(?:localidad|partido|departamento|municipio|ciudad|comuna) de '
+)
+
+_STREET_NUMBER = re.compile(r' (?P<altura>\d+)(?= |$)')
+
+_NUMBER_LABEL = re.compile(r' (?:n|nro|no|numero)$')
+
+
+def _key(text: str) -> str:
+    """ Lowercases a text and removes its accents and punctuation, to compare names.
+    """
+    return _NON_ALPHANUMERIC.sub(' ', _NORMALIZER.normalize(text)).strip()
+
+
+def _street_key(text: str) -> str:
+    """ Builds the key of a street, with the abbreviations used by the `calles` dataset.
+    """
+    return _ABBREVIATION_PATTERN.sub(lambda match: _STREET_ABBREVIATIONS[match.group()], _key(text))
+
+
+def _street_keys(names: List[str]) -> List[str]:
+    """ Builds the keys of a batch of streets at once, joining them in one text.
+    """
+    text = '\n'.join(_NORMALIZER.normalize_many(names))
+    text = _LINE_EDGES.sub('', _NON_ALPHANUMERIC_LINE.sub(' ', text))
+    text = _ABBREVIATION_PATTERN.sub(lambda match: _STREET_ABBREVIATIONS[match.group()], text)
+
+    return text.split('\n')
+
+
+class AddressIndex:
+    """
+        The provincias, departamentos and streets of a dataset, stored as integer codes
+        sorted by provincia, departamento and street. The departamentos of a provincia
+        and the streets of a departamento are contiguous ranges, delimited by the arrays
+        of starts, so drawing a street is one random integer and every draw is a real
+        combination of street, departamento and provincia.
+
+    Attributes
+    --------
+    - AddressIndex.provincias
+        The names of the provincias, sorted.
+    - AddressIndex.departamentos
+        The names of the departamentos, sorted by provincia and name.
+    - AddressIndex.departamento_provincia
+        The code of the provincia of every departamento.
+    - AddressIndex.provincia_starts
+        Where the departamentos of every provincia start, with one more for the end.
+    - AddressIndex.street_names
+        The names of the streets, without repetitions, sorted by their keys.
+    - AddressIndex.streets
+        The code of the name of every street of every departamento.
+    - AddressIndex.street_departamento
+        The code of the departamento of every street.
+    - AddressIndex.departamento_starts
+        Where the streets of every departamento start, with one more for the end.
+
+    Methods
+    -------
+    - AddressIndex.sample
+    - AddressIndex.take
+    - AddressIndex.streets_with_prefix
+    - AddressIndex.find_provincia
+    - AddressIndex.find_departamento
+    - AddressIndex.normalize
+    - AddressIndex.normalize_many
+
+    Examples
+    -------
+    >>> from nlptools.addresses import address_index
+    >>> index = address_index()
+    >>> index.take(index.sample(1, provincia='Provincia de Chubut', seed=1))
+              nombre departamento            provincia
+    0  JOSE H ORTEGA    Escalante  Provincia de Chubut
+    >>> index.normalize('Av. Cabildo 2040, piso 3, Ciudad de Buenos Aires')
+    {'calle': 'AV CABILDO', 'altura': '2040', 'departamento': None, 'provincia': 'Ciudad Autónoma de Buenos Aires'}
+    """
+    def __init__(self, source: pd.DataFrame = None, shared: Optional[SharedDatasetsHandle] = None):
+        if source is None:
+            source = load_source('calles', ['provincia', 'departamento', 'nombre'], shared=shared)
+        source = source[['provincia', 'departamento', 'nombre']].dropna().drop_duplicates()
+
+        provincias = source['provincia'].tolist()
+        departamentos = source['departamento'].tolist()
+        nombres = source['nombre'].tolist()
+
+        names = list(set(nombres))
+        keys = _street_keys(names)
+        order = sorted(range(len(names)), key=lambda i: (keys[i], names[i]))
+        self.street_names = [names[i] for i in order]
+        self._street_keys = np.array([keys[i] for i in order])
+        self._street_names = np.array(self.street_names, dtype=object)
+        street_codes = {name: code for code, name in enumerate(self.street_names)}
+
+        self.provincias = sorted(set(provincias))
+        provincia_codes = {name: code for code, name in enumerate(self.provincias)}
+        pairs = sorted(set(zip(provincias, departamentos)))
+        self.departamentos = [departamento for _, departamento in pairs]
+        self.departamento_provincia = np.array([provincia_codes[provincia] for provincia, _ in pairs], dtype=np.int16)
+        self.provincia_starts = np.searchsorted(
+            self.departamento_provincia, np.arange(len(self.provincias) + 1)
+        ).astype(np.int32)
+        departamento_codes = {pair: code for code, pair in enumerate(pairs)}
+
+        street_departamento = np.fromiter(
+            map(departamento_codes.__getitem__, zip(provincias, departamentos)), dtype=np.int32, count=len(nombres)
+        )
+        streets = np.fromiter(map(street_codes.__getitem__, nombres), dtype=np.int32, count=len(nombres))
+        order = np.lexsort((streets, street_departamento))
+        self.street_departamento = street_departamento[order].astype(np.int16)
+        self.streets = streets[order]
+        self.departamento_starts = np.searchsorted(
+            self.street_departamento, np.arange(len(self.departamentos) + 1)
+        ).astype(np.int32)
+        self._departamento_names = np.array(self.departamentos, dtype=object)
+        self._provincia_names = np.array(self.provincias, dtype=object)
+
+        self._provincia_keys = {}
+        for code, provincia in enumerate(self.provincias):
+            aliases = [provincia, provincia.split(',')[0]] + _PROVINCIA_ALIASES.get(provincia, [])
+            aliases += [alias[len('provincia de '):] for alias in map(_key, aliases) if alias.startswith('provincia de ')]
+            for alias in aliases:
+                self._provincia_keys[_key(alias)] = code
+        self._provincia_pattern = re.compile(
+            r'(?:^| )(' + '|'.join(sorted(map(re.escape, self._provincia_keys), key=len, reverse=True)) + r')$'
+        )
+        self._departamento_keys = {}
+        for code, departamento in enumerate(self.departamentos):
+            self._departamento_keys.setdefault(_key(departamento), []).append(code)
+
+
+    def __len__(self) -> int:
+        return len(self.streets)
+
+
+    def __repr__(self) -> str:
+        return (
+            f'AddressIndex(provincias={len(self.provincias)}, '
+            f'departamentos={len(self.departamentos)}, streets={len(self)})'
+        )
+
+
+    @property
+    def nbytes(self) -> int:
+        """ The bytes of the integer arrays of the index.
+        """
+        return (
+            self.streets.nbytes + self.street_departamento.nbytes + self.departamento_starts.nbytes
+            + self.departamento_provincia.nbytes + self.provincia_starts.nbytes
+        )
+
+
+    def _range(self, provincia: Optional[str] = None, departamento: Optional[str] = None) -> Tuple[int, int]:
+        """ Returns the range of the streets of a provincia or a departamento.
+
+        Raises
+        ------
+        KeyError
+            If the provincia or the departamento does not exist.
+        """
+        if departamento is not None:
+            code = self.find_departamento(departamento, provincia)
+            if code is None:
+                raise KeyError(f'Argument `departamento` must be one of {self.departamentos}')
+            return int(self.departamento_starts[code]), int(self.departamento_starts[code + 1])
+        if provincia is not None:
+            code = self.find_provincia(provincia)
+            if code is None:
+                raise KeyError(f'Argument `provincia` must be one of {self.provincias}')
+            first, last = self.provincia_starts[code], self.provincia_starts[code + 1]
+            return int(self.departamento_starts[first]), int(self.departamento_starts[last])
+
+        return 0, len(self.streets)
+
+
+    def sample(
+            self,
+            n: int,
+            provincia: Optional[str] = None,
+            departamento: Optional[str] = None,
+            seed: Optional[int] = None
+        ) -> np.ndarray:
+        """ Draws random streets, all of them equally likely.
+
+        Parameters
+        ----------
+        n : int
+            The amount of streets intended to draw. They can repeat.
+        provincia : Optional[str], optional
+            Draws only streets of this provincia, by default None.
+        departamento : Optional[str], optional
+            Draws only streets of this departamento, by default None.
+        seed : Optional[int], optional
+            The seed of the random generator, by default None.
+
+        Returns
+        -------
+        np.ndarray
+            The positions of the streets, to use with `AddressIndex.take`.
+        """
+        start, end = self._range(provincia, departamento)
+
+        return np.random.default_rng(seed).integers(start, end, n)
+
+
+    def take(self, positions: Iterable[int]) -> pd.DataFrame:
+        """ Returns the street, departamento and provincia of the positions provided.
+
+        Returns
+        -------
+        pd.DataFrame
+            A table with the columns `nombre`, `departamento` and `provincia`.
+        """
+        positions = np.asarray(positions, dtype=np.int64)
+        departamentos = self.street_departamento[positions]
+
+        return pd.DataFrame({
+            'nombre': self._street_names[self.streets[positions]],
+            'departamento': self._departamento_names[departamentos],
+            'provincia': self._provincia_names[self.departamento_provincia[departamentos]]
+        })
+
+
+    def _street_codes(self, prefix: str, exact: bool = False) -> Tuple[int, int]:
+        """ Returns the range of the street names whose key starts with, or is, the key of a prefix.
+        """
+        key = _street_key(prefix)
+        start = int(np.searchsorted(self._street_keys, key, 'left'))
+        end = int(np.searchsorted(self._street_keys, key if exact else key + '\uffff', 'right'))
+
+        return start, end
+
+
+    def streets_with_prefix(
+            self,
+            prefix: str,
+            provincia: Optional[str] = None,
+            departamento: Optional[str] = None
+        ) -> List[str]:
+        """ Finds the streets whose names start with a prefix, ignoring case, accents and punctuation.
+
+        Parameters
+        ----------
+        prefix : str
+            The beginning of the name of the street, such as 'av cab'.
+        provincia : Optional[str], optional
+            Searches only the streets of this provincia, by default None.
+        departamento : Optional[str], optional
+            Searches only the streets of this departamento, by default None.
+
+        Returns
+        -------
+        List[str]
+            The names of the streets, sorted and without repetitions.
+        """
+        first, last = self._street_codes(prefix)
+        if provincia is None and departamento is None:
+            return self.street_names[first:last]
+
+        start, end = self._range(provincia, departamento)
+        codes = set()
+        for code in np.unique(self.street_departamento[start:end]).tolist():
+            streets = self.streets[self.departamento_starts[code]:self.departamento_starts[code + 1]]
+            codes.update(streets[np.searchsorted(streets, first):np.searchsorted(streets, last)].tolist())
+
+        return [self.street_names[code] for code in sorted(codes)]
+
+
+    def find_provincia(self, text: str) -> Optional[int]:
+        """ Finds the provincia a text ends with, such as 'Capital Federal' or 'provincia de Cordoba'.
+
+        Returns
+        -------
+        Optional[int]
+            The code of the provincia, or None if the text does not end with any.
+        """
+        match = self._provincia_pattern.search(_key(text))
+
+        return self._provincia_keys[match.group(1)] if match else None
+
+
+    def find_departamento(self, text: str, provincia: Optional[str] = None) -> Optional[int]:
+        """ Finds a departamento by its name, such as 'partido de La Matanza'.
+
+        Parameters
+        ----------
+        text : str
+            The name of the departamento, optionally after 'partido de', 'localidad de', etc.
+        provincia : Optional[str], optional
+            The provincia of the departamento, to choose between departamentos with the same name.
+
+        Returns
+        -------
+        Optional[int]
+            The code of the departamento, or None if there is none with that name,
+            or several in different provincias and the provincia is not provided.
+        """
+        return self._find_departamento(_key(text), None if provincia is None else self.find_provincia(provincia))
+
+
+    def _find_departamento(self, key: str, provincia: Optional[int] = None) -> Optional[int]:
+        """ Finds a departamento by the key of its name, in the provincia with the code provided, if any.
+        """
+        codes = self._departamento_keys.get(_DEPARTAMENTO_PREFIX.sub('', key), [])
+        if provincia is not None:
+            codes = [code for code in codes if self.departamento_provincia[code] == provincia]
+
+        return codes[0] if len(codes) == 1 else None
+
+
+    def _find_street(self, text: str, start: int, end: int) -> Tuple[Optional[int], Optional[int]]:
+        """ Finds a street by its exact name in a range of streets.
+
+        Returns
+        -------
+        Tuple[Optional[int], Optional[int]]
+            The code of the street name and the position of the street, or None if the name is not in the range.
+            The position is None when the street is in several departamentos of the range.
+        """
+        first, last = self._street_codes(text, exact=True)
+        if first == last and _NUMBER_LABEL.search(text):
+            first, last = self._street_codes(_NUMBER_LABEL.sub('', text), exact=True)
+        if first == last:
+            first, last = self._street_codes(re.sub(r'^calle ', '', _street_key(text)), exact=True)
+        for code in range(first, last):
+            positions = np.flatnonzero(self.streets[start:end] == code)
+            if len(positions):
+                return code, int(start + positions[0]) if len(positions) == 1 else None
+
+        return None, None
+
+
+    def normalize(self, address: str) -> Optional[Dict[str, Optional[str]]]:
+        """ Splits an address into its street, number, departamento and provincia, with their canonical names.
+
+        Parameters
+        ----------
+        address : str
+            An address as extracted from a document, such as 'Pico 4785, ciudad autonoma de buenos Aires'.
+
+        Returns
+        -------
+        Optional[Dict[str, Optional[str]]]
+            The keys `calle`, `altura`, `departamento` and `provincia`, with None for the parts
+            not found. Only streets that exist in the departamento, or in the provincia, are
+            accepted, and a departamento or provincia missing from the text is completed
+            when the street belongs to only one. Returns None if the address is not a string.
+        """
+        if not isinstance(address, str):
+            return None
+
+        parts = [_key(part) for part in address.split(',')]
+        parts = [part for part in parts if part]
+        provincia = departamento = None
+        for part in reversed(parts[1:]):
+            if provincia is None:
+                match = self._provincia_pattern.search(part)
+                if match:
+                    provincia = self._provincia_keys[match.group(1)]
+                    part = part[:match.start()].strip()
+            if part:
+                departamento = self._find_departamento(part, provincia)
+            if departamento is not None:
+                provincia = int(self.departamento_provincia[departamento])
+                break
+
+        calle = altura = None
+        if departamento is not None:
+            start, end = int(self.departamento_starts[departamento]), int(self.departamento_starts[departamento + 1])
+        elif provincia is not None:
+            first, last = self.provincia_starts[provincia], self.provincia_starts[provincia + 1]
+            start, end = int(self.departamento_starts[first]), int(self.departamento_starts[last])
+        else:
+            start, end = 0, len(self.streets)
+        for match in reversed(list(_STREET_NUMBER.finditer(parts[0] if parts else ''))):
+            code, position = self._find_street(parts[0][:match.start()], start, end)
+            if code is not None:
+                calle, altura = self.street_names[code], match.group('altura')
+                if position is not None:
+                    departamento = int(self.street_departamento[position])
+                    provincia = int(self.departamento_provincia[departamento])
+                break
+
+        return {
+            'calle': calle,
+            'altura': altura,
+            'departamento': None if departamento is None else self.departamentos[departamento],
+            'provincia': None if provincia is None else self.provincias[provincia]
+        }
+
+
+    def normalize_many(self, addresses: Iterable[str]) -> List[Optional[Dict[str, Optional[str]]]]:
+        """ Normalizes a batch of addresses, normalizing repeated addresses only once.
+
+        Returns
+        -------
+        List[Optional[Dict[str, Optional[str]]]]
+            The normalization of every address, in the same order, as `AddressIndex.normalize` returns it.
+        """
+        addresses = list(addresses)
+        normalized = {}
+        for address in addresses:
+            if address not in normalized:
+                normalized[address] = self.normalize(address)
+
+        return [normalized[address] for address in addresses]
+
+
+@lru_cache(maxsize=None)
+def address_index(shared: Optional[SharedDatasetsHandle] = None) -> AddressIndex:
+    """ Builds, once per process, the address index over the bundled `calles` dataset,
+    reading it from shared memory if the handle provided stores it.
+    Use `address_index.cache_clear()` to release it.
+    """
+    return AddressIndex(shared=shared)
+
+
+def normalize_addresses(addresses: Iterable[str]) -> List[Optional[Dict[str, Optional[str]]]]:
+    """ Normalizes the addresses extracted from documents, such as the `*_domicilio` entities,
+    using the index of the bundled `calles` dataset.
+
+    Parameters
+    ----------
+    addresses : Iterable[str]
+        The raw addresses.
+
+    Returns
+    -------
+    List[Optional[Dict[str, Optional[str]]]]
+        The street, number, departamento and provincia of every address, as `AddressIndex.normalize` returns them.
+
+    Examples
+    -------
+    >>> from nlptools.addresses import normalize_addresses
+    >>> normalize_addresses(['Pico 4785, ciudad autonoma de buenos Aires'])
+    [{'calle': 'PICO', 'altura': '4785', 'departamento': None, 'provincia': 'Ciudad Autónoma de Buenos Aires'}]
+    """
+    return address_index().normalize_many(addresses)
@@ -3,13 +3,525 @@
     in knowing how similar words are, please use the rapidfuzz library.
 """
 
-from rapidfuzz import fuzz
-from typing import Optional, List
+import heapq
+import os
+import pickle
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import numpy as np
+from rapidfuzz import fuzz, utils
+from typing import Callable, Optional, List, Sequence, Tuple, Union
+from nlptools.parsing import TextNormalizer, get_tokenizer, remove_tildes
+
+
+_PROCESSORS = {
+    'ratio': None,
+    'QRatio': utils.default_process,
+}
+
+_SCORE_MARGIN = 1e-3
+
+_EXECUTORS = {
+    'serial': None,
+    'thread': ThreadPoolExecutor,
+    'process': ProcessPoolExecutor,
+}
+
+_CHUNKS_PER_JOB = 4
+
+
+def _get_processor(ratio_func: str) -> Optional[Callable]:
+    """ Resolves the preprocessing step applied by a ratio function.
+
+    Parameters
+    ----------
+    ratio_func : str {'ratio', 'QRatio'}
+        The name of the ratio function.
+
+    Returns
+    -------
+    Optional[Callable]
+        The function applied to every string before scoring, or None
+        if the strings are scored as they are.
+
+    Raises
+    ------
+    KeyError
+        If the ratio function provided is not among the supported ones.
+    """
+    if ratio_func not in _PROCESSORS:
+        raise KeyError(f'{ratio_func} is not a valid option. Please choose one of the following {list(_PROCESSORS)}')
+
+    return _PROCESSORS[ratio_func]
+
+
+def _get_executor(backend: str) -> Optional[Callable]:
+    """ Resolves the executor class used by an execution backend.
+
+    Parameters
+    ----------
+    backend : str {'serial', 'thread', 'process'}
+        The name of the execution backend.
+
+    Returns
+    -------
+    Optional[Callable]
+        The executor class, or None if the work runs in the calling thread.
+
+    Raises
+    ------
+    KeyError
+        If the backend provided is not among the supported ones.
+    """
+    if backend not in _EXECUTORS:
+        raise KeyError(f'{backend} is not a valid option. Please choose one of the following {list(_EXECUTORS)}')
+
+    return _EXECUTORS[backend]
+
+
+def _chunk_bounds(
+        n_items: int, 
+        n_jobs: int, 
+        chunksize: Optional[int] = None
+    ) -> List[Tuple[int, int]]:
+    """ Splits a number of items into contiguous chunks to be distributed among workers.
+
+    Parameters
+    ----------
+    n_items : int
+        The number of items to split.
+    n_jobs : int
+        The number of workers that will process the chunks.
+    chunksize : Optional[int], optional
+        The number of items per chunk. If None, it is chosen so every worker 
+        receives a few chunks, by default None.
+
+    Returns
+    -------
+    List[Tuple[int, int]]
+        The `(start, end)` bounds of every chunk, in order.
+    """
+    if not chunksize:
+        chunksize = -(-n_items // (n_jobs * _CHUNKS_PER_JOB)) if n_jobs > 1 else n_items
+    chunksize = max(int(chunksize), 1)
+
+    return [(start, min(start + chunksize, n_items)) for start in range(0, n_items, chunksize)]
+
+
+def _map_chunks(
+        func: Callable, 
+        chunks: List[tuple], 
+        backend: str = 'serial', 
+        n_jobs: Optional[int] = None
+    ) -> list:
+    """ Applies a function to every chunk of arguments with the chosen execution backend.
+
+    Parameters
+    ----------
+    func : Callable
+        A module level function, so it can be sent to other processes.
+    chunks : List[tuple]
+        The positional arguments of every call.
+    backend : str {'serial', 'thread', 'process'}, optional
+        Where the calls run: in the calling thread, in a pool of threads, which only 
+        helps when the scorer releases the GIL, or in a pool of processes, by default 'serial'.
+    n_jobs : Optional[int], optional
+        The number of workers. If None, all the available cores are used, by default None.
+
+    Returns
+    -------
+    list
+        The result of every call, in the same order as the chunks, whatever the backend.
+    """
+    executor = _get_executor(backend)
+    n_jobs = n_jobs or os.cpu_count() or 1
+    if executor is None or n_jobs == 1 or len(chunks) <= 1:
+        return [func(*chunk) for chunk in chunks]
+
+    with executor(max_workers=min(n_jobs, len(chunks))) as pool:
+        return list(pool.map(func, *zip(*chunks)))
+
+
+def _normalize_word(word: str, lowercase: bool, remove_accents: bool) -> str:
+    """ Applies the optional lowercasing and accent removal to a word.
+
+    Parameters
+    ----------
+    word : str
+        The word intended to normalize.
+    lowercase : bool
+        If True, the word is lowercased.
+    remove_accents : bool
+        If True, the accents are removed with `nlptools.parsing.remove_tildes`.
+
+    Returns
+    -------
+    str
+        The normalized word.
+    """
+    if lowercase:
+        word = word.lower()
+    if remove_accents:
+        word = remove_tildes(word)
+
+    return word
+
+
+class PreparedQuery:
+    """
+        A search term that is normalized only once. Every function of this module 
+        accepts it instead of a string, and uses the normalized word as it is.
+
+    Attributes
+    --------
+    - PreparedQuery.word
+        The word provided, as it was.
+    - PreparedQuery.normalized
+        The word after lowercasing and removing the accents, as requested.
+    - PreparedQuery.lowercase
+        Whether the word was lowercased.
+    - PreparedQuery.remove_accents
+        Whether the accents of the word were removed.
+
+    Methods
+    -------
+    - PreparedQuery.processed
+
+    Examples
+    -------
+    >>> from nlptools.comparison import PreparedQuery, similar_word_in_sentence
+    >>> query = PreparedQuery('Razón', remove_accents=True)
+    >>> query.normalized
+    'razon'
+    >>> similar_word_in_sentence(query, ['la', 'razon', 'social'])
+    True
+    """
+    def __init__(
+            self, 
+            word: str, 
+            lowercase: bool = True, 
+            remove_accents: bool = False
+        ):
+        self.word = word
+        self.lowercase = lowercase
+        self.remove_accents = remove_accents
+        self.normalized = _normalize_word(word, lowercase, remove_accents)
+        self._processed = {}
+
+
+    def __repr__(self) -> str:
+        return f'PreparedQuery({self.word!r})'
+
+
+    def processed(self, ratio_func: str = 'ratio') -> str:
+        """ Returns the normalized word after the preprocessing of a ratio function.
+
+        Parameters
+        ----------
+        ratio_func : str {'ratio', 'QRatio'}, optional
+            The function that will evaluate the similarity, by default 'ratio'.
+
+        Returns
+        -------
+        str
+            The word ready to be compared with `fuzz.ratio`. It is computed 
+            once per ratio function and kept.
+        """
+        if ratio_func not in self._processed:
+            processor = _get_processor(ratio_func)
+            self._processed[ratio_func] = processor(self.normalized) if processor else self.normalized
+
+        return self._processed[ratio_func]
+
+
+class PreparedCorpus:
+    """
+        A list of words, usually the tokens of a document, that is normalized only once. 
+        Every function of this module accepts it instead of a list of strings, so the 
+        same corpus can be searched with many keywords without normalizing it again.
+
+    Attributes
+    --------
+    - PreparedCorpus.words
+        The list of words provided, as they were.
+    - PreparedCorpus.normalized
+        The words after lowercasing and removing the accents, as requested.
+    - PreparedCorpus.lowercase
+        Whether the words were lowercased.
+    - PreparedCorpus.remove_accents
+        Whether the accents of the words were removed.
+
+    Methods
+    -------
+    - PreparedCorpus.processed
+
+    Examples
+    -------
+    >>> from nlptools.comparison import PreparedCorpus, get_similar_word_in_sentence
+    >>> corpus = PreparedCorpus(['The', 'Aple', 'is', 'red'])
+    >>> get_similar_word_in_sentence('Apple', corpus, 0.5)
+    'Aple'
+    """
+    def __init__(
+            self, 
+            list_of_words: Sequence[str], 
+            lowercase: bool = True, 
+            remove_accents: bool = False
+        ):
+        self.words = list(list_of_words)
+        self.lowercase = lowercase
+        self.remove_accents = remove_accents
+        if remove_accents:
+            self.normalized = TextNormalizer(lowercase=lowercase).normalize_many(self.words)
+        else:
+            self.normalized = [
+                _normalize_word(w, lowercase, remove_accents) 
+                for w in self.words
+            ]
+        self._processed = {}
+
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+
+    def __repr__(self) -> str:
+        return f'PreparedCorpus({len(self.words)} words)'
+
+
+    def processed(self, ratio_func: str = 'ratio') -> List[str]:
+        """ Returns the normalized words after the preprocessing of a ratio function.
+
+        Parameters
+        ----------
+        ratio_func : str {'ratio', 'QRatio'}, optional
+            The function that will evaluate the similarity, by default 'ratio'.
+
+        Returns
+        -------
+        List[str]
+            The words ready to be compared with `fuzz.ratio`. They are computed 
+            once per ratio function and kept.
+        """
+        if ratio_func not in self._processed:
+            processor = _get_processor(ratio_func)
+            self._processed[ratio_func] = [processor(w) for w in self.normalized] if processor else self.normalized
+
+        return self._processed[ratio_func]
+
+
+def _prepare_word(
+        word: Union[str, PreparedQuery], 
+        ratio_func: str = 'ratio', 
+        lowercase: bool = False
+    ) -> str:
+    """ Applies the normalization and the scorer preprocessing to a word.
+
+    Parameters
+    ----------
+    word : Union[str, PreparedQuery]
+        The word intended to be scored. A PreparedQuery keeps its own normalization.
+    ratio_func : str {'ratio', 'QRatio'}, optional
+        The function that will evaluate the similarity, by default 'ratio'.
+    lowercase : bool, optional
+        If True, a plain string is lowercased before the preprocessing, by default False.
+
+    Returns
+    -------
+    str
+        The word ready to be compared with `fuzz.ratio`.
+    """
+    if isinstance(word, PreparedQuery):
+        return word.processed(ratio_func)
+
+    processor = _get_processor(ratio_func)
+    word = word.lower() if lowercase else word
+
+    return processor(word) if processor else word
+
+
+def _prepare_words(
+        list_of_words: Union[Sequence[str], PreparedCorpus], 
+        ratio_func: str = 'ratio', 
+        lowercase: bool = False
+    ) -> List[str]:
+    """ Applies the normalization and the scorer preprocessing to a list of words.
+
+    Parameters
+    ----------
+    list_of_words : Union[Sequence[str], PreparedCorpus]
+        The words intended to be scored. A PreparedCorpus keeps its own normalization.
+    ratio_func : str {'ratio', 'QRatio'}, optional
+        The function that will evaluate the similarity, by default 'ratio'.
+    lowercase : bool, optional
+        If True, every plain string is lowercased before the preprocessing, by default False.
+
+    Returns
+    -------
+    List[str]
+        The words ready to be compared with `fuzz.ratio`.
+    """
+    if isinstance(list_of_words, PreparedCorpus):
+        return list_of_words.processed(ratio_func)
+
+    words = [
+        _prepare_word(w, ratio_func, lowercase) 
+        for w in list_of_words
+    ]
+
+    return words
+
+
+def _is_empty(word: Union[str, PreparedQuery]) -> bool:
+    """ Checks if a word, or the word behind a PreparedQuery, is empty.
+
+    Parameters
+    ----------
+    word : Union[str, PreparedQuery]
+        The word intended to check.
+
+    Returns
+    -------
+    bool
+        True if there is nothing to compare.
+    """
+    return not (word.normalized if isinstance(word, PreparedQuery) else word)
+
+
+def _words_and_originals(
+        list_of_words: Union[Sequence[str], PreparedCorpus], 
+        ratio_func: str, 
+        lowercase: bool
+    ) -> Tuple[List[str], list, List[bool]]:
+    """ Prepares a list of words keeping the originals and which of them are empty.
+
+    Parameters
+    ----------
+    list_of_words : Union[Sequence[str], PreparedCorpus]
+        The words intended to be scored.
+    ratio_func : str {'ratio', 'QRatio'}
+        The function that will evaluate the similarity.
+    lowercase : bool
+        If True, every plain string is lowercased before the preprocessing.
+
+    Returns
+    -------
+    Tuple[List[str], list, List[bool]]
+        The prepared words, the original words and a flag for every empty word.
+    """
+    if isinstance(list_of_words, PreparedCorpus):
+        originals = list_of_words.words
+        empty = [not w for w in list_of_words.normalized]
+    else:
+        originals = list(list_of_words)
+        empty = [_is_empty(w) for w in originals]
+
+    return _prepare_words(list_of_words, ratio_func, lowercase), originals, empty
+
+
+def _score_cutoff(threshold: float) -> float:
+    """ Translates a threshold in the (0, 1) scale into a rapidfuzz `score_cutoff`.
+
+    Parameters
+    ----------
+    threshold : float
+        The level of similarity required for considering two words equivalent.
+
+    Returns
+    -------
+    float
+        A cutoff in the (0, 100) scale, slightly below the threshold so the 
+        strict `score / 100 > threshold` comparison is the one deciding.
+    """
+    return max(threshold * 100 - _SCORE_MARGIN, 0.0)
+
+
+def _length_bound(lengths1: np.ndarray, lengths2: np.ndarray) -> np.ndarray:
+    """ Computes the highest `fuzz.ratio` reachable by strings of the given lengths.
+
+    Parameters
+    ----------
+    lengths1 : np.ndarray
+        The lengths of the first group of strings.
+    lengths2 : np.ndarray
+        The lengths of the second group of strings, broadcastable against `lengths1`.
+
+    Returns
+    -------
+    np.ndarray
+        The upper bound of the ratio in the (0, 100) scale for every pair.
+    """
+    total = lengths1 + lengths2
+    shortest = np.minimum(lengths1, lengths2)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        bound = np.where(total > 0, 200.0 * shortest / np.maximum(total, 1), 100.0)
+
+    return bound
+
+
+def _unique_words(words: List[str]) -> Tuple[List[str], np.ndarray]:
+    """ Deduplicates a list of words keeping the order of first appearance.
+
+    Parameters
+    ----------
+    words : List[str]
+        The words intended to deduplicate.
+
+    Returns
+    -------
+    Tuple[List[str], np.ndarray]
+        The unique words and, for every original word, the position 
+        of its unique representative.
+    """
+    positions = {}
+    inverse = np.fromiter(
+        (positions.setdefault(w, len(positions)) for w in words),
+        dtype=np.int64,
+        count=len(words)
+    )
+
+    return list(positions), inverse
+
+
+def _unique_score_matrix(
+        words1: List[str], 
+        words2: List[str], 
+        threshold: float
+    ) -> np.ndarray:
+    """ Scores every pair of already prepared and deduplicated words.
+
+    Parameters
+    ----------
+    words1 : List[str]
+        The first group of prepared words.
+    words2 : List[str]
+        The second group of prepared words.
+    threshold : float
+        Pairs that can not go over this value are not scored and reported as 0.
+
+    Returns
+    -------
+    np.ndarray
+        A matrix of shape (len(words1), len(words2)) with the raw scores in the (0, 100) scale.
+    """
+    scores = np.zeros((len(words1), len(words2)), dtype=np.float64)
+    if not words1 or not words2:
+        return scores
+
+    cutoff = _score_cutoff(threshold)
+    lengths1 = np.fromiter(map(len, words1), dtype=np.int64, count=len(words1))
+    lengths2 = np.fromiter(map(len, words2), dtype=np.int64, count=len(words2))
+    candidates = _length_bound(lengths1[:, None], lengths2[None, :]) + _SCORE_MARGIN >= cutoff
+
+    for i, j in zip(*np.nonzero(candidates)):
+        scores[i, j] = fuzz.ratio(words1[i], words2[j], score_cutoff=cutoff)
+
+    return scores
 
 
 def is_similar_word(
-        word1: str, 
-        word2: str, 
+        word1: Union[str, PreparedQuery], 
+        word2: Union[str, PreparedQuery], 
         threshold: float = 0.8,
         ratio_func: str = 'ratio'
     ) -> bool:
@@ -17,9 +529,9 @@ def is_similar_word(
 
     Parameters
     ----------
-    - word1 : `str`
+    - word1 : `str` or `PreparedQuery`
         A word intended to evaluate.
-    - word2 : `str`
+    - word2 : `str` or `PreparedQuery`
         A second word intended to compare to the first.
     - threshold : `float`, optional
         The level of similarity required for considering them equivalent, by default 0.8.
@@ -42,7 +554,9 @@ def is_similar_word(
     True
 
     """
-    if ratio_func == 'ratio':
+    if isinstance(word1, PreparedQuery) or isinstance(word2, PreparedQuery):
+        score = fuzz.ratio(_prepare_word(word1, ratio_func), _prepare_word(word2, ratio_func))
+    elif ratio_func == 'ratio':
         score = fuzz.ratio(word1, word2)
     elif ratio_func == 'QRatio':
         score = fuzz.QRatio(word1, word2)
@@ -51,8 +565,8 @@ def is_similar_word(
 
 
 def is_similar_sentence(
-    sentence1: str, 
-    sentence2: str, 
+    sentence1: Union[str, PreparedQuery], 
+    sentence2: Union[str, PreparedQuery], 
     threshold: float = 0.8, 
     ratio_func: str = 'ratio'
     ) -> bool:
@@ -62,9 +576,9 @@ def is_similar_sentence(
 
     Arguments:
     ---------
-    - sentence1: str
+    - sentence1: str or PreparedQuery
         First given sentence.
-    - sentence2: str
+    - sentence2: str or PreparedQuery
         Second given sentence.
     - threshold: float, optional
         The level of similarity required for considering them equivalent, by default 0.8.
@@ -87,7 +601,12 @@ def is_similar_sentence(
 
     """
     
-    if sentence1 and sentence2:
+    if isinstance(sentence1, PreparedQuery) or isinstance(sentence2, PreparedQuery):
+        if not _is_empty(sentence1) and not _is_empty(sentence2):
+            score = fuzz.ratio(_prepare_word(sentence1, ratio_func), _prepare_word(sentence2, ratio_func))
+
+            return score / 100 > threshold
+    elif sentence1 and sentence2:
         if ratio_func == 'ratio':
             score = fuzz.ratio(sentence1, sentence2)
         elif ratio_func == 'QRatio':
@@ -97,8 +616,8 @@ def is_similar_sentence(
 
 
 def similar_word_in_sentence(
-    word: str, 
-    sentence_list: list, 
+    word: Union[str, PreparedQuery], 
+    sentence_list: Union[list, PreparedCorpus], 
     threshold: float = 0.8, 
     ratio_func: str = 'ratio'
 ) -> bool:
@@ -106,9 +625,9 @@ def similar_word_in_sentence(
 
     Parameters
     ----------
-    word : str
+    word : str or PreparedQuery
         The word intended to find in sentence.
-    sentence_list : list
+    sentence_list : list or PreparedCorpus
         The list of words of a sentences where the words might be.
     threshold : float, optional
         The level of similarity required for considering them equivalent, by default 0.8.
@@ -127,26 +646,32 @@ def similar_word_in_sentence(
     False
 
     """
-    words_in_sentence = [
+    if _is_empty(word):
+        return False
+
+    query = _prepare_word(word, ratio_func, lowercase=True)
+    words, _, empty = _words_and_originals(sentence_list, ratio_func, lowercase=True)
+    cutoff = _score_cutoff(threshold)
+    words_in_sentence = (
         True 
-        for w in sentence_list 
-        if is_similar_sentence(w.lower(), word.lower(), threshold, ratio_func)
-    ]
+        for w, is_empty in zip(words, empty) 
+        if not is_empty and fuzz.ratio(query, w, score_cutoff=cutoff) / 100 > threshold
+    )
     return any(words_in_sentence)
 
 
 def is_sentence_contained_in_longer_sentence(
-        short_sentence: str, 
-        long_sentence: str, 
+        short_sentence: Union[str, PreparedQuery], 
+        long_sentence: Union[str, PreparedQuery], 
         threshold: int = 0.8
     ) -> bool:
     """ Checks if a shorter sentence is within a longer sentence.
 
     Parameters
     ----------
-    short_sentence : str
+    short_sentence : str or PreparedQuery
         The sentence that might be within the other string.
-    long_sentence : str
+    long_sentence : str or PreparedQuery
         The sentence that might contain the short sentence.
     threshold : int, optional
         The level of similarity required for considering them equivalent, by default 0.8.
@@ -165,6 +690,10 @@ def is_sentence_contained_in_longer_sentence(
     >>> is_sentence_contained_in_longer_sentence('the best of you','Is someone getting the best, the best, the best of you?',0.9)
     True
     """
+    if isinstance(short_sentence, PreparedQuery):
+        short_sentence = short_sentence.normalized
+    if isinstance(long_sentence, PreparedQuery):
+        long_sentence = long_sentence.normalized
     
     compare_value = fuzz.token_set_ratio(short_sentence, long_sentence)
     
@@ -172,8 +701,8 @@ def is_sentence_contained_in_longer_sentence(
 
 
 def get_similar_word_in_sentence(
-        word: str, 
-        list_of_words: list, 
+        word: Union[str, PreparedQuery], 
+        list_of_words: Union[list, PreparedCorpus], 
         threshold: float = 0.8, 
         ratio_func: str = 'ratio'
     ) -> Optional[str]:
@@ -181,9 +710,9 @@ def get_similar_word_in_sentence(
 
     Parameters
     ----------
-    word : str
+    word : str or PreparedQuery
         Word intended to be found in the list of words.
-    list_of_words : list
+    list_of_words : list or PreparedCorpus
         List of words of a sentence.
     threshold : float, optional
         The level of similarity required for considering them equivalent, by default 0.8.
@@ -202,20 +731,114 @@ def get_similar_word_in_sentence(
     'Apple'
     
     """
+    if _is_empty(word):
+        return None
 
+    query = _prepare_word(word, ratio_func, lowercase=True)
+    words, originals, empty = _words_and_originals(list_of_words, ratio_func, lowercase=True)
+    cutoff = _score_cutoff(threshold)
     similar_list = [
-        w
-        for w in list_of_words
-        if is_similar_sentence(w.lower(), word.lower(), threshold, ratio_func)
+        originals[i]
+        for i, w in enumerate(words)
+        if not empty[i] and fuzz.ratio(query, w, score_cutoff=cutoff) / 100 > threshold
     ]
     
     if similar_list:
         return similar_list[0]
 
 
+def _expanded_score_matrix(
+        list_of_words: Union[Sequence[str], PreparedCorpus], 
+        other_list_of_words: Union[Sequence[str], PreparedCorpus], 
+        threshold: float, 
+        ratio_func: str,
+        lowercase: bool,
+        backend: str = 'serial',
+        n_jobs: Optional[int] = None,
+        chunksize: Optional[int] = None
+    ) -> np.ndarray:
+    """ Scores two lists of raw words, scoring repeated words only once.
+
+    Parameters
+    ----------
+    list_of_words : Sequence[str] or PreparedCorpus
+        The words placed in the rows of the matrix.
+    other_list_of_words : Sequence[str] or PreparedCorpus
+        The words placed in the columns of the matrix.
+    threshold : float
+        Pairs that can not go over this value are not scored and reported as 0.
+    ratio_func : str {'ratio', 'QRatio'}
+        The function that will evaluate the similarity.
+    lowercase : bool
+        If True, both lists are lowercased before scoring.
+    backend : str {'serial', 'thread', 'process'}, optional
+        Where the scoring runs, by default 'serial'.
+    n_jobs : Optional[int], optional
+        The number of workers. If None, all the available cores are used, by default None.
+    chunksize : Optional[int], optional
+        The number of unique words scored by every call. If None, it is chosen 
+        from the size of the lists, by default None.
+
+    Returns
+    -------
+    np.ndarray
+        A matrix of shape (len(list_of_words), len(other_list_of_words)) with the scores in the (0, 1) scale.
+    """
+    words1, inverse1 = _unique_words(_prepare_words(list_of_words, ratio_func, lowercase))
+    words2, inverse2 = _unique_words(_prepare_words(other_list_of_words, ratio_func, lowercase))
+    scores = _parallel_score_matrix(words1, words2, threshold, backend, n_jobs, chunksize)
+
+    return scores[inverse1][:, inverse2] / 100
+
+
+def _parallel_score_matrix(
+        words1: List[str], 
+        words2: List[str], 
+        threshold: float, 
+        backend: str, 
+        n_jobs: Optional[int], 
+        chunksize: Optional[int]
+    ) -> np.ndarray:
+    """ Scores every pair of prepared and deduplicated words, splitting the longest list in chunks.
+
+    Parameters
+    ----------
+    words1 : List[str]
+        The first group of prepared words.
+    words2 : List[str]
+        The second group of prepared words.
+    threshold : float
+        Pairs that can not go over this value are not scored and reported as 0.
+    backend : str {'serial', 'thread', 'process'}
+        Where the scoring runs.
+    n_jobs : Optional[int]
+        The number of workers. If None, all the available cores are used.
+    chunksize : Optional[int]
+        The number of words of the longest list scored by every call.
+
+    Returns
+    -------
+    np.ndarray
+        The same matrix `_unique_score_matrix` returns, whatever the backend.
+    """
+    n_jobs = n_jobs or os.cpu_count() or 1
+    if _get_executor(backend) is None or not words1 or not words2:
+        return _unique_score_matrix(words1, words2, threshold)
+
+    if len(words1) >= len(words2):
+        bounds = _chunk_bounds(len(words1), n_jobs, chunksize)
+        chunks = [(words1[start:end], words2, threshold) for start, end in bounds]
+        return np.vstack(_map_chunks(_unique_score_matrix, chunks, backend, n_jobs))
+
+    bounds = _chunk_bounds(len(words2), n_jobs, chunksize)
+    chunks = [(words1, words2[start:end], threshold) for start, end in bounds]
+
+    return np.hstack(_map_chunks(_unique_score_matrix, chunks, backend, n_jobs))
+
+
 def any_word_in_sentence(
-        list_of_words: List[str], 
-        list_of_words_in_sentence: List[str], 
+        list_of_words: Union[List[str], PreparedCorpus], 
+        list_of_words_in_sentence: Union[List[str], PreparedCorpus], 
         threshold: float = 0.8, 
         ratio_func: str = 'ratio'
     ) -> bool:
@@ -223,9 +846,9 @@ def any_word_in_sentence(
 
     Parameters
     ----------
-    list_of_words : List[str]
+    list_of_words : List[str] or PreparedCorpus
         List containing the words in string format, that you hope to find in the sentence.
-    list_of_words_in_sentence : List[str]
+    list_of_words_in_sentence : List[str] or PreparedCorpus
         A list of strings generated from a sentence. For best results, 
         use a tokenizer to generate the list of words.
     threshold : float (0,1), optional
@@ -252,14 +875,1394 @@ def any_word_in_sentence(
     >>> any_word_in_sentence(['tokenizer'], ['Use', 'a', 'tokenizer', 'instead'], 0.99, 'ratio')
     True
     """
-    result = False
-    for word in list_of_words:  
-        for other_word in list_of_words_in_sentence:
-            result = is_similar_word(word, other_word, threshold=threshold, ratio_func=ratio_func)
-            if result:
-                break
+    keywords = _prepare_words(list_of_words, ratio_func)
+    words, _ = _unique_words(_prepare_words(list_of_words_in_sentence, ratio_func))
+    if not words:
+        return False
 
-        if result == True:
-            break
+    cutoff = _score_cutoff(threshold)
+    lengths = np.fromiter(map(len, words), dtype=np.int64, count=len(words))
+
+    for keyword in keywords:
+        candidates = _length_bound(np.int64(len(keyword)), lengths) + _SCORE_MARGIN >= cutoff
+        for j in np.flatnonzero(candidates):
+            if fuzz.ratio(keyword, words[j], score_cutoff=cutoff) / 100 > threshold:
+                return True
     
-    return result
\ No newline at end of file
+    return False
+
+
+def score_matrix(
+        list_of_words: Union[Sequence[str], PreparedCorpus], 
+        other_list_of_words: Union[Sequence[str], PreparedCorpus], 
+        threshold: float = 0.0, 
+        ratio_func: str = 'ratio',
+        lowercase: bool = False,
+        backend: str = 'serial',
+        n_jobs: Optional[int] = None,
+        chunksize: Optional[int] = None
+    ) -> np.ndarray:
+    """ Scores every word of a list against every word of another list in one call.
+
+    Parameters
+    ----------
+    list_of_words : Sequence[str] or PreparedCorpus
+        The words placed in the rows of the matrix, usually the keywords.
+    other_list_of_words : Sequence[str] or PreparedCorpus
+        The words placed in the columns of the matrix, usually the tokens of a sentence.
+    threshold : float (0,1), optional
+        Scores that are not over this value are reported as 0. Pairs that can not 
+        reach it are never scored, by default 0.0.
+    ratio_func : str {'ratio', 'QRatio'}, optional
+        The function that will evaluate the similarity. Can be `ratio` or `QRatio`, by default 'ratio'.
+    lowercase : bool, optional
+        If True, both lists are lowercased before scoring, as `similar_word_in_sentence` 
+        does, by default False.
+    backend : str {'serial', 'thread', 'process'}, optional
+        Where the scoring runs: in the calling thread, in a pool of threads or in a pool 
+        of processes. The result is the same whatever the backend, by default 'serial'.
+    n_jobs : Optional[int], optional
+        The number of workers. If None, all the available cores are used, by default None.
+    chunksize : Optional[int], optional
+        The number of unique words scored by every worker call. If None, it is chosen 
+        from the size of the lists, by default None.
+
+    Returns
+    -------
+    np.ndarray
+        A float matrix of shape (len(list_of_words), len(other_list_of_words)) with the 
+        similarity of every pair in the (0, 1) scale.
+
+    Examples
+    -------
+    >>> from nlptools.comparison import score_matrix
+    >>> score_matrix(['Apple', 'Pear'], ['Apple', 'Aple', 'Banana'], 0.5)
+    array([[1.        , 0.88888889, 0.        ],
+           [0.        , 0.        , 0.        ]])
+    """
+    scores = _expanded_score_matrix(
+        list_of_words, other_list_of_words, threshold, ratio_func, lowercase, backend, n_jobs, chunksize
+    )
+    scores[~(scores > threshold)] = 0.0
+
+    return scores
+
+
+def similar_pairs(
+        list_of_words: Union[Sequence[str], PreparedCorpus], 
+        other_list_of_words: Union[Sequence[str], PreparedCorpus], 
+        threshold: float = 0.8, 
+        ratio_func: str = 'ratio',
+        lowercase: bool = False,
+        backend: str = 'serial',
+        n_jobs: Optional[int] = None,
+        chunksize: Optional[int] = None
+    ) -> List[Tuple[int, int, float]]:
+    """ Finds every pair of words, one of each list, that are similar acording to a threshold.
+
+    Parameters
+    ----------
+    list_of_words : Sequence[str] or PreparedCorpus
+        The first list of words, usually the keywords.
+    other_list_of_words : Sequence[str] or PreparedCorpus
+        The second list of words, usually the tokens of a sentence.
+    threshold : float (0,1), optional
+        The level of similarity required for considering them equivalent, by default 0.8.
+    ratio_func : str {'ratio', 'QRatio'}, optional
+        The function that will evaluate the similarity. Can be `ratio` or `QRatio`, by default 'ratio'.
+    lowercase : bool, optional
+        If True, both lists are lowercased before scoring, by default False.
+    backend : str {'serial', 'thread', 'process'}, optional
+        Where the scoring runs: in the calling thread, in a pool of threads or in a pool 
+        of processes. The result is the same whatever the backend, by default 'serial'.
+    n_jobs : Optional[int], optional
+        The number of workers. If None, all the available cores are used, by default None.
+    chunksize : Optional[int], optional
+        The number of unique words scored by every worker call. If None, it is chosen 
+        from the size of the lists, by default None.
+
+    Returns
+    -------
+    List[Tuple[int, int, float]]
+        Tuples of `(index in list_of_words, index in other_list_of_words, score)` for 
+        every pair that `is_similar_word` would consider similar, sorted by position.
+
+    Examples
+    -------
+    >>> from nlptools.comparison import similar_pairs
+    >>> similar_pairs(['Apple', 'Pear'], ['Apple', 'Aple', 'Banana'], 0.8)
+    [(0, 0, 1.0), (0, 1, 0.8888888888888888)]
+    """
+    scores = _expanded_score_matrix(
+        list_of_words, other_list_of_words, threshold, ratio_func, lowercase, backend, n_jobs, chunksize
+    )
+    pairs = [
+        (int(i), int(j), float(scores[i, j]))
+        for i, j in zip(*np.nonzero(scores > threshold))
+    ]
+
+    return pairs
+
+
+def _any_word_in_sentences_chunk(
+        list_of_words: Union[List[str], PreparedCorpus], 
+        sentences: List[List[str]], 
+        threshold: float, 
+        ratio_func: str
+    ) -> List[bool]:
+    """ Applies `any_word_in_sentence` to a chunk of sentences.
+    """
+    return [
+        any_word_in_sentence(list_of_words, sentence, threshold, ratio_func)
+        for sentence in sentences
+    ]
+
+
+def any_word_in_sentences(
+        list_of_words: Union[List[str], PreparedCorpus], 
+        list_of_sentences: Sequence[Union[List[str], PreparedCorpus]], 
+        threshold: float = 0.8, 
+        ratio_func: str = 'ratio',
+        backend: str = 'serial',
+        n_jobs: Optional[int] = None,
+        chunksize: Optional[int] = None
+    ) -> List[bool]:
+    """ Analizes, for every sentence of a batch, if any word in your list is contained in it.
+
+    Parameters
+    ----------
+    list_of_words : List[str] or PreparedCorpus
+        List containing the words in string format, that you hope to find in the sentences.
+    list_of_sentences : Sequence[List[str] or PreparedCorpus]
+        The sentences, or documents, each one as the list of its words.
+    threshold : float (0,1), optional
+        The level of similarity required for considering them equivalent, by default 0.8.
+    ratio_func : str {'ratio', 'QRatio'}, optional
+        The function that will evaluate the similarity. Can be `ratio` or `QRatio`, by default 'ratio'.
+    backend : str {'serial', 'thread', 'process'}, optional
+        Where the scoring runs: in the calling thread, in a pool of threads or in a pool 
+        of processes. The result is the same whatever the backend, by default 'serial'.
+    n_jobs : Optional[int], optional
+        The number of workers. If None, all the available cores are used, by default None.
+    chunksize : Optional[int], optional
+        The number of sentences evaluated by every worker call. If None, it is chosen 
+        from the number of sentences, by default None.
+
+    Returns
+    -------
+    List[bool]
+        What `any_word_in_sentence` returns for every sentence, in the same order.
+
+    Examples
+    -------
+    >>> from nlptools.comparison import any_word_in_sentences
+    >>> any_word_in_sentences(['vieja'], [['tu', 'vieja'], ['hola'], ['la', 'viejas']], 0.8, backend='thread', n_jobs=2)
+    [True, False, True]
+    """
+    list_of_sentences = list(list_of_sentences)
+    n_jobs = n_jobs or os.cpu_count() or 1
+    if _get_executor(backend) is None:
+        n_jobs = 1
+
+    chunks = [
+        (list_of_words, list_of_sentences[start:end], threshold, ratio_func)
+        for start, end in _chunk_bounds(len(list_of_sentences), n_jobs, chunksize)
+    ]
+    results = _map_chunks(_any_word_in_sentences_chunk, chunks, backend, n_jobs)
+
+    return [result for chunk in results for result in chunk]
+
+
+def _top_k(
+        query: str, 
+        words: List[str], 
+        candidates: Sequence[int], 
+        limit: int, 
+        threshold: float
+    ) -> List[Tuple[float, int]]:
+    """ Keeps the best scored candidates in a heap, raising the cutoff as better ones appear.
+
+    Parameters
+    ----------
+    query : str
+        The prepared word.
+    words : List[str]
+        The prepared words the candidates point to.
+    candidates : Sequence[int]
+        The positions of the words worth scoring, in increasing order.
+    limit : int
+        The maximum number of words to keep.
+    threshold : float
+        The level of similarity required for considering them equivalent.
+
+    Returns
+    -------
+    List[Tuple[float, int]]
+        Tuples of `(score, position)` sorted from the best to the worst score, with 
+        ties sorted by position. Scores are in the (0, 1) scale.
+    """
+    if limit < 1:
+        return []
+
+    heap = []
+    cutoff = _score_cutoff(threshold)
+    bounds = _length_bound(
+        np.int64(len(query)), 
+        np.fromiter((len(words[j]) for j in candidates), dtype=np.int64, count=len(candidates))
+    )
+    for j, bound in zip(candidates, bounds):
+        if bound + _SCORE_MARGIN < cutoff:
+            continue
+        score = fuzz.ratio(query, words[j], score_cutoff=cutoff) / 100
+        if not score > threshold:
+            continue
+        if len(heap) < limit:
+            heapq.heappush(heap, (score, -j))
+        elif score > heap[0][0]:
+            heapq.heapreplace(heap, (score, -j))
+        else:
+            continue
+        if len(heap) == limit:
+            cutoff = max(cutoff, heap[0][0] * 100 - _SCORE_MARGIN)
+            if heap[0][0] >= 1:
+                break
+
+    return [
+        (score, -negative_position)
+        for score, negative_position in sorted(heap, key=lambda x: (-x[0], -x[1]))
+    ]
+
+
+def extract_best_words(
+        word: Union[str, PreparedQuery], 
+        list_of_words: Union[list, PreparedCorpus], 
+        limit: int = 5, 
+        threshold: float = 0.8, 
+        ratio_func: str = 'ratio'
+    ) -> List[Tuple[str, float, int]]:
+    """ Returns the words of the list that are most similar to the word provided.
+
+    Parameters
+    ----------
+    word : str or PreparedQuery
+        Word intended to be found in the list of words.
+    list_of_words : list or PreparedCorpus
+        List of words of a sentence, or any list of candidates.
+    limit : int, optional
+        The maximum number of words to return, by default 5.
+    threshold : float, optional
+        The level of similarity required for considering them equivalent, by default 0.8.
+    ratio_func : str {'ratio', 'QRatio'}, optional
+        The function that will evaluate the similarity. Can be `ratio` or `QRatio`, by default 'ratio'.
+
+    Returns
+    -------
+    List[Tuple[str, float, int]]
+        Tuples of `(word, score, index)` sorted from the most to the least similar word. 
+        Words are compared as `get_similar_word_in_sentence` does, in lowercase.
+
+    Examples
+    -------
+    >>> from nlptools.comparison import extract_best_words
+    >>> extract_best_words('Apple', ['Aple', 'The', 'apple', 'Apples'], limit=2)
+    [('apple', 1.0, 2), ('Apples', 0.9090909090909091, 3)]
+    """
+    if _is_empty(word):
+        return []
+
+    query = _prepare_word(word, ratio_func, lowercase=True)
+    words, originals, empty = _words_and_originals(list_of_words, ratio_func, lowercase=True)
+    candidates = [i for i, is_empty in enumerate(empty) if not is_empty]
+    result = [
+        (originals[i], score, i)
+        for score, i in _top_k(query, words, candidates, limit, threshold)
+    ]
+
+    return result
+
+
+def get_best_similar_word(
+        word: Union[str, PreparedQuery], 
+        list_of_words: Union[list, PreparedCorpus], 
+        threshold: float = 0.8, 
+        ratio_func: str = 'ratio'
+    ) -> Optional[str]:
+    """ Returns the word of the list that is most similar to the word provided. Unlike 
+        `get_similar_word_in_sentence`, it returns the best match and not the first one.
+
+    Parameters
+    ----------
+    word : str or PreparedQuery
+        Word intended to be found in the list of words.
+    list_of_words : list or PreparedCorpus
+        List of words of a sentence, or any list of candidates.
+    threshold : float, optional
+        The level of similarity required for considering them equivalent, by default 0.8.
+    ratio_func : str {'ratio', 'QRatio'}, optional
+        The function that will evaluate the similarity. Can be `ratio` or `QRatio`, by default 'ratio'.
+
+    Returns
+    -------
+    Optional[str]
+        The most similar word, or None if there are not similar words. If two words 
+        are equally similar, the first one is returned.
+
+    Examples
+    -------
+    >>> from nlptools.comparison import get_best_similar_word
+    >>> get_best_similar_word('Apple', ['Aple', 'The', 'apple'])
+    'apple'
+    """
+    best = extract_best_words(word, list_of_words, 1, threshold, ratio_func)
+    if best:
+        return best[0][0]
+
+
+def _ngrams(word: str, ngram_size: int) -> List[Tuple[str, int]]:
+    """ Splits a word into padded n-grams, numbering repeated n-grams so they can be counted as a multiset.
+
+    Parameters
+    ----------
+    word : str
+        The word intended to split.
+    ngram_size : int
+        The length of every n-gram.
+
+    Returns
+    -------
+    List[Tuple[str, int]]
+        Tuples of `(n-gram, occurrence)`, where occurrence counts how many 
+        times the same n-gram appeared before in the word.
+    """
+    padding = '\x00' * (ngram_size - 1)
+    padded = f'{padding}{word}{padding}'
+    seen = {}
+    grams = []
+    for i in range(len(word) + ngram_size - 1):
+        gram = padded[i:i + ngram_size]
+        occurrence = seen.get(gram, 0)
+        seen[gram] = occurrence + 1
+        grams.append((gram, occurrence))
+
+    return grams
+
+
+class FuzzyIndex:
+    """
+        A build-once lookup structure to find similar words in a large vocabulary.
+        Candidates are retrieved from an inverted index of character n-grams and 
+        only that shortlist is scored, returning the same words that a linear 
+        scan with `get_similar_word_in_sentence` would.
+
+    Attributes
+    --------
+    - FuzzyIndex.words
+        The list of words provided, in the original order.
+    - FuzzyIndex.ratio_func
+        The function used to evaluate the similarity, `ratio` or `QRatio`.
+    - FuzzyIndex.lowercase
+        Whether the words and the queries are lowercased before scoring.
+    - FuzzyIndex.ngram_size
+        The length of the n-grams stored in the index.
+
+    Methods
+    -------
+    - FuzzyIndex.search
+    - FuzzyIndex.extract_best
+    - FuzzyIndex.get_similar_word
+    - FuzzyIndex.similar_word
+    - FuzzyIndex.save
+    - FuzzyIndex.load
+
+    Examples
+    -------
+    >>> from nlptools.comparison import FuzzyIndex
+    >>> index = FuzzyIndex(['BANCO DE SAN JUAN S A', 'CONFECOM SRL', 'CONFECOM SA'])
+    >>> index.search('Confecom S.R.L.', 0.8)
+    [('CONFECOM SRL', 0.8888888888888888, 1)]
+    >>> index.get_similar_word('confecom sa', 0.9)
+    'CONFECOM SA'
+    """
+    def __init__(
+            self, 
+            list_of_words: Sequence[str], 
+            ratio_func: str = 'ratio', 
+            lowercase: bool = True,
+            ngram_size: int = 2
+        ):
+        if ngram_size < 1:
+            raise ValueError(f'The ngram_size must be a positive integer. You provided {ngram_size}.')
+        self.words = list(list_of_words)
+        self.ratio_func = ratio_func
+        self.lowercase = lowercase
+        self.ngram_size = ngram_size
+        self._build()
+
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+
+    def _build(self):
+        """ Deduplicates the prepared words and creates the n-gram postings and the length buckets.
+        """
+        indices = [i for i, w in enumerate(self.words) if w]
+        prepared = _prepare_words([self.words[i] for i in indices], self.ratio_func, self.lowercase)
+        self._keys, inverse = _unique_words(prepared)
+        self._lengths = np.fromiter(map(len, self._keys), dtype=np.int64, count=len(self._keys))
+
+        order = np.argsort(inverse, kind='stable')
+        self._members = np.asarray(indices, dtype=np.int64)[order]
+        self._member_offsets = np.concatenate([[0], np.cumsum(np.bincount(inverse, minlength=len(self._keys)))])
+
+        self._by_length = np.argsort(self._lengths, kind='stable')
+        self._length_offsets = np.concatenate(
+            [[0], np.cumsum(np.bincount(self._lengths, minlength=int(self._lengths.max(initial=0)) + 2))]
+        )
+
+        postings = {}
+        for key_id, key in enumerate(self._keys):
+            for gram in _ngrams(key, self.ngram_size):
+                postings.setdefault(gram, []).append(key_id)
+        self._postings = {
+            gram: np.asarray(ids, dtype=np.int32)
+            for gram, ids in postings.items()
+        }
+
+
+    def _candidates(self, query: str, threshold: float) -> np.ndarray:
+        """ Retrieves the ids of the unique words that might be similar to the prepared query.
+
+        Parameters
+        ----------
+        query : str
+            The query, already lowercased and preprocessed.
+        threshold : float
+            The level of similarity required for considering them equivalent.
+
+        Returns
+        -------
+        np.ndarray
+            The ids of the unique words that pass the length and n-gram count filters.
+        """
+        max_length = len(self._length_offsets) - 2
+        lengths = np.arange(max_length + 1)
+        cutoff = _score_cutoff(threshold)
+        allowed = _length_bound(np.int64(len(query)), lengths) + _SCORE_MARGIN >= cutoff
+        max_distance = np.floor((1 - threshold) * (len(query) + lengths) + 1e-9)
+        required = (len(query) + lengths) / 2 + self.ngram_size - 1 - (2 * self.ngram_size - 1) * max_distance / 2
+
+        unfiltered = [
+            self._by_length[self._length_offsets[length]:self._length_offsets[length + 1]]
+            for length in np.flatnonzero(allowed & (required <= 0))
+        ]
+
+        found = [
+            self._postings[gram] 
+            for gram in _ngrams(query, self.ngram_size) 
+            if gram in self._postings
+        ]
+        if found:
+            counts = np.bincount(np.concatenate(found), minlength=len(self._keys))
+            ids = np.flatnonzero(counts)
+            counts = counts[ids]
+            key_lengths = self._lengths[ids]
+            keep = allowed[key_lengths] & (required[key_lengths] > 0) & (counts >= required[key_lengths])
+            unfiltered.append(ids[keep])
+
+        if not unfiltered:
+            return np.zeros(0, dtype=np.int64)
+
+        return np.unique(np.concatenate(unfiltered))
+
+
+    def search(
+            self, 
+            word: Union[str, PreparedQuery], 
+            threshold: float = 0.8
+        ) -> List[Tuple[str, float, int]]:
+        """ Finds every word of the index that is similar to the word provided.
+
+        Parameters
+        ----------
+        word : str or PreparedQuery
+            The word intended to be found in the index. A PreparedQuery keeps its own normalization.
+        threshold : float, optional
+            The level of similarity required for considering them equivalent, by default 0.8.
+
+        Returns
+        -------
+        List[Tuple[str, float, int]]
+            Tuples of `(word, score, index)` for every similar word, sorted by their 
+            position in the original list.
+        """
+        if _is_empty(word):
+            return []
+
+        query = _prepare_word(word, self.ratio_func, self.lowercase)
+        cutoff = _score_cutoff(threshold)
+        matches = []
+        for key_id in self._candidates(query, threshold):
+            score = fuzz.ratio(query, self._keys[key_id], score_cutoff=cutoff) / 100
+            if score > threshold:
+                members = self._members[self._member_offsets[key_id]:self._member_offsets[key_id + 1]]
+                matches.extend((int(i), score) for i in members)
+        
+        result = [
+            (self.words[i], score, i)
+            for i, score in sorted(matches)
+        ]
+
+        return result
+
+
+    def extract_best(
+            self, 
+            word: Union[str, PreparedQuery], 
+            limit: int = 5,
+            threshold: float = 0.8
+        ) -> List[Tuple[str, float, int]]:
+        """ Returns the words of the index that are most similar to the word provided.
+
+        Parameters
+        ----------
+        word : str or PreparedQuery
+            The word intended to be found in the index.
+        limit : int, optional
+            The maximum number of words to return, by default 5.
+        threshold : float, optional
+            The level of similarity required for considering them equivalent, by default 0.8.
+
+        Returns
+        -------
+        List[Tuple[str, float, int]]
+            Tuples of `(word, score, index)` sorted from the most to the least similar 
+            word, the same `extract_best_words` would return over the original list.
+        """
+        if _is_empty(word):
+            return []
+
+        query = _prepare_word(word, self.ratio_func, self.lowercase)
+        candidates = self._candidates(query, threshold)
+        first_members = self._members[self._member_offsets[candidates]]
+        order = np.argsort(first_members, kind='stable')
+        
+        result = []
+        for score, position in _top_k(query, self._keys, candidates[order], limit, threshold):
+            members = self._members[self._member_offsets[position]:self._member_offsets[position + 1]]
+            result.extend((self.words[i], score, int(i)) for i in members)
+        
+        return sorted(result, key=lambda x: (-x[1], x[2]))[:limit]
+
+
+    def get_similar_word(
+            self, 
+            word: Union[str, PreparedQuery], 
+            threshold: float = 0.8
+        ) -> Optional[str]:
+        """ Returns the first word of the index that is similar to the word provided.
+
+        Parameters
+        ----------
+        word : str or PreparedQuery
+            The word intended to be found in the index.
+        threshold : float, optional
+            The level of similarity required for considering them equivalent, by default 0.8.
+
+        Returns
+        -------
+        Optional[str]
+            The same word `get_similar_word_in_sentence` would return over the original list, 
+            or None if there are no similar words.
+        """
+        matches = self.search(word, threshold)
+        if matches:
+            return matches[0][0]
+
+
+    def similar_word(
+            self, 
+            word: Union[str, PreparedQuery], 
+            threshold: float = 0.8
+        ) -> bool:
+        """ Searches if a certain word is similar to any word in the index.
+
+        Parameters
+        ----------
+        word : str or PreparedQuery
+            The word intended to be found in the index.
+        threshold : float, optional
+            The level of similarity required for considering them equivalent, by default 0.8.
+
+        Returns
+        -------
+        bool
+            True if there is a similar word in the index.
+        """
+        return bool(self.search(word, threshold))
+
+
+    def save(self, filepath: str):
+        """ Stores the index on disk, so it can be loaded without building it again.
+
+        Parameters
+        ----------
+        filepath : str
+            The path of the file where the index will be written.
+        """
+        with open(filepath, 'wb') as file:
+            pickle.dump(self, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+    @classmethod
+    def load(cls, filepath: str) -> 'FuzzyIndex':
+        """ Loads an index previously stored with `FuzzyIndex.save`.
+
+        Parameters
+        ----------
+        filepath : str
+            The path of the file where the index was written.
+
+        Returns
+        -------
+        FuzzyIndex
+            The index, ready to be queried.
+
+        Raises
+        ------
+        TypeError
+            If the file does not contain a FuzzyIndex.
+        """
+        with open(filepath, 'rb') as file:
+            index = pickle.load(file)
+
+        if not isinstance(index, cls):
+            raise TypeError(f'The file {filepath} does not contain a {cls.__name__}. It contains a {type(index)}.')
+
+        return index
+
+
+def _build_automaton(patterns: Sequence[Sequence]) -> Tuple[List[dict], List[int], List[List[int]]]:
+    """ Builds an Aho-Corasick automaton that finds every pattern in a single pass over a sequence.
+
+    Parameters
+    ----------
+    patterns : Sequence[Sequence]
+        The non empty patterns intended to find, as sequences of hashable symbols, 
+        such as characters or tokens.
+
+    Returns
+    -------
+    Tuple[List[dict], List[int], List[List[int]]]
+        The transitions of every state, the failure link of every state and the 
+        position of the patterns that end in every state.
+    """
+    goto = [{}]
+    outputs = [[]]
+    for pattern_id, pattern in enumerate(patterns):
+        state = 0
+        for symbol in pattern:
+            if symbol not in goto[state]:
+                goto[state][symbol] = len(goto)
+                goto.append({})
+                outputs.append([])
+            state = goto[state][symbol]
+        outputs[state].append(pattern_id)
+
+    fail = [0] * len(goto)
+    queue = list(goto[0].values())
+    for state in queue:
+        for symbol, child in goto[state].items():
+            queue.append(child)
+            fallback = fail[state]
+            while fallback and symbol not in goto[fallback]:
+                fallback = fail[fallback]
+            if state:
+                fail[child] = goto[fallback].get(symbol, 0)
+            outputs[child] = outputs[child] + outputs[fail[child]]
+
+    return goto, fail, outputs
+
+
+class KeywordScanner:
+    """
+        A set of keywords compiled once to screen many documents. Exact occurrences are 
+        found in a single pass over the tokens with an Aho-Corasick automaton, and only the tokens whose 
+        characters and length allow them to reach the threshold are scored with `fuzz.ratio`. 
+        The scanner can be pickled, so it can be shared with other processes.
+
+    Attributes
+    --------
+    - KeywordScanner.keywords
+        The list of keywords provided, in the original order.
+    - KeywordScanner.threshold
+        The level of similarity required for considering a token equivalent to a keyword.
+    - KeywordScanner.ratio_func
+        The function used to evaluate the similarity, `ratio` or `QRatio`.
+    - KeywordScanner.lowercase
+        Whether the keywords and the documents are lowercased before scoring.
+
+    Methods
+    -------
+    - KeywordScanner.contains
+    - KeywordScanner.contains_many
+    - KeywordScanner.find
+
+    Examples
+    -------
+    >>> from nlptools.comparison import KeywordScanner
+    >>> scanner = KeywordScanner(['gerente', 'capital social'], 0.8, lowercase=True)
+    >>> scanner.contains('El Gerentte de la sociedad')
+    True
+    >>> scanner.find('El capital social y la Gerente')
+    [(3, 17, 'capital social', 1.0), (23, 30, 'gerente', 1.0)]
+    """
+    def __init__(
+            self, 
+            keywords: Sequence[str], 
+            threshold: float = 0.8, 
+            ratio_func: str = 'ratio', 
+            lowercase: bool = False
+        ):
+        self.keywords = list(keywords)
+        self.threshold = threshold
+        self.ratio_func = ratio_func
+        self.lowercase = lowercase
+        prepared = _prepare_words(self.keywords, ratio_func, lowercase)
+        positions = {}
+        for i, keyword in enumerate(prepared):
+            positions.setdefault(keyword, i)
+        self._empty_keyword = positions.get('')
+        self._keys = [k for k in positions if k]
+        self._key_positions = [positions[k] for k in self._keys]
+        patterns = {}
+        for i, keyword in enumerate(self.keywords):
+            pattern = tuple(_prepare_words(keyword.split(), ratio_func, lowercase))
+            if pattern and all(pattern):
+                patterns.setdefault(pattern, i)
+        self._patterns = list(patterns)
+        self._pattern_positions = list(patterns.values())
+        self._goto, self._fail, self._outputs = _build_automaton(self._patterns)
+
+        self._alphabet = np.array(sorted({ord(c) for k in self._keys for c in k}), dtype=np.uint32)
+        self._key_lengths = np.fromiter(map(len, self._keys), dtype=np.int64, count=len(self._keys))
+        self._key_counts = self._char_counts(self._keys)
+
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+
+    def __repr__(self) -> str:
+        return f'KeywordScanner({len(self.keywords)} keywords)'
+
+
+    def _char_counts(self, words: List[str]) -> np.ndarray:
+        """ Counts how many times every character of the keywords appears in every word.
+
+        Parameters
+        ----------
+        words : List[str]
+            The prepared words.
+
+        Returns
+        -------
+        np.ndarray
+            A matrix of shape (len(words), number of distinct characters in the keywords).
+        """
+        size = len(self._alphabet)
+        lengths = np.fromiter(map(len, words), dtype=np.int64, count=len(words))
+        codes = np.frombuffer(''.join(words).encode('utf-32-le'), dtype=np.uint32)
+        owners = np.repeat(np.arange(len(words)), lengths)
+        columns = np.minimum(np.searchsorted(self._alphabet, codes), max(size - 1, 0))
+        known = self._alphabet[columns] == codes if size else np.zeros(len(codes), dtype=bool)
+        counts = np.bincount(owners[known] * size + columns[known], minlength=len(words) * size)
+
+        return counts.reshape(len(words), size)
+
+
+    def _candidates(self, tokens: List[str]) -> List[Tuple[int, int]]:
+        """ Finds the pairs of token and keyword that might reach the threshold.
+
+        As `fuzz.ratio` is 100 * (1 - indel distance / total length), and the indel distance 
+        is never lower than the difference between the character counts of both strings, 
+        the characters they share bound the score without aligning them.
+
+        Parameters
+        ----------
+        tokens : List[str]
+            The unique, non empty, prepared tokens of a document.
+
+        Returns
+        -------
+        List[Tuple[int, int]]
+            Pairs of `(token, keyword)` positions, sorted by token.
+        """
+        if not tokens or not self._keys:
+            return []
+
+        cutoff = _score_cutoff(self.threshold)
+        counts = self._char_counts(tokens)
+        lengths = np.fromiter(map(len, tokens), dtype=np.int64, count=len(tokens))
+        allowed = _length_bound(lengths[:, None], self._key_lengths[None, :]) + _SCORE_MARGIN >= cutoff
+        token_ids = []
+        key_ids = []
+        for key_id in np.flatnonzero(allowed.any(axis=0)):
+            rows = np.flatnonzero(allowed[:, key_id])
+            shared = np.minimum(counts[rows], self._key_counts[key_id]).sum(axis=1)
+            bound = 200.0 * shared / (lengths[rows] + self._key_lengths[key_id])
+            rows = rows[bound + _SCORE_MARGIN >= cutoff]
+            token_ids.append(rows)
+            key_ids.append(np.full(len(rows), key_id))
+        if not token_ids:
+            return []
+
+        token_ids = np.concatenate(token_ids)
+        key_ids = np.concatenate(key_ids)
+        order = np.lexsort((key_ids, token_ids))
+
+        return list(zip(token_ids[order].tolist(), key_ids[order].tolist()))
+
+
+    def _prepare(self, document: Union[str, Sequence[str], PreparedCorpus]) -> List[str]:
+        """ Prepares the tokens of a document as the keywords were prepared.
+
+        Parameters
+        ----------
+        document : str, Sequence[str] or PreparedCorpus
+            A text, split by whitespace, or the list of its tokens.
+
+        Returns
+        -------
+        List[str]
+            The prepared tokens.
+        """
+        tokens = document.split() if isinstance(document, str) else document
+
+        return _prepare_words(tokens, self.ratio_func, self.lowercase)
+
+
+    def _exact_hits(self, prepared: List[str], first_only: bool = False) -> List[Tuple[int, int, int]]:
+        """ Finds the exact occurrences of the keywords, as sequences of whole tokens.
+
+        Parameters
+        ----------
+        prepared : List[str]
+            The prepared tokens.
+        first_only : bool, optional
+            If True, the scan stops at the first occurrence, by default False.
+
+        Returns
+        -------
+        List[Tuple[int, int, int]]
+            The first token, the token after the last one and the position of the keyword.
+        """
+        if not 1.0 > self.threshold:
+            return []
+
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        hits = []
+        if self._empty_keyword is not None:
+            hits.extend((i, i + 1, self._empty_keyword) for i, token in enumerate(prepared) if not token)
+
+        state = 0
+        for end, token in enumerate(prepared, 1):
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            if outputs[state]:
+                hits.extend(
+                    (end - len(self._patterns[pattern_id]), end, self._pattern_positions[pattern_id])
+                    for pattern_id in outputs[state]
+                )
+            if hits and first_only:
+                break
+
+        return sorted(hits)
+
+
+    def contains(self, document: Union[str, Sequence[str], PreparedCorpus]) -> bool:
+        """ Analizes if any keyword is contained in a document.
+
+        Parameters
+        ----------
+        document : str, Sequence[str] or PreparedCorpus
+            A text, that is split by whitespace, or the list of its tokens.
+
+        Returns
+        -------
+        bool
+            The same `any_word_in_sentence` returns for the keywords and the tokens. Keywords 
+            with several words are also found when they appear exactly in consecutive tokens.
+        """
+        prepared = self._prepare(document)
+        if self._exact_hits(prepared, first_only=True):
+            return True
+
+        tokens = [token for token in dict.fromkeys(prepared) if token]
+        cutoff = _score_cutoff(self.threshold)
+        for token_id, key_id in self._candidates(tokens):
+            if fuzz.ratio(tokens[token_id], self._keys[key_id], score_cutoff=cutoff) / 100 > self.threshold:
+                return True
+
+        return False
+
+
+    def contains_many(
+            self, 
+            documents: Sequence[Union[str, Sequence[str], PreparedCorpus]],
+            backend: str = 'serial',
+            n_jobs: Optional[int] = None,
+            chunksize: Optional[int] = None
+        ) -> List[bool]:
+        """ Analizes, for every document of a batch, if any keyword is contained in it.
+
+        Parameters
+        ----------
+        documents : Sequence[str, Sequence[str] or PreparedCorpus]
+            The texts, or the lists of their tokens.
+        backend : str {'serial', 'thread', 'process'}, optional
+            Where the scanning runs: in the calling thread, in a pool of threads or in a pool 
+            of processes. The result is the same whatever the backend, by default 'serial'.
+        n_jobs : Optional[int], optional
+            The number of workers. If None, all the available cores are used, by default None.
+        chunksize : Optional[int], optional
+            The number of documents scanned by every worker call. If None, it is chosen 
+            from the number of documents, by default None.
+
+        Returns
+        -------
+        List[bool]
+            What `KeywordScanner.contains` returns for every document, in the same order.
+        """
+        documents = list(documents)
+        n_jobs = n_jobs or os.cpu_count() or 1
+        if _get_executor(backend) is None:
+            n_jobs = 1
+
+        chunks = [
+            (self, documents[start:end])
+            for start, end in _chunk_bounds(len(documents), n_jobs, chunksize)
+        ]
+        results = _map_chunks(_contains_chunk, chunks, backend, n_jobs)
+
+        return [result for chunk in results for result in chunk]
+
+
+    def find(self, text: str) -> List[Tuple[int, int, str, float]]:
+        """ Finds every occurrence of the keywords in a text, exact or similar.
+
+        Parameters
+        ----------
+        text : str
+            The text intended to scan. It is split by whitespace.
+
+        Returns
+        -------
+        List[Tuple[int, int, str, float]]
+            Tuples of `(start, end, keyword, score)` with the characters of the text where the 
+            keyword was found, sorted by position. Every exact occurrence is reported with a 
+            score of 1.0, and every other token similar to a keyword is reported once, with 
+            its most similar keyword.
+        """
+        tokens, offsets = get_tokenizer().tokenize_with_offsets(text)
+        spans = offsets.tolist()
+        prepared = self._prepare(tokens)
+
+        hits = {}
+        exact_tokens = set()
+        for first, last, keyword in self._exact_hits(prepared):
+            hits[(spans[first][0], spans[last - 1][1], keyword)] = 1.0
+            if last - first == 1:
+                exact_tokens.add(first)
+
+        tokens = [token for token in dict.fromkeys(prepared) if token]
+        cutoff = _score_cutoff(self.threshold)
+        best = {}
+        for token_id, key_id in self._candidates(tokens):
+            score = fuzz.ratio(tokens[token_id], self._keys[key_id], score_cutoff=cutoff) / 100
+            if score > self.threshold and score > best.get(tokens[token_id], (0.0,))[0]:
+                best[tokens[token_id]] = (score, self._key_positions[key_id])
+
+        for i, token in enumerate(prepared):
+            if i not in exact_tokens and token in best:
+                score, keyword = best[token]
+                hits[(spans[i][0], spans[i][1], keyword)] = score
+
+        return [
+            (start, end, self.keywords[keyword], score)
+            for (start, end, keyword), score in sorted(hits.items())
+        ]
+
+
+def _contains_chunk(
+        scanner: KeywordScanner, 
+        documents: List[Union[str, Sequence[str], PreparedCorpus]]
+    ) -> List[bool]:
+    """ Applies `KeywordScanner.contains` to a chunk of documents.
+    """
+    return [scanner.contains(document) for document in documents]
+
+
+def _lower_preserving_offsets(text: str) -> str:
+    """ Lowercases a text without changing its length, so offsets in it are offsets in the original.
+
+    Parameters
+    ----------
+    text : str
+        The text intended to lowercase.
+
+    Returns
+    -------
+    str
+        The lowercased text. The characters whose lowercase has another length, such as 'İ', 
+        are kept as they were.
+    """
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+
+    return ''.join(char if len(char.lower()) != 1 else char.lower() for char in text)
+
+
+def _is_word_boundary(text: str, start: int, end: int) -> bool:
+    """ Checks if a span of a text starts and ends at word boundaries.
+
+    Parameters
+    ----------
+    text : str
+        The full text.
+    start : int
+        Where the span starts.
+    end : int
+        Where the span ends.
+
+    Returns
+    -------
+    bool
+        True if neither end of the span cuts a word in half.
+    """
+    starts_clean = start == 0 or not (text[start - 1].isalnum() and text[start].isalnum())
+    ends_clean = end == len(text) or not (text[end - 1].isalnum() and text[end].isalnum())
+
+    return starts_clean and ends_clean
+
+
+def _max_shift(length: int, threshold: float) -> int:
+    """ Computes how many characters the ends of an alignment can move while refining it.
+
+    Parameters
+    ----------
+    length : int
+        The length of the short sentence.
+    threshold : float
+        The level of similarity required for considering them equivalent.
+
+    Returns
+    -------
+    int
+        The number of characters each end of the window is allowed to move.
+    """
+    return int(length * (1 - max(min(threshold, 1.0), 0.0))) + 1
+
+
+def _fixed_window_seeds(
+        queries: List[str], 
+        text: str, 
+        threshold: float
+    ) -> List[List[Tuple[float, int]]]:
+    """ Scores, in a single pass over the text, the windows as long as each query 
+        whose character histogram can still reach the threshold. Long queries are 
+        sampled every few characters, since the refinement moves both ends anyway. 
+        A query longer than the text has the whole text as its only window.
+
+    Parameters
+    ----------
+    queries : List[str]
+        The prepared short sentences.
+    text : str
+        The prepared long text.
+    threshold : float
+        The level of similarity required for considering them equivalent.
+
+    Returns
+    -------
+    List[List[Tuple[float, int]]]
+        For every query, tuples of `(score, start)` of the windows worth refining.
+    """
+    seeds = [[] for _ in queries]
+    groups = {}
+    for query_id, query in enumerate(queries):
+        if 0 < len(query) <= len(text):
+            groups.setdefault(len(query), []).append(query_id)
+        elif text and query:
+            seeds[query_id].append((fuzz.ratio(query, text), 0))
+    if not groups:
+        return seeds
+
+    query_counts = [Counter(query) for query in queries]
+    strides = {
+        length: max(1, _max_shift(length, threshold) // 2)
+        for length in groups
+    }
+    cutoffs = {
+        length: max(_score_cutoff(threshold) - 100 * (_max_shift(length, threshold) + strides[length]) / length, 0.0)
+        for length in groups
+    }
+    window_counts = {length: Counter(text[:length]) for length in groups}
+    common = {
+        query_id: sum((query_counts[query_id] & window_counts[length]).values())
+        for length, query_ids in groups.items()
+        for query_id in query_ids
+    }
+
+    for start in range(len(text) - min(groups) + 1):
+        for length, query_ids in groups.items():
+            end = start + length
+            if end > len(text):
+                continue
+            counts = window_counts[length]
+            if start:
+                leaving = text[start - 1]
+                entering = text[end - 1]
+                for query_id in query_ids:
+                    needed = query_counts[query_id]
+                    if counts[leaving] <= needed[leaving]:
+                        common[query_id] -= 1
+                    if counts[entering] - (leaving == entering) < needed[entering]:
+                        common[query_id] += 1
+                counts[leaving] -= 1
+                counts[entering] += 1
+
+            if start % strides[length]:
+                continue
+            cutoff = cutoffs[length]
+            for query_id in query_ids:
+                if 100 * common[query_id] / length + _SCORE_MARGIN >= cutoff:
+                    score = fuzz.ratio(queries[query_id], text[start:end], score_cutoff=cutoff)
+                    if score and score >= cutoff:
+                        seeds[query_id].append((score, start))
+
+    return seeds
+
+
+def _coarse_to_fine(rank: Callable, low: int, high: int) -> tuple:
+    """ Looks for the best position in a range, first with big steps and then around the best one.
+
+    Parameters
+    ----------
+    rank : Callable
+        A function that takes a position and returns a tuple whose first element is its ranking key.
+    low : int
+        The first position of the range.
+    high : int
+        The last position of the range, included.
+
+    Returns
+    -------
+    tuple
+        The output of `rank` for the best position found.
+    """
+    best = rank(low)
+    best_position = low
+    step = max(1, (high - low) // 8)
+    while True:
+        for position in range(low, high + 1, step):
+            candidate = rank(position)
+            if candidate[0] > best[0]:
+                best, best_position = candidate, position
+        if step == 1:
+            return best
+        low, high = max(low, best_position - step), min(high, best_position + step)
+        step = max(1, step // 4)
+
+
+def _refine_alignment(
+        query: str, 
+        text: str, 
+        start: int, 
+        threshold: float,
+        hint: Optional[int] = None
+    ) -> Tuple[tuple, int, int, float]:
+    """ Moves both ends of a window, one at a time, looking for the best alignment.
+
+    Parameters
+    ----------
+    query : str
+        The prepared short sentence.
+    text : str
+        The prepared long text.
+    start : int
+        Where the window with the length of the query starts.
+    threshold : float
+        The level of similarity required for considering them equivalent.
+    hint : Optional[int], optional
+        A position where the alignment is expected to start, used to break ties, by default None.
+
+    Returns
+    -------
+    Tuple[tuple, int, int, float]
+        The ranking key of the alignment, its start, its end and its score in the (0, 100) scale.
+    """
+    length = len(query)
+    shift = _max_shift(length, threshold)
+
+    def rank(a, b):
+        score = fuzz.ratio(query, text[a:b])
+        distance = abs(a - hint) if hint is not None else 0
+        return (score, _is_word_boundary(text, a, b), -abs(b - a - length), -distance, -a), a, b, score
+
+    best = rank(start, min(start + length, len(text)))
+    for _ in range(2):
+        end = best[2]
+        best = max(best, _coarse_to_fine(lambda a: rank(a, end), max(0, start - shift), min(start + shift, end - 1)), key=lambda x: x[0])
+        begin = best[1]
+        best = max(best, _coarse_to_fine(lambda b: rank(begin, b), min(len(text), max(begin + 1, start + length - shift)), min(len(text), start + length + shift)), key=lambda x: x[0])
+
+    return best
+
+
+def _best_alignments(
+        query: str, 
+        text: str, 
+        seeds: List[Tuple[float, int]], 
+        threshold: float, 
+        top_k: int,
+        hint: Optional[int] = None
+    ) -> List[Tuple[int, int, float]]:
+    """ Refines the most promising seeds and keeps the best alignments that do not overlap.
+
+    Parameters
+    ----------
+    query : str
+        The prepared short sentence.
+    text : str
+        The prepared long text.
+    seeds : List[Tuple[float, int]]
+        Tuples of `(score, start)` of the windows worth refining.
+    threshold : float
+        The level of similarity required for considering them equivalent.
+    top_k : int
+        The maximum number of alignments to return.
+    hint : Optional[int], optional
+        A position where the alignment is expected to start, used to break ties, by default None.
+
+    Returns
+    -------
+    List[Tuple[int, int, float]]
+        Tuples of `(start, end, score)` sorted from the best to the worst alignment.
+    """
+    if top_k <= 0:
+        return []
+    budget = max(10, 3 * top_k)
+    refined = []
+    for _, start in sorted(seeds, key=lambda x: (-x[0], x[1])):
+        if len(refined) >= budget:
+            break
+        if any(a < start + len(query) and start < b for _, a, b, _ in refined):
+            continue
+        refined.append(_refine_alignment(query, text, start, threshold, hint))
+
+    alignments = []
+    for _, start, end, score in sorted(refined, key=lambda x: x[0], reverse=True):
+        if score / 100 > threshold and not any(a < end and start < b for a, b, _ in alignments):
+            alignments.append((start, end, score / 100))
+        if len(alignments) == top_k:
+            break
+
+    return alignments
+
+
+def locate_sentence(
+        short_sentence: Union[str, PreparedQuery], 
+        long_sentence: str, 
+        threshold: float = 0.8,
+        top_k: int = 1,
+        lowercase: bool = True
+    ) -> List[Tuple[int, int, float]]:
+    """ Finds where a short sentence sits inside a long text, tolerating small differences.
+
+    Parameters
+    ----------
+    short_sentence : str or PreparedQuery
+        The sentence intended to be found.
+    long_sentence : str
+        The text that might contain the short sentence.
+    threshold : float, optional
+        The level of similarity required for considering them equivalent, by default 0.8.
+    top_k : int, optional
+        The maximum number of alignments to return, by default 1.
+    lowercase : bool, optional
+        If True, both texts are compared in lowercase, by default True.
+
+    Returns
+    -------
+    List[Tuple[int, int, float]]
+        Tuples of `(start, end, score)` that do not overlap, sorted from the best to the worst 
+        alignment. `long_sentence[start:end]` is the matching span. The list is empty if no 
+        span is over the threshold.
+
+    Examples
+    -------
+    >>> from nlptools.comparison import locate_sentence
+    >>> locate_sentence('Raul Alberto LESCANO', 'casada con Raul Alberto LESCA-NO, nacida el 10 de marzo')
+    [(11, 32, 0.9756097560975611)]
+    """
+    query = short_sentence.normalized if isinstance(short_sentence, PreparedQuery) else short_sentence
+    text = long_sentence
+    if lowercase:
+        query = _lower_preserving_offsets(query)
+        text = _lower_preserving_offsets(text)
+
+    seeds = _fixed_window_seeds([query], text, threshold)[0]
+    
+    return _best_alignments(query, text, seeds, threshold, top_k)
+
+
+def locate_entities(
+        entities: List[dict], 
+        text: str, 
+        threshold: float = 0.8,
+        lowercase: bool = True
+    ) -> List[dict]:
+    """ Finds every entity inside a text in one pass, for example to re-anchor the 
+        entities of a TaggedDoc after its text was reprocessed.
+
+    Parameters
+    ----------
+    entities : List[dict]
+        Dictionaries with, at least, the key `text`. If they have a `start`, it is used 
+        to choose among equally good alignments.
+    text : str
+        The text where the entities are.
+    threshold : float, optional
+        The level of similarity required for considering them equivalent, by default 0.8.
+    lowercase : bool, optional
+        If True, the entities and the text are compared in lowercase, by default True.
+
+    Returns
+    -------
+    List[dict]
+        A copy of every entity, in the same order, with the new `start` and `end` and 
+        a `score`. Entities that could not be found keep their offsets and get a `score` of None.
+    """
+    prepared_text = _lower_preserving_offsets(text) if lowercase else text
+    queries = [
+        _lower_preserving_offsets(entity.get('text', '')) if lowercase else entity.get('text', '') 
+        for entity in entities
+    ]
+    seeds = _fixed_window_seeds(queries, prepared_text, threshold)
+
+    result = []
+    for entity, query, query_seeds in zip(entities, queries, seeds):
+        located = dict(entity)
+        alignments = _best_alignments(query, prepared_text, query_seeds, threshold, 1, entity.get('start'))
+        if alignments:
+            located['start'], located['end'], located['score'] = alignments[0]
+        else:
+            located['score'] = None
+        result.append(located)
+
+    return result
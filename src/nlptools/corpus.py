@@ -0,0 +1,367 @@
+"""
+    A sharded format to store a corpus of tagged documents on disk, and read it back
+    one document at a time, so the corpus never needs to fit in memory.
+
+    A corpus is a directory with numbered JSONL shards, where every line is a tagged
+    document, and an index with the shard, offset and length of every `doc_id`. New
+    documents are always appended, so the existing shards are never rewritten.
+
+        corpus/
+            meta.json
+            index.jsonl
+            shard-00000.jsonl
+            shard-00001.jsonl
+
+Classes
+-------
+- ShardedCorpus
+    Streams the documents of a corpus and reads any of them by `doc_id`.
+- CorpusWriter
+    Appends tagged documents to a corpus, creating it if it does not exist.
+"""
+import json
+import os
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+
+_FORMAT_VERSION = 1
+
+_DEFAULT_SHARD_BYTES = 64 * 1024 ** 2
+
+
+def _shard_path(root: str, shard: int) -> str:
+    return os.path.join(root, f'shard-{shard:05d}.jsonl')
+
+
+def _read_index(root: str) -> Tuple[Dict[str, Tuple[int, int, int]], int]:
+    """ Reads the position of every document of a corpus.
+
+    Parameters
+    ----------
+    root : str
+        The directory of the corpus.
+
+    Returns
+    -------
+    Tuple[Dict[str, Tuple[int, int, int]], int]
+        The shard, the offset and the length in bytes of every `doc_id`, in the order they were written,
+        and the size of the valid part of the index. A truncated last line, left by an interrupted write,
+        is ignored.
+    """
+    index, size = {}, 0
+    path = os.path.join(root, 'index.jsonl')
+    if not os.path.exists(path):
+        return index, size
+    with open(path, 'rb') as file:
+        for line in file:
+            if not line.endswith(b'\n'):
+                break
+            doc_id, shard, offset, length = json.loads(line)
+            index[doc_id] = (shard, offset, length)
+            size += len(line)
+
+    return index, size
+
+
+def is_corpus(root: str) -> bool:
+    """ Returns whether a directory holds a sharded corpus.
+    """
+    return os.path.exists(os.path.join(root, 'meta.json'))
+
+
+def to_tagged_document(document: Union[dict, tuple], doc_id: str = None) -> dict:
+    """ Converts a document into the tagged format stored in a corpus.
+
+    Parameters
+    ----------
+    document : {dict, tuple}
+        A tagged document with `doc_id`, `text` and `entities`, or a training example
+        of spacy, `(text, {'entities': [(start, end, label), ...]})`.
+    doc_id : str, optional
+        The id of a spacy example, which has none, by default None.
+
+    Returns
+    -------
+    dict
+        The document with the keys `doc_id`, `text` and `entities`.
+
+    Raises
+    ------
+    KeyError
+        If a dictionary does not have the keys `doc_id`, `text` and `entities`.
+    """
+    if isinstance(document, dict):
+        if [key for key in ['doc_id', 'text', 'entities'] if key not in document]:
+            raise KeyError('The dictionary must contain the keys `doc_id`, `text` and `entities`.')
+        return document
+
+    text, annotations = document
+    tags = [
+        {'start': start, 'end': end, 'tag': label, 'text': text[start:end]}
+        for start, end, label in annotations.get('entities', [])
+    ]
+
+    return {'doc_id': doc_id, 'text': text, 'entities': {'tags': tags}}
+
+
+class ShardedCorpus:
+    """
+        Reads a sharded corpus of tagged documents. Iterating over it streams the documents
+        in the order they were written, reading one line at a time. Any document can be
+        read by its `doc_id` with one seek, once the index is loaded.
+
+    Attributes
+    --------
+    - ShardedCorpus.root
+        The directory of the corpus.
+
+    Methods
+    -------
+    - ShardedCorpus.get
+    - ShardedCorpus.doc_ids
+    - ShardedCorpus.spacy_examples
+    - ShardedCorpus.close
+
+    Examples
+    -------
+    >>> from nlptools.datasets import load_dataset
+    >>> corpus = load_dataset('estatutos', root='data/estatutos')
+    >>> train = [document for document in corpus if document['doc_id'] not in test_ids]
+    >>> test = [corpus[doc_id] for doc_id in test_ids]
+    """
+    def __init__(self, root: str):
+        if not is_corpus(root):
+            raise FileNotFoundError(f'No corpus found in {root}.')
+        self.root = root
+        self._index = None
+        self._files = {}
+
+
+    def __repr__(self) -> str:
+        return f'ShardedCorpus({self.root!r})'
+
+
+    def __enter__(self) -> 'ShardedCorpus':
+        return self
+
+
+    def __exit__(self, *args):
+        self.close()
+
+
+    @property
+    def index(self) -> Dict[str, Tuple[int, int, int]]:
+        """ The shard, offset and length of every document, read the first time it is needed.
+        """
+        if self._index is None:
+            self._index = _read_index(self.root)[0]
+        return self._index
+
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self.index
+
+
+    def __getitem__(self, doc_id: str) -> dict:
+        shard, offset, length = self.index[doc_id]
+        if shard not in self._files:
+            self._files[shard] = open(_shard_path(self.root, shard), 'rb')
+        file = self._files[shard]
+        file.seek(offset)
+
+        return json.loads(file.read(length))
+
+
+    def __iter__(self) -> Iterator[dict]:
+        ends = {}
+        for shard, offset, length in self.index.values():
+            ends[shard] = max(ends.get(shard, 0), offset + length)
+        for shard in sorted(ends):
+            with open(_shard_path(self.root, shard), 'rb') as file:
+                while file.tell() < ends[shard]:
+                    line = file.readline()
+                    if not line:
+                        break
+                    yield json.loads(line)
+
+
+    def get(self, doc_id: str, default: Optional[dict] = None) -> Optional[dict]:
+        """ Reads one document by its `doc_id`.
+
+        Parameters
+        ----------
+        doc_id : str
+            The id of the document.
+        default : Optional[dict], optional
+            What to return if the corpus does not have the document, by default None.
+
+        Returns
+        -------
+        Optional[dict]
+            The tagged document.
+        """
+        return self[doc_id] if doc_id in self.index else default
+
+
+    def doc_ids(self) -> List[str]:
+        """ Returns the id of every document, in the order they were written.
+        """
+        return list(self.index)
+
+
+    def spacy_examples(self) -> Iterator[Tuple[str, dict]]:
+        """ Streams the documents as training examples of spacy.
+
+        Yields
+        ------
+        Tuple[str, dict]
+            The text and its entities, `(text, {'entities': [(start, end, LABEL), ...]})`,
+            as `data_augmentation.TaggedDoc` builds them.
+        """
+        for document in self:
+            tags = sorted(document['entities']['tags'], key=lambda tag: tag['start'])
+            yield (
+                document['text'],
+                {'entities': [(tag['start'], tag['end'], tag['tag'].upper()) for tag in tags]}
+            )
+
+
+    def close(self):
+        """ Closes the shards opened for random access.
+        """
+        for file in self._files.values():
+            file.close()
+        self._files = {}
+
+
+class CorpusWriter:
+    """
+        Appends tagged documents to a sharded corpus. A new shard is started when the
+        current one reaches the maximum size, and the existing shards are never rewritten.
+        If a previous write was interrupted, the documents that did not reach the index
+        are discarded when the writer is opened again.
+
+    Attributes
+    --------
+    - CorpusWriter.root
+        The directory of the corpus.
+    - CorpusWriter.shard_bytes
+        The maximum size of a shard, in bytes.
+
+    Methods
+    -------
+    - CorpusWriter.add
+    - CorpusWriter.add_many
+    - CorpusWriter.close
+
+    Examples
+    -------
+    >>> from nlptools.corpus import CorpusWriter
+    >>> from nlptools.example import example_data
+    >>> with CorpusWriter('data/estatutos/corpus') as writer:
+    ...     writer.add(example_data)
+    """
+    def __init__(self, root: str, shard_bytes: int = _DEFAULT_SHARD_BYTES):
+        os.makedirs(root, exist_ok=True)
+        self.root = root
+        meta_path = os.path.join(root, 'meta.json')
+        if os.path.exists(meta_path):
+            with open(meta_path) as file:
+                meta = json.load(file)
+            if meta['format_version'] != _FORMAT_VERSION:
+                raise ValueError(f'The corpus in {root} has format version {meta["format_version"]}.')
+            self.shard_bytes = meta['shard_bytes']
+        else:
+            self.shard_bytes = shard_bytes
+            with open(meta_path, 'w') as file:
+                json.dump({'format_version': _FORMAT_VERSION, 'shard_bytes': shard_bytes}, file)
+
+        index, index_size = _read_index(root)
+        self._doc_ids = set(index)
+        self._shard, self._size = max(
+            [(shard, offset + length) for shard, offset, length in index.values()],
+            default=(0, 0)
+        )
+
+        self._index_file = open(os.path.join(root, 'index.jsonl'), 'ab')
+        self._index_file.truncate(index_size)
+        self._shard_file = open(_shard_path(root, self._shard), 'ab')
+        self._shard_file.truncate(self._size)
+
+
+    def __enter__(self) -> 'CorpusWriter':
+        return self
+
+
+    def __exit__(self, *args):
+        self.close()
+
+
+    def __len__(self) -> int:
+        return len(self._doc_ids)
+
+
+    def add(self, document: Union[dict, tuple], doc_id: str = None) -> str:
+        """ Appends one document to the corpus.
+
+        Parameters
+        ----------
+        document : {dict, tuple}
+            A tagged document with `doc_id`, `text` and `entities`, or a training example of spacy.
+        doc_id : str, optional
+            The id of a spacy example. If None, the position of the document in the corpus
+            is used, by default None.
+
+        Returns
+        -------
+        str
+            The `doc_id` of the document.
+
+        Raises
+        ------
+        KeyError
+            If the corpus already has a document with the same `doc_id`.
+        """
+        if not isinstance(document, dict) and doc_id is None:
+            doc_id = f'doc_{len(self._doc_ids):08d}'
+        document = to_tagged_document(document, doc_id)
+        doc_id = document['doc_id']
+        if doc_id in self._doc_ids:
+            raise KeyError(f'The corpus already has a document with doc_id `{doc_id}`.')
+
+        line = json.dumps(document, ensure_ascii=False).encode('utf-8') + b'\n'
+        if self._size and self._size + len(line) > self.shard_bytes:
+            self._shard_file.close()
+            self._shard, self._size = self._shard + 1, 0
+            self._shard_file = open(_shard_path(self.root, self._shard), 'wb')
+        self._shard_file.write(line)
+        self._shard_file.flush()
+        self._index_file.write(
+            json.dumps([doc_id, self._shard, self._size, len(line)], ensure_ascii=False).encode('utf-8') + b'\n'
+        )
+        self._size += len(line)
+        self._doc_ids.add(doc_id)
+
+        return doc_id
+
+
+    def add_many(self, documents) -> List[str]:
+        """ Appends a stream of documents to the corpus, as `CorpusWriter.add` does.
+
+        Returns
+        -------
+        List[str]
+            The `doc_id` of every document.
+        """
+        return [self.add(document) for document in documents]
+
+
+    def close(self):
+        """ Flushes and closes the files of the corpus.
+        """
+        self._shard_file.close()
+        self._index_file.close()
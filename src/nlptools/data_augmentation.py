@@ -6,15 +6,39 @@ Classes
 - TaggedDoc
     Intended to open tagged documents using the Text Tag Tool.
 """
+from __future__ import annotations
+
 import os
 import warnings
 import random
 import datetime
-from typing import List
-import pandas as pd
-from spacy import displacy
-from nlptools.parsing import number_to_words
-from nlptools.datasets import _get_source
+import functools
+from typing import List, Sequence, Union
+import numpy as np
+from nlptools import _lazy_module
+from nlptools.parsing import number_to_words, number_to_words_many
+from nlptools.comparison import locate_entities
+from nlptools.datasets import SharedDatasetsHandle, load_source
+from nlptools.addresses import address_index
+
+pd = _lazy_module('pandas')
+
+_MONTHS = [
+    'Enero', 'Febrero', 'Marzo', 'Abril', 'Mayo', 'Junio', 'Julio',
+    'Agosto', 'Septiembre', 'Octubre', 'Noviembre', 'Diciembre',
+]
+
+_MANDATO_PHRASES = [
+    'término de duración de la sociedad', 'plazo de duración de la sociedad', 'vencimiento de la sociedad',
+]
+
+_COMPANY_TYPES = [
+    'sociedad de responsabilidad limitada',
+    'sociedad anónima',
+    'sociedad por acciones simplificada',
+    'sociedad anónima unipersonal',
+    'sociedad por acciones simplificada unipersonal',
+]
 
 
 class TaggedDoc:
@@ -42,6 +66,7 @@ class TaggedDoc:
     - TaggedDoc.render
     - TaggedDoc.index_augmentation
     - TaggedDoc.save_render
+    - TaggedDoc.realign_entities
 
     
     """
@@ -115,6 +140,8 @@ class TaggedDoc:
         page : bool, optional
             If set to True, will save an html file., by default False
         """
+        from spacy import displacy
+
         for _ in self.displacy_format.get('ents'):
             if not _.get('start') or not _.get('end') or not _.get('label'):
                 to_render = {'text': 'Esto es un texto completo con entidades, pero vos no sabes de donde sacarlo.',
@@ -130,11 +157,11 @@ class TaggedDoc:
     def index_augmentation(self):
         new_ents = self.ents_df.copy() # careful with this
         new_ents = new_ents.sort_values('start')
-        new_ents.index = new_ents.reset_index(drop=True)
+        new_ents = new_ents.reset_index(drop=True)
         new_ents['len'] = new_ents.text.apply(len)
         new_ents['new_len'] = new_ents.new_text.apply(len)
         new_ents['diff'] = new_ents['new_len'] - new_ents['len']
-        indecis = new_ents.loc[new_ents.diff != 0].index.to_list()
+        indecis = new_ents.loc[new_ents['diff'] != 0].index.to_list()
 
         for index in indecis:
             diff = new_ents.loc[index, 'diff']
@@ -146,10 +173,35 @@ class TaggedDoc:
     
     
     def save_render(self, filepath:str, **kwds):
+        from spacy import displacy
         html = displacy.render(self.displacy_format, style='ent', jupyter=False, manual=True, page=True, **kwds)        
         with open(f'{filepath}.html', 'w') as file:
             file.write(html)
 
+
+    def realign_entities(self, text: str = None, threshold: float = 0.8) -> List[dict]:
+        """ Finds every entity again in a reprocessed version of the text, for example 
+            after running the OCR again, using nlptools.comparison.locate_entities.
+
+        Parameters
+        ----------
+        text : str, optional
+            The new text of the document. If not provided, the entities are 
+            located in the current text, by default None.
+        threshold : float, optional
+            The level of similarity required for considering them equivalent, by default 0.8.
+
+        Returns
+        -------
+        List[dict]
+            A copy of every entity with the new `start` and `end` and a `score`. Entities 
+            that could not be found keep their offsets and get a `score` of None.
+        """
+        if text is None:
+            text = self.text
+
+        return locate_entities(self.ents, text, threshold)
+
     
     def _get_spacy_entities(self):
         entities = [
@@ -170,6 +222,73 @@ class TaggedDoc:
 
 
 
+def _join(*parts) -> np.ndarray:
+    """ Concatenates string arrays and literals element-wise. """
+    return functools.reduce(np.char.add, parts)
+
+
+def _padded(numbers: np.ndarray, width: int) -> np.ndarray:
+    """ Formats an array of integers as strings zero-padded to `width` digits. """
+    digits = np.asarray(numbers).astype(str)
+    return np.char.zfill(digits, width) if digits.size else digits
+
+
+def _words(numbers: np.ndarray, to: str = 'cardinal') -> np.ndarray:
+    """ Spells an array of integers in spanish, converting every distinct value only once. """
+    unique, inverse = np.unique(numbers, return_inverse=True)
+    return np.array(number_to_words_many(unique.tolist(), lang='es', to=to), dtype=str)[inverse]
+
+
+def _number_forms(numbers: np.ndarray) -> np.ndarray:
+    """ Returns, for every number, its four forms: `1`, `uno`, `uno (1)` and `1 (uno)`. """
+    digits = numbers.astype(str)
+    words = _words(numbers)
+    return np.stack([
+        digits,
+        words,
+        _join(words, ' (', digits, ')'),
+        _join(digits, ' (', words, ')'),
+    ], axis=1)
+
+
+def _format_dates(dates: np.ndarray, styles: np.ndarray, include_year: bool) -> List[str]:
+    """ Vectorized version of `date_formatter` for an array of dates and their formality indices. """
+    months = dates.astype('datetime64[M]')
+    month_numbers = months.astype(int) % 12 + 1
+    day_numbers = (dates - months).astype(int) + 1
+    day = _padded(day_numbers, 2)
+    month = _padded(month_numbers, 2)
+    month_words = np.array(_MONTHS)[month_numbers - 1]
+    cardinal = _words(day_numbers)
+    ordinal = _words(day_numbers, to='ordinal')
+    formats = [
+        [day, '-', month],
+        [day, '/', month],
+        [day, ' de ', month_words],
+        [day, ' de ', month_words],
+        [cardinal, ' de ', month_words],
+        [cardinal, ' del mes de ', month_words],
+        [ordinal, ' día del mes de ' if include_year else ' días del mes de ', month_words],
+    ]
+    if include_year:
+        year_numbers = dates.astype('datetime64[Y]').astype(int) + 1970
+        year = year_numbers.astype(str)
+        year_words = _words(year_numbers)
+        for parts, ending in zip(formats, [
+            ['-', year], ['/', year], [' de ', year], [' de ', year_words],
+            [' de ', year_words], [' de ', year_words], [' del año ', year_words],
+        ]):
+            parts.extend(ending)
+
+    result = np.empty(len(dates), dtype=object)
+    for style, parts in enumerate(formats):
+        mask = styles == style
+        if mask.any():
+            result[mask] = _join(*[part[mask] if isinstance(part, np.ndarray) else part for part in parts])
+
+    return result.tolist()
+
+
 def random_date_generator(
         start_year:int=1900, 
         start_month:int=1, 
@@ -178,8 +297,9 @@ def random_date_generator(
         end_month:int=12, 
         end_day:int=31, 
         mapper:dict=None, 
-        seed:int=None
-    ) -> datetime.date:
+        seed:int=None,
+        n:int=None
+    ) -> Union[datetime.date, List[datetime.date]]:
     """ Creates a random date in the time span provided. Returns a datetieme.date object.
 
     Parameters
@@ -200,11 +320,14 @@ def random_date_generator(
         A dictionary-like object with same previous arguments as keys and integer as values, by default None.
     seed : int, optional
         The random seed if you're interested in replicating the results, by default None.
+    n : int, optional
+        If specified, returns a list of n random dates drawn at once, by default None.
 
     Returns
     -------
     datetime.date
-        A random datetime.date object contained in the time span provided.
+        A random datetime.date object contained in the time span provided, or a list
+        of them if `n` is specified.
 
 
     Examples
@@ -244,6 +367,9 @@ def random_date_generator(
     end_date = datetime.date(end_year, end_month, end_day)
     time_between_dates = end_date - start_date
     days_between_dates = time_between_dates.days
+    if n is not None:
+        offsets = np.random.default_rng(random.getrandbits(32)).integers(days_between_dates, size=n)
+        return (np.datetime64(start_date, 'D') + offsets).astype(object).tolist()
     random_number_of_days = random.randrange(days_between_dates)
     random_date = start_date + datetime.timedelta(days=random_number_of_days)
     
@@ -251,17 +377,19 @@ def random_date_generator(
 
 
 def date_formatter(
-        date: datetime.date, 
+        date: Union[datetime.date, Sequence[datetime.date]], 
         formality: str = 'random', 
         include_year: bool = True,
         seed:int=None
-    ) -> str:
+    ) -> Union[str, List[str]]:
     """ Converts a datetime.date object into a formatted string.
 
     Parameters
     ----------
-    date : datetime.date
-        The date object intended to convert to string.
+    date : {datetime.date, Sequence[datetime.date]}
+        The date object intended to convert to string. If a sequence of dates is
+        provided, all of them are formatted at once and, with formality 'random',
+        each one gets its own formality.
     formality : str, optional
         Different types of formatting, by default 'random'.
     include_year : bool, optional
@@ -270,7 +398,8 @@ def date_formatter(
     Returns
     -------
     str
-        A string containing the desired format
+        A string containing the desired format, or a list of them if a sequence 
+        of dates is provided.
 
     Raises
     ------
@@ -308,22 +437,17 @@ def date_formatter(
         random.seed(seed)
     if formality not in formality_list:
         raise KeyError(f'Keyword `{formality}` not found. Argument `formality` must be one of {formality_list}.')
+    elif not isinstance(date, datetime.date):
+        dates = np.asarray(date, dtype='datetime64[D]')
+        if formality == 'random':
+            styles = np.random.default_rng(random.getrandbits(32)).integers(0, 7, len(dates))
+        else:
+            styles = np.full(len(dates), formality_list.index(formality))
+        return _format_dates(dates, styles, include_year)
     elif formality == 'random':
         formality = formality_list[random.randint(0,6)]
     
-    month_mapper = {
-        '01':'Enero',
-        '02':'Febrero',
-        '03':'Marzo',
-        '04':'Abril',
-        '05':'Mayo',
-        '06':'Junio',
-        '07':'Julio',
-        '08':'Agosto',
-        '09':'Septiembre',
-        '10':'Octubre',
-        '11':'Noviembre',
-        '12':'Diciembre'}
+    month_mapper = {f'{number:02d}': name for number, name in enumerate(_MONTHS, 1)}
 
     day = f'{date.day}' if len(str(date.day)) > 1 else f'0{date.day}'
     month = f'{date.month}' if len(str(date.month)) > 1 else f'0{date.month}'
@@ -357,7 +481,8 @@ def date_formatter(
 def random_name_generator(
         n: int, 
         name_type: str = 'any',
-        seed:int=None
+        seed:int=None,
+        shared: SharedDatasetsHandle = None
     ) -> list:
     """ Creates a list of len(n) names for persons, companies or both.
 
@@ -367,6 +492,11 @@ def random_name_generator(
         The number of names intended to get. Maximum supported 20.000.
     name_type : str, optional
         The type of name wanted, can be 'company', 'person' or 'any', by default 'any'.
+    seed : int, optional
+        If specified, will return the same value always, by default None.
+    shared : SharedDatasetsHandle, optional
+        The handle of datasets stored in shared memory by `datasets.share_datasets`,
+        to read them without loading a copy in every worker process, by default None.
 
     Returns
     -------
@@ -392,35 +522,45 @@ def random_name_generator(
         raise KeyError(f'{name_type} is not a valid option. Please choose one of the following {possible_types}')
     
     if name_type == 'company':
-        names = _get_source('companies')
+        names = load_source('companies', ['name'], n, seed=random.getrandbits(32), shared=shared)['name']
     elif name_type == 'person':
-        names = _get_source('persons')
+        names = load_source('persons', ['name'], n, seed=random.getrandbits(32), shared=shared)['name']
     elif name_type == 'any':
-        persons = _get_source('persons')['name'].sample(10000)
-        companies = _get_source('companies')['name'].sample(10000)
-        names = pd.concat([persons, companies])
+        n_persons = np.random.default_rng(random.getrandbits(32)).hypergeometric(10000, 10000, n) if n else 0
+        persons = load_source('persons', ['name'], n_persons, seed=random.getrandbits(32), shared=shared)['name']
+        companies = load_source('companies', ['name'], n - n_persons, seed=random.getrandbits(32), shared=shared)['name']
+        names = pd.concat([persons, companies]).sample(n, random_state=random.getrandbits(32))
         del persons, companies
 
-    result = names.sample(n).to_list()
+    result = names.to_list()
     
     return result
 
 
-def mandato_generator(seed:int=None) -> str:
+def mandato_generator(seed:int=None, n:int=None) -> Union[str, List[str]]:
     """ Creates a string typically used for mandato lenght of companies.
 
     Parameters
     ----------
     seed : int, optional
         If specified, will return the same value always, by default None.
+    n : int, optional
+        If specified, returns a list of n phrases drawn at once, by default None.
 
     Returns
     -------
     str
-        A string with a phrase typically used for mandato length.
+        A string with a phrase typically used for mandato length, or a list of them 
+        if `n` is specified.
     """
     if seed:
         random.seed(seed)
+    if n is not None:
+        rng = np.random.default_rng(random.getrandbits(32))
+        years = _number_forms(np.arange(1, 11))[rng.integers(0, 10, n), rng.integers(0, 4, n)]
+        keywords = np.array(['años', 'ejercicios'])[rng.integers(0, 2, n)]
+        phrases = np.array(_MANDATO_PHRASES)[rng.integers(0, 3, n)]
+        return np.where(rng.integers(0, 3, n) != 0, _join(years, ' ', keywords), phrases).tolist()
     if random.randint(0,2):
         years = random.randint(1,10)
         keywords = ['años', 'ejercicios'][random.randint(0,1)]
@@ -428,26 +568,36 @@ def mandato_generator(seed:int=None) -> str:
         random_year = [years, years_words, f'{years_words} ({years})', f'{years} ({years_words})'][random.randint(0,3)]
         result = f'{random_year} {keywords}'
     else:
-        result = ['término de duración de la sociedad', 'plazo de duración de la sociedad', 'vencimiento de la sociedad'][random.randint(0,2)]
+        result = _MANDATO_PHRASES[random.randint(0,2)]
     
     return result
 
 
-def vigencia_generator(seed:int=None) -> str:
+def vigencia_generator(seed:int=None, n:int=None) -> Union[str, List[str]]:
     """ Creates a string typically used for the duration of the company.
 
     Parameters
     ----------
     seed : int, optional
         If specified, will return the same value always, by default None.
+    n : int, optional
+        If specified, returns a list of n values drawn at once, by default None.
 
     Returns
     -------
     str
-        A string with a phrase or number used to determine the duration of the company.
+        A string with a phrase or number used to determine the duration of the company,
+        or a list of them if `n` is specified.
     """
     if seed:
         random.seed(seed)
+    if n is not None:
+        rng = np.random.default_rng(random.getrandbits(32))
+        years = rng.integers(1, 101, n)
+        forms = rng.integers(0, 4, n)
+        result = _number_forms(np.arange(1, 101))[years - 1, forms].astype(object)
+        result[forms == 0] = years[forms == 0].astype(object)
+        return result.tolist()
     years = random.randint(1,100)
     years_words = number_to_words(years, lang='es')
     result = [
@@ -461,26 +611,29 @@ def vigencia_generator(seed:int=None) -> str:
     return result
 
 
-def tipicidad_generator(seed:int=None) -> str:
+def tipicidad_generator(seed:int=None, n:int=None) -> Union[str, List[str]]:
     """ Creates a that determines the type of company.
 
     Parameters
     ----------
     seed : int, optional
         If specified, will return the same value always, by default None.
+    n : int, optional
+        If specified, returns a list of n phrases drawn at once, by default None.
 
     Returns
     -------
     str
-        A string with a phrase containing the type of company.
+        A string with a phrase containing the type of company, or a list of them 
+        if `n` is specified.
     """    
     if seed:
         random.seed(seed)
-    company_type = ['sociedad de responsabilidad limitada', 
-                    'sociedad anónima',
-                    'sociedad por acciones simplificada',
-                    'sociedad anónima unipersonal',
-                    'sociedad por acciones simplificada unipersonal'][random.randint(0, 4)]
+    if n is not None:
+        rng = np.random.default_rng(random.getrandbits(32))
+        styles = np.array([[name, name.upper(), name.title()] for name in _COMPANY_TYPES])
+        return styles[rng.integers(0, 5, n), rng.integers(0, 3, n)].tolist()
+    company_type = _COMPANY_TYPES[random.randint(0, 4)]
     style = ['lower', 'upper', 'title'][random.randint(0,2)]
     
     if style == 'lower':
@@ -493,7 +646,7 @@ def tipicidad_generator(seed:int=None) -> str:
     return result
 
 
-def id_generator(cuit=False, seed:int=None) -> str:
+def id_generator(cuit=False, seed:int=None, n:int=None) -> Union[str, List[str]]:
     """ Generates an argentine DNI or CUIT in string format.
 
     Parameters
@@ -502,14 +655,28 @@ def id_generator(cuit=False, seed:int=None) -> str:
         If True, will return a CUIT, otherwise a DNI, by default False.
     seed : int, optional
         If specified, will return the same value always, by default None.
+    n : int, optional
+        If specified, returns a list of n ids drawn at once, by default None.
 
     Returns
     -------
     str
-        A string containing the typical format of a DNI or a CUIT.
+        A string containing the typical format of a DNI or a CUIT, or a list of them 
+        if `n` is specified.
     """
     if seed:
         random.seed(seed)
+    if n is not None:
+        rng = np.random.default_rng(random.getrandbits(32))
+        digits = _padded(np.arange(1000), 3)
+        millions = rng.integers(0, 100, n)
+        thousands = digits[rng.integers(0, 1000, n)]
+        hundreds = digits[rng.integers(0, 1000, n)]
+        if cuit:
+            beginning = np.arange(20, 36).astype(str)[rng.integers(0, 16, n)]
+            end = np.arange(1, 10).astype(str)[rng.integers(0, 9, n)]
+            return _join(beginning, '-', _padded(np.arange(100), 2)[millions], thousands, hundreds, '-', end).tolist()
+        return _join(np.arange(100).astype(str)[millions], '.', thousands, '.', hundreds).tolist()
     millions = random.randint(0,99)
     thousands = random.randint(0,999)
     hundreds = random.randint(0,999)
@@ -540,7 +707,7 @@ def id_generator(cuit=False, seed:int=None) -> str:
     return result
 
 
-def capital_generator(style:str='any', seed:int=None) -> str:
+def capital_generator(style:str='any', seed:int=None, n:int=None) -> Union[str, List[str]]:
     """ Creates a random string to define the funding of a company.
 
     Parameters
@@ -551,11 +718,14 @@ def capital_generator(style:str='any', seed:int=None) -> str:
         if set to 'mixed', will return a mixture of the previous, by default 'any'.
     seed : int, optional
         If specified, will return the same value always, by default None.
+    n : int, optional
+        If specified, returns a list of n amounts drawn at once, by default None.
 
     Returns
     -------
     str
-        A string containing a phrase, number ot both containing a money amount.
+        A string containing a phrase, number ot both containing a money amount, or a 
+        list of them if `n` is specified.
 
     Raises
     ------
@@ -564,8 +734,10 @@ def capital_generator(style:str='any', seed:int=None) -> str:
     """
     if seed:
         random.seed(seed)
+    if n is not None:
+        return _capital_batch(style, n)
     millions = random.randint(0,1)
-    thousands = [x for x in range(0,1000, 5)][random.randint(0,199)]
+    thousands = 5 * random.randint(0,199)
     hundreds = ['000', '500'][random.randint(0,1)]
     
     if millions:
@@ -598,7 +770,35 @@ def capital_generator(style:str='any', seed:int=None) -> str:
     return result
 
 
-def aporte_generator(share_type:str = 'any', seed:int=None) -> str:
+def _capital_batch(style: str, n: int) -> List[str]:
+    """ Vectorized version of `capital_generator` that draws n amounts at once. """
+    styles = ['written', 'number', 'mixed']
+    if style not in styles + ['any']:
+        raise KeyError('Wrong specification of style. Must be `written`, `number`, `mixed` or `any`')
+    rng = np.random.default_rng(random.getrandbits(32))
+    thousands = rng.integers(0, 200, n)
+    hundreds = rng.integers(0, 2, n)
+    millions = np.where(rng.integers(0, 2, n) == 1, rng.integers(1, 11, n), 0)
+    amounts, inverse = np.unique((millions * 200 + thousands) * 2 + hundreds, return_inverse=True)
+    thousands, hundreds, millions = 5 * (amounts // 2 % 200), 500 * (amounts % 2), amounts // 400
+    number = np.where(
+        millions > 0,
+        _join(millions.astype(str), '.', _padded(thousands, 3)),
+        thousands.astype(str)
+    )
+    number = _join(number, '.', _padded(hundreds, 3))
+    if style == 'number':
+        return number[inverse].tolist()
+
+    words = _words(millions * 1000000 + thousands * 1000 + hundreds)
+    forms = np.stack([words, number, _join(words, ' ($ ', number, ')'), _join('$', number, ' (', words, ')')], axis=1)
+    chosen = rng.integers(0, 3, n) if style == 'any' else np.full(n, styles.index(style))
+    chosen = chosen + ((chosen == 2) & (rng.integers(0, 2, n) == 1))
+
+    return forms[inverse, chosen].tolist()
+
+
+def aporte_generator(share_type:str = 'any', seed:int=None, n:int=None) -> Union[str, List[str]]:
     """ Creates a random string containing the amount of shares
         that a shareholder is giving to the company.
 
@@ -608,16 +808,26 @@ def aporte_generator(share_type:str = 'any', seed:int=None) -> str:
         If you want cuotas or acciones in the output, by default 'any'.
     seed : int, optional
         If specified, will return the same value always, by default None.
+    n : int, optional
+        If specified, returns a list of n values drawn at once, by default None.
 
     Returns
     -------
     str
         A string containing the number that a shareholder is giving
-        to be part of the company.
+        to be part of the company, or a list of them if `n` is specified.
     """
     if seed:
         random.seed(seed)
-    thousands = [x for x in range(0,1000, 5)][random.randint(0,199)]
+    if n is not None:
+        rng = np.random.default_rng(random.getrandbits(32))
+        thousands = 5 * rng.integers(0, 200, n)
+        hundreds = np.array(['000', '500'])[rng.integers(0, 2, n)]
+        result = _join(thousands.astype(str), '.', hundreds).astype(object)
+        plain = rng.integers(0, 2, n) == 0
+        result[plain] = thousands[plain].astype(object)
+        return result.tolist()
+    thousands = 5 * random.randint(0,199)
     hundreds = ['000', '500'][random.randint(0,1)]
     
     if random.randint(0,1):
@@ -627,7 +837,7 @@ def aporte_generator(share_type:str = 'any', seed:int=None) -> str:
     return result
 
 
-def address_generator(n:int, legal:bool=False, seed:int=None) -> List[str]:
+def address_generator(n:int, legal:bool=False, seed:int=None, shared:SharedDatasetsHandle=None) -> List[str]:
     """
         Creates a list of strings with fictionary addresses, 
         using real streets, districts and provinces.
@@ -641,6 +851,9 @@ def address_generator(n:int, legal:bool=False, seed:int=None) -> List[str]:
         or apartment number, by default False.
     seed : int, optional
         If specified, will return the same value always, by default None.
+    shared : SharedDatasetsHandle, optional
+        The handle of datasets stored in shared memory by `datasets.share_datasets`,
+        to build the address index without loading a copy of `calles`, by default None.
 
     Returns
     -------
@@ -650,11 +863,15 @@ def address_generator(n:int, legal:bool=False, seed:int=None) -> List[str]:
     
     if seed:
         random.seed(seed)
-    df_address = _get_source('calles')
+
+    index = address_index(shared)
+
+    def sample(size: int) -> pd.DataFrame:
+        return index.take(index.sample(size, seed=random.getrandbits(32)))
     
     if legal:
+        df_address = sample(n)
         result = df_address['departamento'] + ', ' + df_address['provincia']
-        result = result.sample(n)
     else:
         altura = pd.Series([random.randint(0,5000) for i in range(n*5)])
         
@@ -671,31 +888,33 @@ def address_generator(n:int, legal:bool=False, seed:int=None) -> List[str]:
         connector = [[', de la localidad de ', ', partido de ', ', ', ', departamento de ']\
                      [random.randint(0,3)] for i in range(n*3)]
         
-        completo =  pd.Series(df_address['nombre'].sample(n*3).str.title().values) + \
+        calles = sample(n*3)
+        completo =  calles['nombre'].str.title() + \
                 ' ' +\
                 pd.Series(altura.sample(n*3).astype(str).values) + \
                 ', ' + \
                 pd.Series(full.values) + \
                 pd.Series(connector) + \
-                pd.Series(df_address.sample(n*3)['departamento'].values) + \
+                calles['departamento'] + \
                 ', ' + \
-                pd.Series(df_address.sample(n*3)['provincia'].values)
+                calles['provincia']
             
-        solo_altura = pd.Series(df_address['nombre'].sample(n*3).str.title().values) + \
+        calles = sample(n*3)
+        solo_altura = calles['nombre'].str.title() + \
                       ' ' + \
                       pd.Series(altura.sample(n*3).astype(str).values) + \
                       ', ' +\
-                      pd.Series(df_address['departamento'].sample(n*3).values) + \
+                      calles['departamento'] + \
                       ', ' +\
-                      pd.Series(df_address['provincia'].sample(n*3).values)
+                      calles['provincia']
         
-        esta_ciudad = pd.Series(df_address['nombre'].sample(n).str.title().values) + \
+        esta_ciudad = sample(n)['nombre'].str.title() + \
                       ' ' + \
                       pd.Series(altura.sample(n).astype(str).values) + \
                       ', ' +\
                       pd.Series(['de esta ciudad' for i in range(n)])
         
-        esta_ciudad_2 = pd.Series(df_address['nombre'].sample(n).str.title().values) + \
+        esta_ciudad_2 = sample(n)['nombre'].str.title() + \
                         ' ' +\
                         pd.Series(altura.sample(n).astype(str).values) + \
                         ', ' + \
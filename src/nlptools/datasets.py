@@ -1,11 +1,59 @@
 """
-    This module contains the function to load any dataset.
+    This module contains the function to load any dataset, and the cache that keeps
+    the bundled datasets in memory so they are read only once per process.
+
+    The bundled CSV files are converted, the first time they are used, into a columnar
+    format stored in the user cache directory: for every column, the UTF-8 bytes of all 
+    the values, the offsets where every value starts and a mask of missing values, all
+    saved as NumPy arrays. Later loads memory-map those files, so every process shares 
+    the same pages instead of parsing its own copy of the CSV.
+
+    The corpus of estatutos is not bundled: `load_dataset` streams it from a sharded
+    corpus, see `nlptools.corpus`, under `NLPTOOLS_ESTATUTOS_DIR`.
+
+Classes
+-------
+- DatasetCache
+    Keeps the loaded datasets within a memory budget, evicting the least recently used.
+- StringColumn
+    A memory-mapped column of strings that decodes only the values requested.
+- ColumnarDataset
+    The memory-mapped columns of a bundled dataset.
+- SharedDatasets
+    Bundled datasets copied into shared memory, to read them from several processes.
+- SharedDatasetsHandle
+    A reference to shared datasets that pickles cheaply, to send to worker processes.
 """
+from __future__ import annotations
 
 import os, pickle
+import hashlib
+import json
 import pkgutil
-import pandas as pd
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+import numpy as np
 from io import BytesIO
+from multiprocessing import shared_memory
+from nlptools import _lazy_module
+from nlptools.corpus import ShardedCorpus, is_corpus
+
+pd = _lazy_module('pandas')
+
+
+_DATASET_NAMES = {'calles', 'companies', 'persons'}
+
+_DEFAULT_CACHE_BYTES = 2 * 1024 ** 3
+
+_COLUMNAR_FORMAT_VERSION = 1
+
+_COLUMNAR_FILES = ('data', 'offsets', 'nulls')
+
 
 def _bytes_to_pandas(bytes_data:bytes) -> pd.DataFrame:
     """ Transforms compressed bytes data into a pandas.DataFrame.
@@ -26,8 +74,390 @@ def _bytes_to_pandas(bytes_data:bytes) -> pd.DataFrame:
     return df
 
 
-def _get_source(data_name:str) -> pd.DataFrame:
-    """ Loads a data source for internal usage.
+def _read_csv_source(data_name:str) -> pd.DataFrame:
+    """ Reads and parses a bundled CSV file, without looking at any cache.
+
+    Parameters
+    ----------
+    data_name : str, {'calles', 'companies', 'persons'}
+        Name of the dataset intended to load.
+
+    Returns
+    -------
+    pd.DataFrame
+        A pandas.DataFrame with the source data required.
+    """
+    source =  pkgutil.get_data('nlptools', f'data/{data_name}.csv.zip')
+    result = _bytes_to_pandas(source)
+    del source
+
+    return result
+
+
+class _ReleasedArray:
+    """ Stands for an array whose memory was freed, so every read raises ValueError instead of crashing. """
+    def __init__(self, message: str):
+        self._message = message
+
+
+    def __getattr__(self, name: str):
+        raise ValueError(self.__dict__.get('_message', 'The array was released.'))
+
+
+    def __getitem__(self, key):
+        raise ValueError(self._message)
+
+
+    def __len__(self) -> int:
+        raise ValueError(self._message)
+
+
+class StringColumn:
+    """
+        A column of strings stored as the UTF-8 bytes of all its values, the offsets
+        where every value starts and a mask of missing values. Every value is followed
+        by a NUL byte, so the whole column is decoded with one split. The arrays can be 
+        memory-mapped, and only the values requested are decoded.
+
+    Attributes
+    --------
+    - StringColumn.data
+        The UTF-8 bytes of all the values, each one followed by a NUL byte, as an uint8 array.
+    - StringColumn.offsets
+        Where every value starts in data, with one more offset for the end of the last one.
+    - StringColumn.nulls
+        True for the missing values.
+
+    Methods
+    -------
+    - StringColumn.take
+    - StringColumn.to_list
+    - StringColumn.release
+    """
+    def __init__(self, data: np.ndarray, offsets: np.ndarray, nulls: np.ndarray):
+        self.data = data
+        self.offsets = offsets
+        self.nulls = nulls
+
+
+    @classmethod
+    def from_values(cls, values: Iterable[Optional[str]]) -> 'StringColumn':
+        """ Builds a column from strings, where None or NaN are missing values.
+        """
+        values = list(values)
+        nulls = np.fromiter((not isinstance(value, str) for value in values), dtype=bool, count=len(values))
+        encoded = [value.encode('utf-8') + b'\x00' if isinstance(value, str) else b'\x00' for value in values]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+        data = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+
+        return cls(data, offsets, nulls)
+
+
+    def __len__(self) -> int:
+        return len(self.nulls)
+
+
+    def __getitem__(self, position: int) -> Optional[str]:
+        if self.nulls[position]:
+            return None
+        return self.data[self.offsets[position]:self.offsets[position + 1] - 1].tobytes().decode('utf-8')
+
+
+    @property
+    def nbytes(self) -> int:
+        """ The bytes of the three arrays of the column.
+        """
+        return self.data.nbytes + self.offsets.nbytes + self.nulls.nbytes
+
+
+    def take(self, positions: Sequence[int]) -> List[Optional[str]]:
+        """ Decodes only the values in the positions provided.
+
+        Parameters
+        ----------
+        positions : Sequence[int]
+            The positions of the values intended to get. They can repeat.
+
+        Returns
+        -------
+        List[Optional[str]]
+            The values, in the same order, with None for the missing ones.
+        """
+        positions = np.asarray(positions, dtype=np.int64)
+        starts, ends = self.offsets[positions], self.offsets[positions + 1] - 1
+        nulls = self.nulls[positions]
+        data = memoryview(self.data)
+
+        return [
+            None if null else str(data[start:end], 'utf-8')
+            for start, end, null in zip(starts.tolist(), ends.tolist(), nulls.tolist())
+        ]
+
+
+    def to_list(self) -> List[Optional[str]]:
+        """ Decodes every value of the column, decoding the bytes only once.
+
+        Returns
+        -------
+        List[Optional[str]]
+            The values, with None for the missing ones.
+        """
+        values = self.data.tobytes().decode('utf-8').split('\x00')[:-1]
+        for position in np.flatnonzero(self.nulls).tolist():
+            values[position] = None
+
+        return values
+
+
+    def release(self, message: str = 'The column was released.'):
+        """ Drops the arrays of the column, so any later read raises ValueError with the 
+            message provided. Used when the memory the arrays point to is freed.
+        """
+        self.data = self.offsets = self.nulls = _ReleasedArray(message)
+
+
+class ColumnarDataset:
+    """
+        The columns of a bundled dataset, as stored in the columnar cache.
+
+    Attributes
+    --------
+    - ColumnarDataset.name
+        The name of the dataset.
+    - ColumnarDataset.columns
+        The names of the columns, in the order of the CSV file.
+    - ColumnarDataset.directory
+        Where the files of the dataset are stored, if it was loaded from disk.
+
+    Methods
+    -------
+    - ColumnarDataset.column
+    - ColumnarDataset.to_pandas
+
+    Examples
+    -------
+    >>> from nlptools.datasets import load_columnar
+    >>> calles = load_columnar('calles')
+    >>> calles.column('provincia').take([0, 1])
+    ['Ciudad Autónoma de Buenos Aires', 'Ciudad Autónoma de Buenos Aires']
+    """
+    def __init__(self, name: str, columns: Dict[str, StringColumn], directory: Optional[str] = None):
+        self.name = name
+        self._columns = columns
+        self.columns = list(columns)
+        self.directory = directory
+
+
+    def __len__(self) -> int:
+        return len(next(iter(self._columns.values()))) if self._columns else 0
+
+
+    def __repr__(self) -> str:
+        return f'ColumnarDataset({self.name!r}, rows={len(self)}, columns={self.columns})'
+
+
+    @property
+    def nbytes(self) -> int:
+        """ The bytes of the arrays of every column.
+        """
+        return sum(column.nbytes for column in self._columns.values())
+
+
+    def column(self, name: str) -> StringColumn:
+        """ Returns one column.
+
+        Raises
+        ------
+        KeyError
+            If the dataset has no column with that name.
+        """
+        if name not in self._columns:
+            raise KeyError(f'Column `{name}` not found. Argument `name` must be one of {self.columns}.')
+        return self._columns[name]
+
+
+    def to_pandas(self, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """ Decodes the dataset, or only some of its columns, into a pandas.DataFrame.
+
+        Parameters
+        ----------
+        columns : Optional[Sequence[str]], optional
+            The columns intended to decode, by default all of them.
+
+        Returns
+        -------
+        pd.DataFrame
+            The same frame that `pd.read_csv` returns with `dtype=str`.
+        """
+        columns = self.columns if columns is None else list(columns)
+        return pd.DataFrame(
+            {name: pd.Series(self.column(name).to_list(), dtype=str) for name in columns},
+            columns=columns
+        )
+
+
+def columnar_cache_dir() -> str:
+    """ Returns the directory of the columnar cache of the bundled datasets.
+
+        It is the `NLPTOOLS_CACHE_DIR` environment variable if it is set. Otherwise it is 
+        the nlptools directory of the user cache: `XDG_CACHE_HOME` or `~/.cache`.
+
+    Returns
+    -------
+    str
+        The root directory. The datasets are stored in a subdirectory per format version.
+    """
+    root = os.environ.get('NLPTOOLS_CACHE_DIR')
+    if not root:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        root = os.path.join(base, 'nlptools')
+
+    return root
+
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(1024 ** 2), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _write_columnar(frame: pd.DataFrame, directory: str, source_sha256: str):
+    """ Writes the columns of a frame in the columnar format, with their checksums.
+
+        The files are written in a temporary directory that is renamed at the end, so
+        several processes can build the same dataset at once without reading a half 
+        written one.
+
+    Parameters
+    ----------
+    frame : pd.DataFrame
+        The dataset, with string columns.
+    directory : str
+        The final directory of the dataset.
+    source_sha256 : str
+        The checksum of the bundled file the frame was read from.
+    """
+    parent = os.path.dirname(directory)
+    os.makedirs(parent, exist_ok=True)
+    temporary = tempfile.mkdtemp(dir=parent, prefix='.building-')
+    try:
+        files = {}
+        for position, name in enumerate(frame.columns):
+            column = StringColumn.from_values(frame[name].tolist())
+            for kind in _COLUMNAR_FILES:
+                file_name = f'{position}.{kind}.npy'
+                np.save(os.path.join(temporary, file_name), getattr(column, kind))
+                files[file_name] = _sha256(os.path.join(temporary, file_name))
+        meta = {
+            'format_version': _COLUMNAR_FORMAT_VERSION,
+            'source_sha256': source_sha256,
+            'rows': len(frame),
+            'columns': list(frame.columns),
+            'files': files,
+        }
+        with open(os.path.join(temporary, 'meta.json'), 'w') as file:
+            json.dump(meta, file)
+        try:
+            os.rename(temporary, directory)
+        except OSError:
+            if not os.path.exists(os.path.join(directory, 'meta.json')):
+                raise
+    finally:
+        shutil.rmtree(temporary, ignore_errors=True)
+
+
+def _read_columnar(name: str, directory: str, verify: bool = False) -> ColumnarDataset:
+    """ Memory-maps a dataset written by `_write_columnar`.
+
+    Raises
+    ------
+    ValueError
+        If the files are not complete, or their checksums are wrong when verified.
+    """
+    with open(os.path.join(directory, 'meta.json')) as file:
+        meta = json.load(file)
+    if meta['format_version'] != _COLUMNAR_FORMAT_VERSION:
+        raise ValueError(f'Dataset `{name}` was stored with format version {meta["format_version"]}.')
+    if verify:
+        for file_name, checksum in meta['files'].items():
+            if _sha256(os.path.join(directory, file_name)) != checksum:
+                raise ValueError(f'Checksum of {file_name} of dataset `{name}` does not match.')
+
+    columns = {}
+    for position, column in enumerate(meta['columns']):
+        arrays = [
+            np.load(os.path.join(directory, f'{position}.{kind}.npy'), mmap_mode='r')
+            for kind in _COLUMNAR_FILES
+        ]
+        if len(arrays[2]) != meta['rows'] or len(arrays[1]) != meta['rows'] + 1 or arrays[1][-1] != len(arrays[0]):
+            raise ValueError(f'Column `{column}` of dataset `{name}` is incomplete.')
+        columns[column] = StringColumn(*arrays)
+
+    return ColumnarDataset(name, columns, directory)
+
+
+def load_columnar(data_name: str, cache_dir: Optional[str] = None, verify: bool = False) -> ColumnarDataset:
+    """ Loads a bundled dataset from the columnar cache, building it the first time.
+
+        The cache is keyed by the format version and the checksum of the bundled file,
+        so a new version of the package or of the format never reads stale data. A 
+        cache that is incomplete, or corrupted when verified, is built again.
+
+    Parameters
+    ----------
+    data_name : str, {'calles', 'companies', 'persons'}
+        Name of the dataset intended to load.
+    cache_dir : Optional[str], optional
+        The root directory of the cache, by default `columnar_cache_dir()`.
+    verify : bool, optional
+        Whether to check the checksums of every file, reading them whole, by default False.
+
+    Returns
+    -------
+    ColumnarDataset
+        The memory-mapped columns of the dataset.
+    """
+    source = pkgutil.get_data('nlptools', f'data/{data_name}.csv.zip')
+    source_sha256 = hashlib.sha256(source).hexdigest()
+    directory = os.path.join(
+        cache_dir or columnar_cache_dir(),
+        f'datasets-v{_COLUMNAR_FORMAT_VERSION}',
+        f'{data_name}-{source_sha256[:16]}'
+    )
+    if os.path.exists(os.path.join(directory, 'meta.json')):
+        try:
+            return _read_columnar(data_name, directory, verify)
+        except (ValueError, OSError, KeyError):
+            shutil.rmtree(directory, ignore_errors=True)
+
+    _write_columnar(_bytes_to_pandas(source), directory, source_sha256)
+    del source
+
+    return _read_columnar(data_name, directory, verify)
+
+
+@lru_cache(maxsize=None)
+def _open_columnar(data_name: str, cache_dir: str) -> ColumnarDataset:
+    """ Memory-maps a bundled dataset once per process and cache directory.
+    """
+    return load_columnar(data_name, cache_dir)
+
+
+def _columnar_or_none(data_name: str) -> Optional[ColumnarDataset]:
+    """ Returns the memory-mapped dataset, or None if the cache directory can not be written or read.
+    """
+    try:
+        return _open_columnar(data_name, columnar_cache_dir())
+    except OSError:
+        return None
+
+
+def _read_source(data_name:str) -> pd.DataFrame:
+    """ Loads a bundled dataset from the columnar cache, or from the CSV file 
+        if the cache directory can not be written or read.
 
     Parameters
     ----------
@@ -39,10 +469,205 @@ def _get_source(data_name:str) -> pd.DataFrame:
     pd.DataFrame
         A pandas.DataFrame with the source data required.
     """
-    if data_name in {'calles', 'companies', 'persons'}:
-        source =  pkgutil.get_data('nlptools', f'data/{data_name}.csv.zip')
-        result = _bytes_to_pandas(source)
-        del source
+    dataset = _columnar_or_none(data_name)
+    if dataset is None:
+        return _read_csv_source(data_name)
+
+    return dataset.to_pandas()
+
+
+def _read_only(frame: pd.DataFrame) -> pd.DataFrame:
+    """ Returns a frame that can be modified without modifying the cached one. With 
+        copy-on-write, as in pandas 3, it is a view that copies only what is written. 
+        With older versions of pandas it is a copy.
+    """
+    if int(pd.__version__.split('.')[0]) >= 3:
+        copy_on_write = True
+    else:
+        try:
+            copy_on_write = pd.get_option('mode.copy_on_write') is True
+        except KeyError:
+            copy_on_write = False
+
+    return frame.copy(deep=not copy_on_write)
+
+
+class DatasetCache:
+    """
+        Keeps the datasets loaded in memory, so every process reads and parses them only
+        once. When the datasets held exceed the memory budget, the least recently used
+        ones are evicted. The frames returned are read-only views: modifying them never 
+        modifies the cached data.
+
+    Attributes
+    --------
+    - DatasetCache.max_bytes
+        The memory budget of the cache, in bytes.
+
+    Methods
+    -------
+    - DatasetCache.get
+    - DatasetCache.info
+    - DatasetCache.clear
+
+    Examples
+    -------
+    >>> from nlptools.datasets import DatasetCache
+    >>> cache = DatasetCache(max_bytes=512 * 1024 ** 2)
+    >>> calles = cache.get('calles')
+    >>> cache.info()['calles']['loads']
+    1
+    """
+    def __init__(self, max_bytes: int = _DEFAULT_CACHE_BYTES, loader: Callable = _read_source):
+        self.max_bytes = max_bytes
+        self._loader = loader
+        self._frames = OrderedDict()
+        self._stats = {}
+        self._lock = threading.RLock()
+
+
+    def __contains__(self, data_name: str) -> bool:
+        return data_name in self._frames
+
+
+    def __repr__(self) -> str:
+        return f'DatasetCache(max_bytes={self.max_bytes}, datasets={list(self._frames)})'
+
+
+    @property
+    def nbytes(self) -> int:
+        """ The memory held by the cached datasets, in bytes.
+        """
+        return sum(self._stats[name]['bytes'] for name in self._frames)
+
+
+    def get(self, data_name: str) -> pd.DataFrame:
+        """ Returns a dataset, loading it only if it is not in the cache.
+
+        Parameters
+        ----------
+        data_name : str
+            Name of the dataset intended to load.
+
+        Returns
+        -------
+        pd.DataFrame
+            A read-only view of the dataset.
+        """
+        with self._lock:
+            stats = self._stats.setdefault(
+                data_name, {'bytes': 0, 'load_time': 0.0, 'loads': 0, 'hits': 0}
+            )
+            if data_name in self._frames:
+                self._frames.move_to_end(data_name)
+                stats['hits'] += 1
+                return _read_only(self._frames[data_name])
+
+            start = time.perf_counter()
+            frame = self._loader(data_name)
+            stats['load_time'] = time.perf_counter() - start
+            stats['bytes'] = int(frame.memory_usage(index=True, deep=True).sum())
+            stats['loads'] += 1
+            if stats['bytes'] <= self.max_bytes:
+                self._frames[data_name] = frame
+                self._evict()
+
+            return _read_only(frame)
+
+
+    def _evict(self):
+        """ Evicts the least recently used datasets until the cache fits its budget.
+        """
+        while self._frames and self.nbytes > self.max_bytes:
+            self._frames.popitem(last=False)
+
+
+    def info(self) -> Dict[str, dict]:
+        """ Returns, for every dataset requested, whether it is cached, the bytes it holds, 
+            the seconds its last load took and how many times it was loaded and found.
+        """
+        with self._lock:
+            return {
+                name: {'cached': name in self._frames, **stats}
+                for name, stats in self._stats.items()
+            }
+
+
+    def clear(self, data_name: Optional[str] = None):
+        """ Empties the cache, or removes only one dataset from it.
+
+        Parameters
+        ----------
+        data_name : Optional[str], optional
+            The dataset intended to remove. If None, every dataset is removed and 
+            the statistics are reset, by default None.
+        """
+        with self._lock:
+            if data_name is None:
+                self._frames.clear()
+                self._stats.clear()
+            else:
+                self._frames.pop(data_name, None)
+
+
+_DATASET_CACHE = DatasetCache()
+
+
+def dataset_cache_info() -> Dict[str, dict]:
+    """ Returns the statistics of the process-wide cache of the bundled datasets.
+
+    Returns
+    -------
+    Dict[str, dict]
+        For every dataset requested, whether it is cached, the bytes it holds, the seconds 
+        its last load took and how many times it was loaded and found in the cache.
+    """
+    return _DATASET_CACHE.info()
+
+
+def clear_dataset_cache(data_name: Optional[str] = None):
+    """ Empties the process-wide cache of the bundled datasets, or removes one dataset from it.
+
+    Parameters
+    ----------
+    data_name : Optional[str], optional
+        The dataset intended to remove. If None, every dataset is removed and the 
+        memory-mapped datasets are closed, by default None.
+    """
+    _DATASET_CACHE.clear(data_name)
+    if data_name is None:
+        _open_columnar.cache_clear()
+
+
+def set_dataset_cache_budget(max_bytes: int):
+    """ Changes the memory budget of the process-wide cache of the bundled datasets, 
+        evicting the least recently used datasets if they do not fit.
+
+    Parameters
+    ----------
+    max_bytes : int
+        The new budget, in bytes.
+    """
+    with _DATASET_CACHE._lock:
+        _DATASET_CACHE.max_bytes = max_bytes
+        _DATASET_CACHE._evict()
+
+
+def _get_source(data_name:str) -> pd.DataFrame:
+    """ Loads a data source for internal usage, reading it only the first time.
+
+    Parameters
+    ----------
+    data_name : str, {'calles', 'companies', 'persons'}
+        Name of the dataset intended to load.
+
+    Returns
+    -------
+    pd.DataFrame
+        A read-only view of the source data required.
+    """
+    if data_name in _DATASET_NAMES:
+        result = _DATASET_CACHE.get(data_name)
     else:
         result = None
         print(f'No dataset found with name {data_name}.')
@@ -50,21 +675,370 @@ def _get_source(data_name:str) -> pd.DataFrame:
     return result
 
 
-def load_dataset(data_name:str):
+_SHARED_ALIGNMENT = 8
+
+_ATTACHED = {}
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """ Attaches to a block of shared memory created by another process, without
+        registering it in the resource tracker, so the block is released only by its owner.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        from multiprocessing import resource_tracker
+        register = resource_tracker.register
+        resource_tracker.register = lambda *args, **kwargs: None
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+def _shared_datasets(block: shared_memory.SharedMemory, layout: list) -> Dict[str, ColumnarDataset]:
+    """ Builds the datasets whose arrays are stored in a block of shared memory, without copying them.
+    """
+    arrays = {}
+    for data_name, column, kind, dtype, offset, length in layout:
+        arrays.setdefault(data_name, {}).setdefault(column, {})[kind] = np.ndarray(
+            (length,), dtype=dtype, buffer=block.buf, offset=offset
+        )
+
+    return {
+        data_name: ColumnarDataset(
+            data_name,
+            {column: StringColumn(*[kinds[kind] for kind in _COLUMNAR_FILES]) for column, kinds in columns.items()}
+        )
+        for data_name, columns in arrays.items()
+    }
+
+
+class SharedDatasetsHandle:
+    """
+        A reference to bundled datasets stored in shared memory by `share_datasets`. It
+        only holds the name of the block and where every array is, so it pickles in a
+        few hundred bytes and can be sent to any worker process. The first time a process
+        uses it, it attaches to the block and every column is a view of the shared memory.
+
+    Attributes
+    --------
+    - SharedDatasetsHandle.name
+        The name of the block of shared memory.
+    - SharedDatasetsHandle.data_names
+        The datasets stored.
+
+    Methods
+    -------
+    - SharedDatasetsHandle.dataset
+    """
+    def __init__(self, name: str, size: int, layout: list):
+        self.name = name
+        self.size = size
+        self.layout = layout
+        self.data_names = sorted({data_name for data_name, *_ in layout})
+
+
+    def __repr__(self) -> str:
+        return f'SharedDatasetsHandle({self.name!r}, data_names={self.data_names})'
+
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, SharedDatasetsHandle) and other.name == self.name
+
+
+    def __hash__(self) -> int:
+        return hash(self.name)
+
+
+    def __contains__(self, data_name: str) -> bool:
+        return data_name in self.data_names
+
+
+    def dataset(self, data_name: str) -> ColumnarDataset:
+        """ Returns a dataset whose columns are views of the shared memory.
+
+        Raises
+        ------
+        KeyError
+            If the dataset is not stored in the shared memory.
+        """
+        if data_name not in self.data_names:
+            raise KeyError(f'Dataset `{data_name}` not shared. Argument `data_name` must be one of {self.data_names}.')
+        if self.name not in _ATTACHED:
+            block = _attach_shared_memory(self.name)
+            _ATTACHED[self.name] = (block, _shared_datasets(block, self.layout))
+
+        return _ATTACHED[self.name][1][data_name]
+
+
+class SharedDatasets:
+    """
+        Bundled datasets copied once into a block of shared memory, as the string buffers,
+        offsets and masks of missing values of the columnar format. Worker processes read
+        them through `SharedDatasets.handle` instead of loading their own copies. The
+        process that creates it owns the block and must close it when the workers end.
+
+    Attributes
+    --------
+    - SharedDatasets.handle
+        The handle to send to the workers.
+
+    Methods
+    -------
+    - SharedDatasets.close
+
+    Examples
+    -------
+    >>> from multiprocessing import Pool
+    >>> from functools import partial
+    >>> from nlptools.datasets import share_datasets
+    >>> from nlptools.data_augmentation import random_name_generator
+    >>> with share_datasets(['companies']) as shared:
+    ...     with Pool(4) as pool:
+    ...         names = pool.map(partial(random_name_generator, name_type='company', shared=shared.handle), [100] * 8)
+    """
+    def __init__(self, datasets: Dict[str, ColumnarDataset]):
+        layout, size = [], 0
+        for data_name, dataset in datasets.items():
+            for column in dataset.columns:
+                string_column = dataset.column(column)
+                for kind in _COLUMNAR_FILES:
+                    array = getattr(string_column, kind)
+                    layout.append((data_name, column, kind, array.dtype.str, size, len(array)))
+                    size += -(-array.nbytes // _SHARED_ALIGNMENT) * _SHARED_ALIGNMENT
+
+        self._block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        for data_name, column, kind, dtype, offset, length in layout:
+            array = getattr(datasets[data_name].column(column), kind)
+            np.ndarray((length,), dtype=dtype, buffer=self._block.buf, offset=offset)[:] = array
+
+        self.handle = SharedDatasetsHandle(self._block.name, size, layout)
+        _ATTACHED[self._block.name] = (self._block, _shared_datasets(self._block, layout))
+
+
+    def __repr__(self) -> str:
+        return f'SharedDatasets({self.handle.name!r}, data_names={self.handle.data_names}, bytes={self.handle.size})'
+
+
+    def __enter__(self) -> 'SharedDatasets':
+        return self
+
+
+    def __exit__(self, *args):
+        self.close()
+
+
+    def close(self):
+        """ Releases the shared memory. The handles stop working in every process, and
+            the columns this process got from them raise ValueError when they are read.
+        """
+        if self._block is None:
+            return
+        _, datasets = _ATTACHED.pop(self._block.name)
+        for dataset in datasets.values():
+            for column in dataset.columns:
+                dataset.column(column).release(f'The shared memory `{self._block.name}` was closed.')
+        self._block.close()
+        self._block.unlink()
+        self._block = None
+
+
+def share_datasets(
+        data_names: Optional[Sequence[str]] = None,
+        columns: Optional[Dict[str, Sequence[str]]] = None
+    ) -> SharedDatasets:
+    """ Copies bundled datasets into shared memory, to read them from several processes.
+
+    Parameters
+    ----------
+    data_names : Optional[Sequence[str]], optional
+        The datasets intended to share, by default all of them.
+    columns : Optional[Dict[str, Sequence[str]]], optional
+        The columns to share of every dataset, by default all of them.
+
+    Returns
+    -------
+    SharedDatasets
+        The owner of the shared memory. Send its `handle` to the workers, and close it after them.
+
+    Raises
+    ------
+    KeyError
+        If a dataset or a column do not exist.
+    """
+    data_names = sorted(_DATASET_NAMES) if data_names is None else list(data_names)
+    columns = columns or {}
+    datasets = {}
+    for data_name in data_names:
+        if data_name not in _DATASET_NAMES:
+            raise KeyError(f'Dataset `{data_name}` not found. Argument `data_name` must be one of {sorted(_DATASET_NAMES)}.')
+        dataset = _columnar_or_none(data_name)
+        if dataset is None:
+            frame = _read_csv_source(data_name)
+            dataset = ColumnarDataset(data_name, {column: StringColumn.from_values(frame[column]) for column in frame.columns})
+        names = columns.get(data_name, dataset.columns)
+        datasets[data_name] = ColumnarDataset(data_name, {column: dataset.column(column) for column in names})
+
+    return SharedDatasets(datasets)
+
+
+def sample_positions(
+        rows: int,
+        n: Optional[int] = None,
+        replace: bool = False,
+        seed: Optional[int] = None
+    ) -> np.ndarray:
+    """ Draws the positions of the rows of a sample, before gathering any value.
+
+    Parameters
+    ----------
+    rows : int
+        The number of rows of the dataset.
+    n : Optional[int], optional
+        The size of the sample. If None, every row in order, by default None.
+    replace : bool, optional
+        Whether a row can be drawn more than once, by default False.
+    seed : Optional[int], optional
+        The seed of the random generator, to replicate the sample, by default None.
+
+    Returns
+    -------
+    np.ndarray
+        The positions of the rows, as int64.
+
+    Raises
+    ------
+    ValueError
+        If n is bigger than the number of rows and replace is False.
+    """
+    if n is None:
+        return np.arange(rows, dtype=np.int64)
+    if n > rows and not replace:
+        raise ValueError(f'Cannot take a sample of {n} rows without replacement from {rows} rows.')
+
+    return np.random.default_rng(seed).choice(rows, size=n, replace=replace).astype(np.int64)
+
+
+def load_source(
+        data_name: str,
+        columns: Optional[Sequence[str]] = None,
+        n: Optional[int] = None,
+        replace: bool = False,
+        seed: Optional[int] = None,
+        shared: Optional[SharedDatasetsHandle] = None
+    ) -> pd.DataFrame:
+    """ Loads only some columns of a bundled dataset, and optionally only a sample of its rows.
+
+        The positions of the sample are drawn first and only those values are decoded 
+        from the memory-mapped dataset, so the whole dataset is never built. The same 
+        arguments always return the same values, with or without the columnar cache.
+
+    Parameters
+    ----------
+    data_name : str, {'calles', 'companies', 'persons'}
+        Name of the dataset intended to load.
+    columns : Optional[Sequence[str]], optional
+        The columns intended to load, by default all of them.
+    n : Optional[int], optional
+        The size of the sample. If None, every row, by default None.
+    replace : bool, optional
+        Whether a row can be drawn more than once, by default False.
+    seed : Optional[int], optional
+        The seed of the sample, by default None.
+    shared : Optional[SharedDatasetsHandle], optional
+        Reads the dataset from shared memory if the handle stores it, by default None.
+
+    Returns
+    -------
+    pd.DataFrame
+        The values, indexed by the position of their rows in the dataset.
+
+    Raises
+    ------
+    KeyError
+        If the dataset or a column do not exist.
+    ValueError
+        If n is bigger than the number of rows and replace is False.
+
+    Examples
+    -------
+    >>> from nlptools.datasets import load_source
+    >>> load_source('companies', ['name'], n=2, seed=1)
+                                  name
+    97240                    KIMORA SA
+    105179  AGROLAPORFIA SERVICIOS SRL
+    """
+    if data_name not in _DATASET_NAMES:
+        raise KeyError(f'Dataset `{data_name}` not found. Argument `data_name` must be one of {sorted(_DATASET_NAMES)}.')
+    if shared is not None and data_name in shared:
+        dataset = shared.dataset(data_name)
+    else:
+        dataset = _columnar_or_none(data_name)
+
+    if dataset is None:
+        frame = _get_source(data_name)
+        columns = list(frame.columns) if columns is None else list(columns)
+        missing = [column for column in columns if column not in frame.columns]
+        if missing:
+            raise KeyError(f'Columns {missing} not found. Argument `columns` must be among {list(frame.columns)}.')
+        positions = sample_positions(len(frame), n, replace, seed)
+        result = frame.iloc[positions][columns] if n is not None else frame[columns]
+        return result.set_axis(pd.Index(positions), axis=0)
+
+    columns = dataset.columns if columns is None else list(columns)
+    positions = sample_positions(len(dataset), n, replace, seed)
+    if n is None:
+        return dataset.to_pandas(columns)
+
+    return pd.DataFrame(
+        {name: pd.Series(dataset.column(name).take(positions), dtype=str) for name in columns},
+        columns=columns
+    ).set_axis(pd.Index(positions), axis=0)
+
+
+def estatutos_dir() -> str:
+    """ Returns the directory of the corpus of estatutos.
+
+    Returns
+    -------
+    str
+        The path in the environment variable `NLPTOOLS_ESTATUTOS_DIR`, or `data/estatutos`
+        relative to the working directory.
+    """
+    return os.environ.get('NLPTOOLS_ESTATUTOS_DIR', os.path.join('data', 'estatutos'))
+
+
+def load_dataset(data_name:str, root:Optional[str]=None):
     """ Function to call datasets for model training.
 
     Parameters
     ----------
     data_name : str, {'estatutos'}
         Name of the dataset intended to load.
+    root : Optional[str], optional
+        The directory of the dataset. If None, `estatutos_dir()` is used, by default None.
 
     Returns
     -------
     [type]
         Every dataset has a different output. Check the type.
+        For `estatutos` it is a `corpus.ShardedCorpus` that streams the tagged documents
+        of `<root>/corpus`. If that corpus does not exist yet, the list of spacy examples
+        of the legacy pickle, `<root>/tagged/spacy_dataset_2020-5-6.pkl`, is returned.
+
+    Raises
+    ------
+    KeyError
+        If the dataset does not exist.
     """
-    if data_name == 'estatutos':
-        with open('data/estatutos/tagged/spacy_dataset_2020-5-6.pkl', 'rb') as file:
-            result = pickle.load(file)
+    if data_name != 'estatutos':
+        raise KeyError("Argument `data_name` must be one of 'estatutos'.")
+
+    root = estatutos_dir() if root is None else root
+    if is_corpus(os.path.join(root, 'corpus')):
+        return ShardedCorpus(os.path.join(root, 'corpus'))
+    with open(os.path.join(root, 'tagged', 'spacy_dataset_2020-5-6.pkl'), 'rb') as file:
+        result = pickle.load(file)
 
     return result
\ No newline at end of file
@@ -0,0 +1,457 @@
+"""
+    A suite of tools to find near-duplicate documents in a corpus, such as
+    re-scans of the same contract. Cheap blocking keys shortlist the pairs
+    of documents worth comparing, and only those pairs are scored with rapidfuzz.
+
+Classes
+-------
+- DuplicateReport
+    The clusters of duplicated documents and the statistics of the run.
+"""
+import os
+import re
+import time
+import zlib
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+import numpy as np
+from rapidfuzz import fuzz
+from nlptools.comparison import _get_processor, _score_cutoff
+from nlptools.parsing import remove_tildes
+
+
+_BLOCKING_KEYS = ['razon_social', 'cuit', 'shingles']
+
+_CUIT_PATTERN = re.compile(r'\b(\d{2})\s?-?\s?(\d{8})\s?-?\s?(\d)\b')
+
+_NON_ALPHANUMERIC = re.compile(r'[\W_]+')
+
+_WORKER_TEXTS = []
+
+
+class DuplicateReport:
+    """
+        The result of searching near-duplicates in a corpus.
+
+    Attributes
+    --------
+    - DuplicateReport.clusters
+        A list of clusters, each one a sorted list with the `doc_id` of
+        documents that are duplicates of each other. Only clusters with
+        more than one document are included.
+    - DuplicateReport.pairs
+        A list of tuples `(doc_id, doc_id, score)` with every pair of
+        documents scored over the threshold.
+    - DuplicateReport.stats
+        A dictionary with the size of the problem and the throughput of
+        every stage, useful to see how the search scales with the corpus.
+    """
+    def __init__(
+            self,
+            clusters: List[list],
+            pairs: List[tuple],
+            stats: Dict[str, float]
+        ):
+        self.clusters = clusters
+        self.pairs = pairs
+        self.stats = stats
+
+
+    def __repr__(self) -> str:
+        return f'DuplicateReport({len(self.clusters)} clusters, {len(self.pairs)} pairs)'
+
+
+def _normalize_key(text: str) -> str:
+    """ Lowercases a text, removes its accents and keeps only letters and numbers.
+
+    Parameters
+    ----------
+    text : str
+        The text intended to use as a blocking key.
+
+    Returns
+    -------
+    str
+        The normalized key.
+    """
+    return _NON_ALPHANUMERIC.sub('', remove_tildes(text.lower()))
+
+
+def _document_fields(document: Union[dict, str], position: int) -> Tuple[object, str, List[dict]]:
+    """ Extracts the id, the text and the entities from a document.
+
+    Parameters
+    ----------
+    document : Union[dict, str]
+        A tagged document with the keys `doc_id`, `text` and `entities`, or just a text.
+    position : int
+        The position of the document in the corpus, used as id when there is no `doc_id`.
+
+    Returns
+    -------
+    Tuple[object, str, List[dict]]
+        The id, the text and the tagged entities of the document.
+    """
+    if isinstance(document, str):
+        return position, document, []
+
+    entities = document.get('entities') or {}
+    tags = entities.get('tags', []) if isinstance(entities, dict) else []
+
+    return document.get('doc_id', position), document.get('text') or '', tags
+
+
+def _normalize_key_words(text: str) -> List[str]:
+    """ Splits a text into normalized words.
+
+    Parameters
+    ----------
+    text : str
+        The text intended to split.
+
+    Returns
+    -------
+    List[str]
+        The words of the text, lowercased, without accents nor punctuation.
+    """
+    words = [
+        _NON_ALPHANUMERIC.sub('', token) 
+        for token in remove_tildes(text.lower()).split()
+    ]
+
+    return [word for word in words if word]
+
+
+def _shingle_signature(
+        text: str,
+        shingle_size: int,
+        seeds: np.ndarray
+    ) -> Optional[np.ndarray]:
+    """ Computes the MinHash signature of the word shingles of a text.
+
+    Parameters
+    ----------
+    text : str
+        The text of the document.
+    shingle_size : int
+        The number of consecutive words in every shingle.
+    seeds : np.ndarray
+        An array of shape (2, num_perm) with the odd multipliers and the offsets 
+        of the multiply-shift hash functions.
+
+    Returns
+    -------
+    Optional[np.ndarray]
+        The signature, with one value per hash function, or None if the text has no words.
+    """
+    words = _normalize_key_words(text)
+    if not words:
+        return None
+
+    shingles = {
+        ' '.join(words[i:i + shingle_size])
+        for i in range(max(1, len(words) - shingle_size + 1))
+    }
+    hashes = np.fromiter(
+        (zlib.crc32(shingle.encode('utf-8')) for shingle in shingles),
+        dtype=np.uint64,
+        count=len(shingles)
+    )
+    permuted = (hashes[:, None] * seeds[0][None, :] + seeds[1][None, :]) >> np.uint64(32)
+
+    return permuted.min(axis=0)
+
+
+def _blocking_keys(
+        text: str,
+        tags: List[dict],
+        blocking: Sequence[str],
+        shingle_size: int,
+        seeds: np.ndarray,
+        bands: int
+    ) -> Set[str]:
+    """ Computes every blocking key of a document.
+
+    Parameters
+    ----------
+    text : str
+        The text of the document.
+    tags : List[dict]
+        The tagged entities of the document.
+    blocking : Sequence[str]
+        The kinds of blocking keys intended to compute.
+    shingle_size : int
+        The number of consecutive words in every shingle.
+    seeds : np.ndarray
+        The coefficients of the MinHash functions.
+    bands : int
+        The number of bands the MinHash signature is split into.
+
+    Returns
+    -------
+    Set[str]
+        The keys. Documents sharing any key are compared.
+    """
+    keys = set()
+    if 'razon_social' in blocking:
+        keys.update(
+            f'razon_social:{_normalize_key(tag.get("text") or "")}'
+            for tag in tags
+            if tag.get('tag') == 'razon_social' and _normalize_key(tag.get('text') or '')
+        )
+    if 'cuit' in blocking:
+        keys.update(
+            f'cuit:{"".join(match.groups())}'
+            for match in _CUIT_PATTERN.finditer(text)
+        )
+    if 'shingles' in blocking:
+        signature = _shingle_signature(text, shingle_size, seeds)
+        if signature is not None:
+            keys.update(
+                f'band{i}:{band.tobytes().hex()}'
+                for i, band in enumerate(np.array_split(signature, bands))
+            )
+
+    return keys
+
+
+def _candidate_pairs(
+        keys_per_document: List[Set[str]],
+        max_block_size: int
+    ) -> Tuple[List[Tuple[int, int]], int, int]:
+    """ Builds every pair of documents sharing a blocking key.
+
+    Parameters
+    ----------
+    keys_per_document : List[Set[str]]
+        The blocking keys of every document.
+    max_block_size : int
+        Blocks with more documents than this are considered too generic and skipped.
+
+    Returns
+    -------
+    Tuple[List[Tuple[int, int]], int, int]
+        The sorted candidate pairs, the number of blocks used and the number of blocks skipped.
+    """
+    blocks = {}
+    for position, keys in enumerate(keys_per_document):
+        for key in keys:
+            blocks.setdefault(key, []).append(position)
+
+    pairs = set()
+    used = skipped = 0
+    for members in blocks.values():
+        if len(members) < 2:
+            continue
+        if len(members) > max_block_size:
+            skipped += 1
+            continue
+        used += 1
+        pairs.update(itertools.combinations(members, 2))
+
+    return sorted(pairs), used, skipped
+
+
+def _init_worker(texts: List[str]):
+    """ Keeps the prepared texts in every worker process, so only indices travel with each chunk.
+
+    Parameters
+    ----------
+    texts : List[str]
+        The prepared texts of the corpus.
+    """
+    global _WORKER_TEXTS
+    _WORKER_TEXTS = texts
+
+
+def _score_chunk(
+        pairs: List[Tuple[int, int]],
+        threshold: float,
+        texts: Optional[List[str]] = None
+    ) -> List[Tuple[int, int, float]]:
+    """ Scores a chunk of candidate pairs.
+
+    Parameters
+    ----------
+    pairs : List[Tuple[int, int]]
+        The positions of the documents to compare.
+    threshold : float
+        The level of similarity required for considering them duplicates.
+    texts : Optional[List[str]], optional
+        The prepared texts. If not provided, the ones given to the worker are used, by default None.
+
+    Returns
+    -------
+    List[Tuple[int, int, float]]
+        The pairs scored over the threshold, with their score in the (0, 1) scale.
+    """
+    texts = _WORKER_TEXTS if texts is None else texts
+    cutoff = _score_cutoff(threshold)
+    result = []
+    for i, j in pairs:
+        if texts[i] and texts[j]:
+            score = fuzz.ratio(texts[i], texts[j], score_cutoff=cutoff) / 100
+            if score > threshold:
+                result.append((i, j, score))
+
+    return result
+
+
+def _clusters(n: int, pairs: List[Tuple[int, int, float]]) -> List[List[int]]:
+    """ Groups the documents connected by duplicated pairs using union-find.
+
+    Parameters
+    ----------
+    n : int
+        The number of documents.
+    pairs : List[Tuple[int, int, float]]
+        The duplicated pairs.
+
+    Returns
+    -------
+    List[List[int]]
+        The positions of the documents of every cluster with more than one document.
+    """
+    parents = list(range(n))
+
+    def find(x):
+        while parents[x] != x:
+            parents[x] = parents[parents[x]]
+            x = parents[x]
+        return x
+
+    for i, j, _ in pairs:
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j:
+            parents[max(root_i, root_j)] = min(root_i, root_j)
+
+    groups = {}
+    for position in range(n):
+        groups.setdefault(find(position), []).append(position)
+
+    return [members for members in groups.values() if len(members) > 1]
+
+
+def find_duplicates(
+        documents: Iterable[Union[dict, str]],
+        threshold: float = 0.9,
+        ratio_func: str = 'ratio',
+        blocking: Sequence[str] = ('razon_social', 'cuit', 'shingles'),
+        shingle_size: int = 5,
+        num_perm: int = 32,
+        bands: int = 8,
+        max_block_size: int = 1000,
+        n_jobs: Optional[int] = None,
+        chunksize: int = 500,
+        seed: int = 0
+    ) -> DuplicateReport:
+    """ Finds the near-duplicated documents of a corpus without comparing every pair.
+
+    Parameters
+    ----------
+    documents : Iterable[Union[dict, str]]
+        Tagged documents with the keys `doc_id`, `text` and `entities`, or plain texts.
+    threshold : float, optional
+        The level of similarity required for considering two documents duplicates, by default 0.9.
+    ratio_func : str {'ratio', 'QRatio'}, optional
+        The function that will evaluate the similarity of the texts, by default 'ratio'.
+    blocking : Sequence[str], optional
+        The blocking keys used to shortlist the pairs: the normalized `razon_social` entity,
+        the CUITs found in the text and the MinHash bands of the word shingles, by default all of them.
+    shingle_size : int, optional
+        The number of consecutive words in every shingle, by default 5.
+    num_perm : int, optional
+        The number of hash functions of the MinHash signature, by default 32.
+    bands : int, optional
+        The number of bands the signature is split into. More bands find more
+        candidates with lower similarity, by default 8.
+    max_block_size : int, optional
+        Blocks with more documents than this are considered too generic and skipped, by default 1000.
+    n_jobs : Optional[int], optional
+        The number of processes used to score the pairs. If set to 1, no process pool
+        is created. If None, every core is used, by default None.
+    chunksize : int, optional
+        The number of pairs sent to a process at once, by default 500.
+    seed : int, optional
+        The seed of the MinHash functions, by default 0.
+
+    Returns
+    -------
+    DuplicateReport
+        The clusters of duplicated documents, the duplicated pairs and the statistics of the run.
+
+    Raises
+    ------
+    KeyError
+        If a blocking key provided is not among the supported ones.
+
+    Examples
+    -------
+    >>> from nlptools.deduplication import find_duplicates
+    >>> report = find_duplicates(['el capital social es de pesos cincuenta mil',
+    ...                           'el capital social es de pesos cincuenta mil.',
+    ...                           'la sociedad tiene por objeto la compraventa'], n_jobs=1)
+    >>> report.clusters
+    [[0, 1]]
+    """
+    unknown = [key for key in blocking if key not in _BLOCKING_KEYS]
+    if unknown:
+        raise KeyError(f'{unknown} are not valid options. Please choose among the following {_BLOCKING_KEYS}')
+
+    start_time = time.perf_counter()
+    processor = _get_processor(ratio_func)
+    random_state = np.random.RandomState(seed)
+    seeds = random_state.randint(0, 2 ** 64 - 1, size=(2, num_perm), dtype=np.uint64) | np.uint64(1)
+
+    doc_ids, texts, keys_per_document = [], [], []
+    for position, document in enumerate(documents):
+        doc_id, text, tags = _document_fields(document, position)
+        doc_ids.append(doc_id)
+        texts.append(processor(text) if processor else text)
+        keys_per_document.append(_blocking_keys(text, tags, blocking, shingle_size, seeds, bands))
+
+    pairs, used_blocks, skipped_blocks = _candidate_pairs(keys_per_document, max_block_size)
+    blocking_time = time.perf_counter()
+
+    chunks = [pairs[i:i + chunksize] for i in range(0, len(pairs), chunksize)]
+    n_jobs = n_jobs or os.cpu_count() or 1
+    if n_jobs == 1 or len(chunks) <= 1:
+        scored = [_score_chunk(chunk, threshold, texts) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker, initargs=(texts,)) as executor:
+            scored = list(executor.map(_score_chunk, chunks, itertools.repeat(threshold)))
+    duplicated = [pair for chunk in scored for pair in chunk]
+    scoring_time = time.perf_counter()
+
+    clusters = [
+        [doc_ids[position] for position in members]
+        for members in _clusters(len(texts), duplicated)
+    ]
+    end_time = time.perf_counter()
+
+    n = len(texts)
+    possible_pairs = n * (n - 1) // 2
+    total = end_time - start_time
+    stats = {
+        'documents': n,
+        'possible_pairs': possible_pairs,
+        'candidate_pairs': len(pairs),
+        'duplicated_pairs': len(duplicated),
+        'clusters': len(clusters),
+        'blocks': used_blocks,
+        'skipped_blocks': skipped_blocks,
+        'reduction_ratio': 1 - len(pairs) / possible_pairs if possible_pairs else 0.0,
+        'n_jobs': n_jobs,
+        'blocking_seconds': blocking_time - start_time,
+        'scoring_seconds': scoring_time - blocking_time,
+        'total_seconds': total,
+        'documents_per_second': n / total if total else float('inf'),
+        'pairs_per_second': len(pairs) / (scoring_time - blocking_time) if scoring_time > blocking_time else float('inf'),
+    }
+
+    return DuplicateReport(
+        clusters,
+        [(doc_ids[i], doc_ids[j], score) for i, j, score in duplicated],
+        stats
+    )
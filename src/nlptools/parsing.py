@@ -1,8 +1,165 @@
+import datetime
 import re
-from copy import deepcopy
-from typing import Union
-from spa2num.converter import to_number
-from num2words import num2words
+import unicodedata
+from functools import lru_cache
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+import numpy as np
+
+
+_TILDES = {
+    'Á': 'A', 'É': 'E', 'Í': 'I', 'Ó': 'O', 'Ú': 'U',
+    'Ä': 'A', 'Ë': 'E', 'Ï': 'I', 'Ö': 'O', 'Ü': 'U',
+    'À': 'A', 'È': 'E', 'Ì': 'I', 'Ò': 'O', 'Ù': 'U',
+    'á': 'a', 'é': 'e', 'í': 'i', 'ó': 'o', 'ú': 'u',
+    'ä': 'a', 'ë': 'e', 'ï': 'i', 'ö': 'o', 'ü': 'u',
+    'à': 'a', 'è': 'e', 'ì': 'i', 'ò': 'o', 'ù': 'u'
+}
+
+_LOWER_TILDES = {k: v.lower() for k, v in _TILDES.items()}
+
+_TILDES_PATTERN = re.compile(f"[{''.join(_TILDES)}]")
+
+_COMBINING_MARKS = re.compile('[\u0300-\u036f\u1ab0-\u1aff\u1dc0-\u1dff\u20d0-\u20ff\ufe20-\ufe2f]+')
+
+_SEPARATOR = '\x00'
+
+_CONVERSION_CACHE_SIZE = 8192
+
+
+class _ConversionCache:
+    """
+        A bounded cache for a conversion function: a table of precomputed hot values, 
+        built the first time it is needed, and an LRU cache for everything else.
+    """
+    def __init__(self, convert: Callable, build_table: Callable, maxsize: int = _CONVERSION_CACHE_SIZE):
+        self._convert = convert
+        self._build_table = build_table
+        self._table = None
+        self._table_hits = 0
+        self._cached = lru_cache(maxsize=maxsize)(convert)
+
+
+    @property
+    def table(self) -> dict:
+        """ The precomputed hot values, built the first time they are needed.
+        """
+        if self._table is None:
+            self._table = self._build_table()
+        return self._table
+
+
+    def __call__(self, key: Hashable):
+        if key in self.table:
+            self._table_hits += 1
+            return self._table[key]
+
+        return self._cached(key)
+
+
+    def info(self) -> dict:
+        """ Returns the hits of the table and the hits, misses and size of the LRU cache.
+        """
+        lru = self._cached.cache_info()
+        return {
+            'table_hits': self._table_hits,
+            'table_size': len(self._table or ()),
+            'hits': lru.hits,
+            'misses': lru.misses,
+            'maxsize': lru.maxsize,
+            'currsize': lru.currsize,
+        }
+
+
+    def clear(self):
+        """ Empties the LRU cache and resets the statistics, keeping the table.
+        """
+        self._table_hits = 0
+        self._cached.cache_clear()
+
+
+def _number_key(number, lang: str, to: str, kwargs: dict) -> Optional[tuple]:
+    """ Builds the cache key of a call to num2words, or None if it can not be cached.
+
+    Parameters
+    ----------
+    number : {str, int, float}
+        The number intended to convert. Strings of digits share the key of their integer, 
+        since num2words spells them the same way.
+    lang : str
+        The output language.
+    to : str
+        The type of grammatical expression.
+    kwargs : dict
+        Other arguments for num2words.
+
+    Returns
+    -------
+    Optional[tuple]
+        A hashable key, or None if some argument is not hashable.
+    """
+    if isinstance(number, str) and number.isascii() and number.isdigit():
+        number = int(number)
+    key = (number, lang, to, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
+
+
+def _num2words(*args, **kwargs) -> str:
+    """ Calls num2words, imported the first time a number is spelled.
+    """
+    from num2words import num2words
+    return num2words(*args, **kwargs)
+
+
+def _to_number(text: str) -> Union[str, int]:
+    """ Calls spa2num.converter.to_number, imported the first time a text is parsed.
+    """
+    from spa2num.converter import to_number
+    return to_number(text)
+
+
+def _convert_number(key: tuple) -> str:
+    number, lang, to, kwargs = key
+    return _num2words(number=number, lang=lang, to=to, **dict(kwargs))
+
+
+def _number_table() -> dict:
+    """ Spells the numbers generated most often: days, years and amounts in multiples of 5.000.
+    """
+    cardinals = set(range(0, 101)) | set(range(1900, 2051)) | set(range(0, 1000001, 5000))
+    table = {
+        (number, 'es', 'cardinal', ()): _convert_number((number, 'es', 'cardinal', ()))
+        for number in sorted(cardinals)
+    }
+    table.update({
+        (number, 'es', 'ordinal', ()): _convert_number((number, 'es', 'ordinal', ()))
+        for number in range(1, 32)
+    })
+
+    return table
+
+
+def _words_table() -> dict:
+    """ Parses the spelling of the numbers of the hot table that spa2num understands.
+    """
+    table = {}
+    for (_, _, to, _), words in _NUMBER_TO_WORDS_CACHE.table.items():
+        if to == 'cardinal':
+            try:
+                table[words] = _to_number(words)
+            except (ValueError, KeyError, IndexError):
+                pass
+
+    return table
+
+
+_NUMBER_TO_WORDS_CACHE = _ConversionCache(_convert_number, _number_table)
+
+_WORDS_TO_NUMBERS_CACHE = _ConversionCache(_to_number, _words_table)
 
 
 def words_to_numbers(text:str) -> Union[str, int]:
@@ -35,7 +192,7 @@ def words_to_numbers(text:str) -> Union[str, int]:
     >>> words_to_numbers('dos mil quinientos millones')
     2500000000
     """
-    return to_number(text)
+    return _WORDS_TO_NUMBERS_CACHE(text)
 
 
 def number_to_words(
@@ -94,50 +251,1273 @@ def number_to_words(
     >>> number_to_words(9, lang='es', to='ordinal')
     'noveno'
     """
-    return num2words(number=number, lang=lang, to=to, **kwargs)
-    
+    key = _number_key(number, lang, to, kwargs)
+    if key is None:
+        return _num2words(number=number, lang=lang, to=to, **kwargs)
+
+    return _NUMBER_TO_WORDS_CACHE(key)
+
+
+def number_to_words_many(
+        numbers: Iterable,
+        lang: str = 'es',
+        to: str = 'cardinal',
+        **kwargs
+    ) -> List[str]:
+    """ Converts a batch of numbers into words, converting repeated numbers only once.
+
+    Parameters
+    ----------
+    numbers : Iterable
+        The numbers, as `number_to_words` accepts them.
+    lang : str, optional
+        Output language, by default 'es'.
+    to : str, optional
+        Type of grammatical expression. Can be either cardinal
+        or ordinal, by default 'cardinal'.
+
+    Returns
+    -------
+    List[str]
+        The phrase of every number, in the same order.
+
+    Examples
+    -------
+    >>> from nlptools.parsing import number_to_words_many
+    >>> number_to_words_many([1, '01', 2050, 35000])
+    ['uno', 'uno', 'dos mil cincuenta', 'treinta y cinco mil']
+    """
+    numbers = list(numbers)
+    converted = {}
+    for number in numbers:
+        key = _number_key(number, lang, to, kwargs)
+        if key not in converted:
+            converted[key] = number_to_words(number, lang, to, **kwargs)
+
+    return [converted[_number_key(number, lang, to, kwargs)] for number in numbers]
+
+
+def words_to_numbers_many(texts: Iterable[str]) -> list:
+    """ Converts a batch of phrases into numbers, converting repeated phrases only once.
+
+    Parameters
+    ----------
+    texts : Iterable[str]
+        Properly written and cleaned numbers in spanish words.
+
+    Returns
+    -------
+    list
+        The number of every phrase, in the same order, as `words_to_numbers` returns it.
+
+    Examples
+    -------
+    >>> from nlptools.parsing import words_to_numbers_many
+    >>> words_to_numbers_many(['cinco', 'mil novecientos noventa', 'cinco'])
+    [5, 1990, 5]
+    """
+    texts = list(texts)
+    converted = {}
+    for text in texts:
+        if text not in converted:
+            converted[text] = words_to_numbers(text)
+
+    return [converted[text] for text in texts]
+
+
+def conversion_cache_info() -> Dict[str, dict]:
+    """ Returns the statistics of the caches of `number_to_words` and `words_to_numbers`.
+
+    Returns
+    -------
+    Dict[str, dict]
+        For every function, the hits of the precomputed table, its size, and the 
+        hits, misses, maximum size and current size of the LRU cache.
+    """
+    return {
+        'number_to_words': _NUMBER_TO_WORDS_CACHE.info(),
+        'words_to_numbers': _WORDS_TO_NUMBERS_CACHE.info(),
+    }
+
+
+def clear_conversion_cache():
+    """ Empties the LRU caches of `number_to_words` and `words_to_numbers` and resets their statistics.
+    """
+    _NUMBER_TO_WORDS_CACHE.clear()
+    _WORDS_TO_NUMBERS_CACHE.clear()
+
+
+def _replace_tilde(match: re.Match) -> str:
+    """ Returns the vowel without accent of a matched accented vowel.
+    """
+    return _TILDES[match.group()]
+
+
+def _replace_lower_tilde(match: re.Match) -> str:
+    """ Returns the lowercase vowel without accent of a matched accented vowel.
+    """
+    return _LOWER_TILDES[match.group()]
+
+
+class TextNormalizer:
+    """
+        Removes the accents of texts, and optionally lowercases them, handling every 
+        text in one pass over its characters. Batches are joined and normalized at once, 
+        so there is no Python call per element.
+
+    Attributes
+    --------
+    - TextNormalizer.mode
+        `table` removes the accents of the vowels, as `remove_tildes` always did, keeping 
+        letters such as `ñ`. `unicode` decomposes every character and removes all the 
+        combining marks, so `ñ` becomes `n` and `ç` becomes `c`.
+    - TextNormalizer.lowercase
+        Whether the texts are lowercased in the same pass.
+
+    Methods
+    -------
+    - TextNormalizer.normalize
+    - TextNormalizer.normalize_many
+
+    Examples
+    -------
+    >>> from nlptools.parsing import TextNormalizer
+    >>> TextNormalizer().normalize('Razón Social: PEÑAROL')
+    'Razon Social: PEÑAROL'
+    >>> TextNormalizer('unicode', lowercase=True).normalize_many(['Razón', 'PEÑAROL', None])
+    ['razon', 'penarol', None]
+    """
+    modes = ['table', 'unicode']
+
+    def __init__(self, mode: str = 'table', lowercase: bool = False):
+        if mode not in self.modes:
+            raise KeyError(f'{mode} is not a valid option. Please choose one of the following {self.modes}')
+        self.mode = mode
+        self.lowercase = lowercase
+
+
+    def __call__(self, text: str) -> str:
+        return self.normalize(text)
+
+
+    def __repr__(self) -> str:
+        return f'TextNormalizer({self.mode!r}, lowercase={self.lowercase})'
+
+
+    def normalize(self, text: str) -> str:
+        """ Normalizes a single text.
+
+        Parameters
+        ----------
+        text : str
+            The text intended to normalize.
+
+        Returns
+        -------
+        str
+            The text without accents and, if requested, in lowercase.
+        """
+        if self.mode == 'unicode':
+            text = _COMBINING_MARKS.sub('', unicodedata.normalize('NFKD', text))
+            return text.lower() if self.lowercase else text
+        if self.lowercase:
+            return _TILDES_PATTERN.sub(_replace_lower_tilde, text.lower())
+
+        return _TILDES_PATTERN.sub(_replace_tilde, text)
+
+
+    def normalize_many(self, texts: Iterable):
+        """ Normalizes a batch of texts at once.
+
+        Parameters
+        ----------
+        texts : Iterable
+            A list, an iterator or a pandas.Series of texts. Elements that 
+            are not strings, such as None or NaN, are kept as they are.
+
+        Returns
+        -------
+        list or pandas.Series
+            The normalized texts, in the same order. A pandas.Series is returned 
+            with the same index and name when a pandas.Series is provided.
+        """
+        is_series = hasattr(texts, 'index') and hasattr(texts, 'to_list')
+        values = texts.to_list() if is_series else list(texts)
+        positions = [i for i, value in enumerate(values) if isinstance(value, str)]
+        strings = values if len(positions) == len(values) else [values[i] for i in positions]
+
+        joined = _SEPARATOR.join(strings)
+        if strings and joined.count(_SEPARATOR) == len(strings) - 1:
+            normalized = self.normalize(joined).split(_SEPARATOR)
+        else:
+            normalized = [self.normalize(string) for string in strings]
+
+        if len(positions) == len(values):
+            values = normalized
+        else:
+            for i, string in zip(positions, normalized):
+                values[i] = string
+
+        if is_series:
+            return type(texts)(values, index=texts.index, name=texts.name)
+
+        return values
 
 
 def remove_tildes(string:str) -> str:
-    text = deepcopy(string)
-    tildes = {
-            'Á': 'A', 'É': 'E', 'Í': 'I', 'Ó': 'O', 'Ú': 'U',
-            'Ä': 'A', 'Ë': 'E', 'Ï': 'I', 'Ö': 'O', 'Ü': 'U',
-            'À': 'A', 'È': 'E', 'Ì': 'I', 'Ò': 'O', 'Ù': 'U',
-            'á': 'a', 'é': 'e', 'í': 'i', 'ó': 'o', 'ú': 'u',
-            'ä': 'a', 'ë': 'e', 'ï': 'i', 'ö': 'o', 'ü': 'u',
-            'à': 'a', 'è': 'e', 'ì': 'i', 'ò': 'o', 'ù': 'u'
-            }
+    """ Removes the accents of the vowels in a text, keeping every other character.
+
+    Parameters
+    ----------
+    string : str
+        The text intended to clean.
+
+    Returns
+    -------
+    str
+        The text without accents. Use `TextNormalizer` to remove every 
+        diacritic, to lowercase in the same pass or to normalize batches.
+
+    Examples
+    -------
+    >>> from nlptools.parsing import remove_tildes
+    >>> remove_tildes('Año de la Revolución')
+    'Año de la Revolucion'
+    """
+    return _TILDES_PATTERN.sub(_replace_tilde, string)
+
+
+_TOKENIZER_PATTERNS = {
+    'alphanumeric': re.compile(r'\b(\w?\w+)', re.IGNORECASE),
+    'alphabetic': re.compile(r'\b([A-Za-zÀ-ÖØ-öø-ÿ]?[A-Za-zÀ-ÖØ-öø-ÿ]+)', re.IGNORECASE),
+    'numeric': re.compile(r'([0-9]+[.,]?[0-9]+([.,]?[0-9]+)?([.,]?[0-9]+)?([.,][0-9]+)?)'),
+    'Name': re.compile(''.join(
+        [r'(?:[A-ZÀ-ÿ][A-Za-zÀ-ÖØ-öø-ÿ]+\s?)',
+         r'+(?:(?:[a-zà-ÿ]{1,4}\s)?',
+         r'(?:[A-ZÀ-ÿ][A-Za-zÀ-ÖØ-öø-ÿ]+\s?)+)'])
+    ),
+}
+
+_WHITESPACE_PATTERN = re.compile(r'\S+')
+
+_TOKENIZERS = {}
+
+
+class Tokenizer:
+    """
+        A tokenizer whose pattern is compiled once, to be reused over many documents. 
+        Besides the tokens, it returns where every token starts and ends in the text.
+
+    Attributes
+    --------
+    - Tokenizer.pattern
+        The compiled regular expression. When it has groups, the token is the first group.
+    - Tokenizer.style
+        The name of the registered style, or None for a custom pattern.
+
+    Methods
+    -------
+    - Tokenizer.findall
+    - Tokenizer.tokenize
+    - Tokenizer.tokenize_with_offsets
+    - Tokenizer.tokenize_many
+
+    Examples
+    -------
+    >>> from nlptools.parsing import get_tokenizer
+    >>> tokenizer = get_tokenizer('numeric')
+    >>> tokenizer.tokenize_with_offsets('un capital de $ 50.000 en 2 cuotas de 25.000')
+    (['50.000', '25.000'], array([[16, 22],
+           [38, 44]]))
+    """
+    def __init__(self, pattern: Union[str, re.Pattern, None] = None, style: str = None, flags: int = 0):
+        if pattern is None:
+            if style is not None and style not in _TOKENIZER_PATTERNS:
+                raise KeyError(f'{style} is not a valid option. Please choose one of the following {list(_TOKENIZER_PATTERNS)}')
+            pattern = _TOKENIZER_PATTERNS[style] if style else _WHITESPACE_PATTERN
+        self.pattern = re.compile(pattern, flags) if isinstance(pattern, str) else pattern
+        self.style = style
+        self._group = 1 if self.pattern.groups else 0
+
+
+    def __repr__(self) -> str:
+        return f'Tokenizer({self.style or self.pattern.pattern!r})'
+
+
+    def findall(self, text: str) -> list:
+        """ Returns what `re.findall` returns for the pattern, groups included.
+
+        Parameters
+        ----------
+        text : str
+            The text intended to tokenize.
 
-    for k,v in tildes.items():
-        text = text.replace(k, v)
+        Returns
+        -------
+        list
+            The strings, or the tuples of groups when the pattern has more than one group.
+        """
+        if self.pattern is _WHITESPACE_PATTERN:
+            return text.split()
 
-    return text
+        return self.pattern.findall(text)
 
 
+    def tokenize(self, text: str) -> List[str]:
+        """ Splits a text into tokens.
+
+        Parameters
+        ----------
+        text : str
+            The text intended to tokenize.
+
+        Returns
+        -------
+        List[str]
+            The tokens. When the pattern has groups, every token is the first group.
+        """
+        if self._group:
+            return [match.group(1) for match in self.pattern.finditer(text)]
+
+        return self.findall(text)
+
+
+    def tokenize_with_offsets(self, text: str) -> Tuple[List[str], np.ndarray]:
+        """ Splits a text into tokens and returns where every token is.
+
+        Parameters
+        ----------
+        text : str
+            The text intended to tokenize.
+
+        Returns
+        -------
+        Tuple[List[str], np.ndarray]
+            The tokens and an integer array of shape (number of tokens, 2) with the 
+            `(start, end)` of every token, so `text[start:end]` is the token.
+        """
+        group = self._group
+        matches = list(self.pattern.finditer(text))
+        tokens = [match.group(group) for match in matches]
+        offsets = np.fromiter(
+            (position for match in matches for position in match.span(group)),
+            dtype=np.int64,
+            count=2 * len(matches)
+        )
+
+        return tokens, offsets.reshape(-1, 2)
+
+
+    def tokenize_many(self, texts: Iterable[str]) -> Iterator[Tuple[List[str], np.ndarray]]:
+        """ Tokenizes a stream of documents, one at a time.
+
+        Parameters
+        ----------
+        texts : Iterable[str]
+            The documents intended to tokenize. It can be a generator, 
+            so the documents do not need to be in memory at once.
+
+        Yields
+        ------
+        Tuple[List[str], np.ndarray]
+            The tokens and the offsets of every document, as `Tokenizer.tokenize_with_offsets` returns them.
+        """
+        for text in texts:
+            yield self.tokenize_with_offsets(text)
+
+
+def register_tokenizer(style: str, pattern: Union[str, re.Pattern], flags: int = 0) -> Tokenizer:
+    """ Registers a custom pattern as a style, so `get_tokenizer` and `retokenizer` can use it.
+
+    Parameters
+    ----------
+    style : str
+        The name of the new style. Registering an existing name replaces its pattern.
+    pattern : str or re.Pattern
+        The regular expression. When it has groups, the token is the first group.
+    flags : int, optional
+        The flags used to compile the pattern when it is a string, by default 0.
+
+    Returns
+    -------
+    Tokenizer
+        The tokenizer of the new style.
+
+    Examples
+    -------
+    >>> from nlptools.parsing import register_tokenizer, retokenizer
+    >>> register_tokenizer('cuit', r'[0-9]{2}-[0-9]{8}-[0-9]')
+    Tokenizer('cuit')
+    >>> retokenizer('CUIT 30-71596183-7 y 20-12345678-9', style='cuit')
+    ['30-71596183-7', '20-12345678-9']
+    """
+    _TOKENIZER_PATTERNS[style] = re.compile(pattern, flags) if isinstance(pattern, str) else pattern
+    _TOKENIZERS.pop(style, None)
+
+    return get_tokenizer(style)
+
+
+def get_tokenizer(style: str = None) -> Tokenizer:
+    """ Returns the tokenizer of a style, compiling it only the first time.
+
+    Parameters
+    ----------
+    style : str, optional
+        One of 'alphanumeric', 'alphabetic', 'numeric', 'Name' or a registered style. 
+        If None, the text is split by whitespace, by default None.
+
+    Returns
+    -------
+    Tokenizer
+        The same tokenizer every time the same style is requested.
+
+    Raises
+    ------
+    KeyError
+        If the style is not registered.
+    """
+    if style not in _TOKENIZERS:
+        _TOKENIZERS[style] = Tokenizer(style=style)
+
+    return _TOKENIZERS[style]
+
 
 def retokenizer(text:str, pattern=None, style:str=None) -> list:
-    flag = False
-    if not pattern:
-        if style == 'alphanumeric':
-            pattern = re.compile(r'\b(\w?\w+)', re.IGNORECASE)
-            flag = True
-        elif style == 'alphabetic':
-            pattern = re.compile(r'\b([A-Za-zÀ-ÖØ-öø-ÿ]?[A-Za-zÀ-ÖØ-öø-ÿ]+)', re.IGNORECASE)
-            flag = True
-        elif style == 'numeric':
-            pattern = re.compile(r'([0-9]+[.,]?[0-9]+([.,]?[0-9]+)?([.,]?[0-9]+)?([.,][0-9]+)?)')
-            flag = True
-        elif style == 'Name':
-            pattern = re.compile(''.join(
-                    [r'(?:[A-ZÀ-ÿ][A-Za-zÀ-ÖØ-öø-ÿ]+\s?)',
-                     r'+(?:(?:[a-zà-ÿ]{1,4}\s)?',
-                     r'(?:[A-ZÀ-ÿ][A-Za-zÀ-ÖØ-öø-ÿ]+\s?)+)'])
-                    )
-            flag = True
+    """ Splits a text into tokens with a pattern or a registered style.
+
+    Parameters
+    ----------
+    text : str
+        The text intended to tokenize.
+    pattern : str or re.Pattern, optional
+        A regular expression, used as `re.findall` does, by default None.
+    style : str, optional
+        Used when no pattern is provided. One of 'alphanumeric', 'alphabetic', 'numeric', 
+        'Name' or a style added with `register_tokenizer`. Any other value splits the 
+        text by whitespace, by default None.
+
+    Returns
+    -------
+    list
+        What `re.findall` returns: strings, or tuples of groups when the pattern has 
+        more than one group. Use `get_tokenizer` to get the offsets of the tokens.
+    """
+    if pattern:
+        return re.findall(pattern, text)
+    if style in _TOKENIZER_PATTERNS:
+        return get_tokenizer(style).findall(text)
+
+    return text.split()
+
+
+_NUMBER_WORDS = {
+    'cero': ('unit', 0), 'un': ('unit', 1), 'uno': ('unit', 1), 'una': ('unit', 1),
+    'dos': ('unit', 2), 'tres': ('unit', 3), 'cuatro': ('unit', 4), 'cinco': ('unit', 5),
+    'seis': ('unit', 6), 'siete': ('unit', 7), 'ocho': ('unit', 8), 'nueve': ('unit', 9),
+    'once': ('unit', 11), 'doce': ('unit', 12), 'trece': ('unit', 13), 'catorce': ('unit', 14),
+    'quince': ('unit', 15), 'dieciseis': ('unit', 16), 'diecisiete': ('unit', 17),
+    'dieciocho': ('unit', 18), 'diecinueve': ('unit', 19), 'veintiun': ('unit', 21),
+    'veintiuno': ('unit', 21), 'veintiuna': ('unit', 21), 'veintidos': ('unit', 22),
+    'veintitres': ('unit', 23), 'veinticuatro': ('unit', 24), 'veinticinco': ('unit', 25),
+    'veintiseis': ('unit', 26), 'veintisiete': ('unit', 27), 'veintiocho': ('unit', 28),
+    'veintinueve': ('unit', 29), 'diez': ('ten', 10), 'veinte': ('ten', 20),
+    'treinta': ('ten', 30), 'cuarenta': ('ten', 40), 'cincuenta': ('ten', 50),
+    'sesenta': ('ten', 60), 'setenta': ('ten', 70), 'ochenta': ('ten', 80),
+    'noventa': ('ten', 90), 'cien': ('cien', 100), 'ciento': ('hundred', 100),
+    'doscientos': ('hundred', 200), 'doscientas': ('hundred', 200),
+    'trescientos': ('hundred', 300), 'trescientas': ('hundred', 300),
+    'cuatrocientos': ('hundred', 400), 'cuatrocientas': ('hundred', 400),
+    'quinientos': ('hundred', 500), 'quinientas': ('hundred', 500),
+    'seiscientos': ('hundred', 600), 'seiscientas': ('hundred', 600),
+    'setecientos': ('hundred', 700), 'setecientas': ('hundred', 700),
+    'ochocientos': ('hundred', 800), 'ochocientas': ('hundred', 800),
+    'novecientos': ('hundred', 900), 'novecientas': ('hundred', 900),
+    'mil': ('scale', 10 ** 3), 'millon': ('scale', 10 ** 6), 'millones': ('scale', 10 ** 6),
+    'billon': ('scale', 10 ** 12), 'billones': ('scale', 10 ** 12),
+}
+
+_ARTICLES = {'un', 'una', 'uno'}
+
+_CHAR_CLASSES = {'a': '[aáàä]', 'e': '[eéèë]', 'i': '[iíìï]', 'o': '[oóòö]', 'u': '[uúùü]', ' ': r'\s+'}
+
+_HYPHEN_BREAK = r'-[ \t]*(?:\r?\n[ \t]*)+'
+
+_LETTERS = r'[^\W\d_]'
+
+
+class _LazyPattern:
+    """ A regular expression compiled the first time it is used, for the patterns big
+    enough to slow down the import of the module.
+    """
+    def __init__(self, pattern: str, flags: int = 0):
+        self._pattern = pattern
+        self._flags = flags
+        self._compiled = None
+
+
+    def __getattr__(self, name: str):
+        if self._compiled is None:
+            self._compiled = re.compile(self._pattern, self._flags)
+        return getattr(self._compiled, name)
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """ Builds a regular expression that matches any of the words, sharing their prefixes.
+
+        Vowels match with or without accents, spaces match any whitespace, and a hyphenated
+        line break is allowed between any two letters, as the OCR leaves them when a word 
+        is split across lines.
+
+    Parameters
+    ----------
+    words : Iterable[str]
+        The words, in lowercase and without accents. They can have single spaces.
+
+    Returns
+    -------
+    str
+        A pattern without capturing groups, intended to be compiled with re.IGNORECASE.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def to_pattern(node: dict, first: bool) -> str:
+        branches = [
+            ('' if first else f'(?:{_HYPHEN_BREAK})?') + _CHAR_CLASSES.get(char, char) + to_pattern(child, False)
+            for char, child in sorted(node.items(), key=lambda item: -len(item[1]))
+            if char
+        ]
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{pattern})?' if '' in node else pattern
+
+    return to_pattern(trie, True)
+
+
+_NUMBER_WORD = f"(?:{_trie_pattern(_NUMBER_WORDS)})(?!\\w)"
+
+_NUMBER_PHRASE_PATTERN = _LazyPattern(
+    f"(?<!\\w){_NUMBER_WORD}(?:\\s+(?:y\\s+)?{_NUMBER_WORD})*",
+    re.IGNORECASE
+)
+
+_PHRASE_TOKEN_PATTERN = re.compile(f"{_LETTERS}+(?:{_HYPHEN_BREAK}{_LETTERS}+)*")
+
+_HYPHEN_BREAK_PATTERN = re.compile(_HYPHEN_BREAK)
+
+_AMOUNT_DIGITS_PATTERN = re.compile(r'\s*\(\s*(?:U\$S|USD|\$)?\s*(\d{1,3}(?:[.,]\d{3})+|\d+)(?:,\d{1,2})?\s*(?:\.?-)?\s*\)')
+
+
+def _parse_number_tokens(tokens: List[Tuple[str, int, int]]) -> Iterator[Tuple[int, int, int, int]]:
+    """ Splits a sequence of number words into the amounts it spells.
+
+        Reads the words left to right, with the grammar of the spanish numbers, and 
+        closes the current amount when a word can not continue it, for example in 
+        'cinco cinco' or in 'treinta y mil'. A 'ciento' that is not followed by tens 
+        or units is not a number, as in '23 por ciento'.
+
+    Parameters
+    ----------
+    tokens : List[Tuple[str, int, int]]
+        The normalized words of a phrase, with their start and end in the text.
+
+    Yields
+    ------
+    Tuple[int, int, int, int]
+        The position of the first and the last word of every amount, its start in the 
+        text and its value.
+    """
+    position = 0
+    while position < len(tokens):
+        total, group, current = 0, 0, 0
+        state, has_words, has_thousands, closed_scale = 'start', False, False, None
+        first, last = position, None
+        while position < len(tokens):
+            word = tokens[position][0]
+            kind, value = _NUMBER_WORDS.get(word, ('and', 0))
+            if kind == 'and':
+                if state != 'ten' or position + 1 == len(tokens):
+                    break
+                next_kind, next_value = _NUMBER_WORDS.get(tokens[position + 1][0], ('and', 0))
+                if next_kind != 'unit' or not 1 <= next_value <= 9:
+                    break
+                state = 'and'
+            elif kind == 'scale':
+                if state == 'and' or (closed_scale is not None and value >= closed_scale):
+                    break
+                if value == 10 ** 3:
+                    if has_thousands:
+                        break
+                    group += (current if state != 'start' else 1) * value
+                    has_thousands = True
+                else:
+                    if not has_words:
+                        break
+                    total = (total + group + current) * value
+                    group, has_thousands, closed_scale = 0, False, value
+                current, state = 0, 'start'
+                has_words, last = True, position
+            else:
+                if not (
+                    state == 'start'
+                    or (state == 'hundred' and kind in ('ten', 'unit'))
+                    or (state == 'and' and kind == 'unit')
+                ):
+                    break
+                if word == 'ciento' and (
+                    position + 1 == len(tokens)
+                    or _NUMBER_WORDS.get(tokens[position + 1][0], ('and', 0))[0] not in ('ten', 'unit')
+                ):
+                    break
+                current += value
+                state = 'done' if kind == 'unit' else kind
+                has_words, last = True, position
+            position += 1
+
+        if last is None:
+            position = first + 1
+            continue
+        position = last + 1
+        yield first, last, tokens[first][1], total + group + current
+
+
+def find_amounts(text: str) -> List[Tuple[int, int, int, Optional[int]]]:
+    """ Finds the amounts spelled in spanish words in a text, such as 'dos mil quinientos millones'.
+
+        The text is scanned once. The words can be in any case, with or without accents,
+        separated by line breaks or split by a hyphenated line break, as the OCR leaves 
+        them. When the words are followed by the amount in digits between parenthesis, 
+        as in 'pesos CINCUENTA mil ($50.000)', the parenthesis is part of the match. A lone 
+        'un', 'una' or 'uno' is only taken as an amount when it is followed by digits.
+
+    Parameters
+    ----------
+    text : str
+        The text intended to scan.
+
+    Returns
+    -------
+    List[Tuple[int, int, int, Optional[int]]]
+        The start and end of every amount in the text, the value of the words, and the 
+        value of the digits between parenthesis, or None if there are none.
+
+    Examples
+    -------
+    >>> from nlptools.parsing import find_amounts
+    >>> find_amounts('la suma de pesos CINCUENTA\\nmil ($50.000) dividido en cinco mil cuotas')
+    [(17, 40, 50000, 50000), (53, 62, 5000, None)]
+    """
+    amounts = []
+    for phrase in _NUMBER_PHRASE_PATTERN.finditer(text):
+        tokens = [
+            (remove_tildes(_HYPHEN_BREAK_PATTERN.sub('', token.group()).lower()), token.start(), token.end())
+            for token in _PHRASE_TOKEN_PATTERN.finditer(text, phrase.start(), phrase.end())
+        ]
+        for first, last, start, value in _parse_number_tokens(tokens):
+            end = tokens[last][2]
+            digits = None
+            if last == len(tokens) - 1:
+                match = _AMOUNT_DIGITS_PATTERN.match(text, end)
+                if match:
+                    digits = int(re.sub(r'\D', '', match.group(1)))
+                    end = match.end()
+            if first == last and tokens[first][0] in _ARTICLES and digits is None:
+                continue
+            amounts.append((start, end, value, digits))
+
+    return amounts
+
+
+def find_amounts_many(texts: Iterable[str]) -> Iterator[List[Tuple[int, int, int, Optional[int]]]]:
+    """ Finds the amounts spelled in spanish words in a stream of documents, one at a time.
+
+    Parameters
+    ----------
+    texts : Iterable[str]
+        The documents intended to scan. It can be a generator, so the documents 
+        do not need to be in memory at once.
+
+    Yields
+    ------
+    List[Tuple[int, int, int, Optional[int]]]
+        The amounts of every document, as `find_amounts` returns them.
+    """
+    for text in texts:
+        yield find_amounts(text)
+
+
+_MONTHS = {
+    'enero': 1, 'febrero': 2, 'marzo': 3, 'abril': 4, 'mayo': 5, 'junio': 6, 'julio': 7,
+    'agosto': 8, 'septiembre': 9, 'setiembre': 9, 'octubre': 10, 'noviembre': 11, 'diciembre': 12,
+}
+
+_ORDINAL_DAYS = {
+    'primero': 1, 'primer': 1, 'segundo': 2, 'tercero': 3, 'tercer': 3, 'cuarto': 4, 'quinto': 5,
+    'sexto': 6, 'septimo': 7, 'setimo': 7, 'octavo': 8, 'noveno': 9, 'decimo': 10,
+    'undecimo': 11, 'duodecimo': 12, 'vigesimo': 20, 'trigesimo': 30,
+}
+_ORDINAL_DAYS.update({
+    f'{tens}{separator}{unit}': _ORDINAL_DAYS[tens] + _ORDINAL_DAYS[unit]
+    for tens, last in [('decimo', 9), ('vigesimo', 9), ('trigesimo', 1)]
+    for unit, value in _ORDINAL_DAYS.items()
+    if 1 <= value <= last
+    for separator in ['', ' ']
+})
+
+_DAY_WORDS = {
+    **{
+        word: value
+        for word, (kind, value) in _NUMBER_WORDS.items()
+        if kind in ('unit', 'ten') and 1 <= value <= 31
+    },
+    'treinta y uno': 31,
+    'treinta y un': 31,
+    **_ORDINAL_DAYS,
+}
+
+_WHITESPACE_RUN_PATTERN = re.compile(r'\s+')
+
+_DATE_PATTERN = _LazyPattern(
+    r'(?<![\w/-])(?:'
+    r'(?P<numeric_day>\d{1,2})(?P<separator>[-/])(?P<numeric_month>\d{1,2})'
+    r'(?:(?P=separator)(?P<numeric_year>\d{1,4}))?(?![\w/]|-\d)'
+    r'|'
+    f"(?P<day>\\d{{1,2}}[º°]?|{_trie_pattern(_DAY_WORDS)})(?:\\s+d[ií]as?)?\\s+(?:del\\s+mes\\s+)?de\\s+"
+    f"(?P<month>{_trie_pattern(_MONTHS)})(?!\\w)"
+    f"(?:\\s+(?:del\\s+a[ñn]o|de)\\s+(?:(?P<year>\\d{{1,4}})(?!\\w|[.,]\\d)|(?P<year_words>{_NUMBER_WORD}(?:\\s+(?:y\\s+)?{_NUMBER_WORD})*)))?"
+    r')',
+    re.IGNORECASE
+)
+
+
+def _date_from_match(
+        text: str,
+        match: re.Match,
+        default_year: Optional[int] = None,
+        min_words_year: int = 0
+    ) -> Tuple[Optional[datetime.date], int]:
+    """ Builds the date of a match of the date pattern.
+
+    Parameters
+    ----------
+    text : str
+        The text where the match was found.
+    match : re.Match
+        A match of the date pattern.
+    default_year : Optional[int], optional
+        The year of the dates written without year, by default None.
+    min_words_year : int, optional
+        The smallest year accepted when it is written in words. Smaller numbers after 
+        the month are not taken as the year, by default 0.
+
+    Returns
+    -------
+    Tuple[Optional[datetime.date], int]
+        The date, or None if it is not a valid date, and where it ends in the text. The 
+        end is before the end of the match when the words after the month are not a year.
+    """
+    end = match.end()
+    if match.group('numeric_day'):
+        day, month = int(match.group('numeric_day')), int(match.group('numeric_month'))
+        year = match.group('numeric_year')
+        year = int(year) if year else None
+    else:
+        day = match.group('day').rstrip('º°')
+        day = int(day) if day.isdigit() else _DAY_WORDS[
+            _WHITESPACE_RUN_PATTERN.sub(' ', remove_tildes(_HYPHEN_BREAK_PATTERN.sub('', day).lower()))
+        ]
+        month = _MONTHS[remove_tildes(_HYPHEN_BREAK_PATTERN.sub('', match.group('month')).lower())]
+        year = match.group('year')
+        if year:
+            year = int(year)
+        elif match.group('year_words'):
+            tokens = [
+                (remove_tildes(_HYPHEN_BREAK_PATTERN.sub('', token.group()).lower()), token.start(), token.end())
+                for token in _PHRASE_TOKEN_PATTERN.finditer(text, match.start('year_words'), match.end('year_words'))
+            ]
+            first, last, _, year = next(_parse_number_tokens(tokens), (None, None, None, None))
+            if first == 0 and year >= min_words_year:
+                end = tokens[last][2]
+            else:
+                year, end = None, match.end('month')
         else:
-            result = text.split()
-    if flag or pattern:
-        result = re.findall(pattern, text)
-    
-    return result
\ No newline at end of file
+            year = None
+
+    if year is None:
+        year = default_year
+    if year is None:
+        return None, end
+    try:
+        return datetime.date(year, month, day), end
+    except ValueError:
+        return None, end
+
+
+def parse_date(text: str, default_year: Optional[int] = None) -> Optional[datetime.date]:
+    """ Parses a date written in spanish, in any of the styles of `data_augmentation.date_formatter`.
+
+        Accepts '27-12-1945', '27/12/1945', '27 de Diciembre de 1945', '27 de Diciembre de 
+        mil novecientos cuarenta y cinco', 'veintisiete de Diciembre de ...', 'veintisiete del 
+        mes de Diciembre de ...', 'vigésimo séptimo día del mes de Diciembre del año ...' and
+        all of them without year, in any case and with or without accents.
+
+    Parameters
+    ----------
+    text : str
+        A text with only a date, as extracted from a document.
+    default_year : Optional[int], optional
+        The year of the dates written without year. If None, the dates without year 
+        are not parsed, by default None.
+
+    Returns
+    -------
+    Optional[datetime.date]
+        The date, or None if the text is not a valid date.
+
+    Examples
+    -------
+    >>> from nlptools.parsing import parse_date
+    >>> parse_date('vigésimo séptimo día del mes de Diciembre del año mil novecientos cuarenta y cinco')
+    datetime.date(1945, 12, 27)
+    >>> parse_date('27/12')
+    >>> parse_date('27/12', default_year=2021)
+    datetime.date(2021, 12, 27)
+    """
+    text = text.strip()
+    match = _DATE_PATTERN.fullmatch(text)
+    if not match:
+        return None
+    date, end = _date_from_match(text, match, default_year)
+
+    return date if end == len(text) else None
+
+
+def parse_dates(texts: Iterable[str], default_year: Optional[int] = None) -> List[Optional[datetime.date]]:
+    """ Parses a batch of dates written in spanish, parsing repeated texts only once.
+
+    Parameters
+    ----------
+    texts : Iterable[str]
+        Texts with only a date, as extracted from documents.
+    default_year : Optional[int], optional
+        The year of the dates written without year. If None, the dates without year 
+        are not parsed, by default None.
+
+    Returns
+    -------
+    List[Optional[datetime.date]]
+        The date of every text, in the same order, as `parse_date` returns it.
+    """
+    texts = list(texts)
+    parsed = {}
+    for text in texts:
+        if text not in parsed:
+            parsed[text] = parse_date(text, default_year)
+
+    return [parsed[text] for text in texts]
+
+
+def find_dates(text: str, default_year: Optional[int] = None) -> List[Tuple[int, int, datetime.date]]:
+    """ Finds the dates written in spanish in a text, in any of the styles of `data_augmentation.date_formatter`.
+
+    Parameters
+    ----------
+    text : str
+        The text intended to scan.
+    default_year : Optional[int], optional
+        The year of the dates written without year. If None, the dates without year 
+        are not returned, by default None.
+
+    Returns
+    -------
+    List[Tuple[int, int, datetime.date]]
+        The start, the end and the value of every valid date in the text. A number 
+        under 100 written in words after the month, as in 'de febrero de dos socios', 
+        is not taken as the year.
+
+    Examples
+    -------
+    >>> from nlptools.parsing import find_dates
+    >>> find_dates('nacida el 6 de marzo de 1990, cierra el 31 de diciembre de cada año', 2021)
+    [(10, 28, datetime.date(1990, 3, 6)), (40, 55, datetime.date(2021, 12, 31))]
+    """
+    dates = []
+    for match in _DATE_PATTERN.finditer(text):
+        date, end = _date_from_match(text, match, default_year, 100)
+        if date is not None:
+            dates.append((match.start(), end, date))
+
+    return dates
+
+
+def find_dates_many(
+        texts: Iterable[str],
+        default_year: Optional[int] = None
+    ) -> Iterator[List[Tuple[int, int, datetime.date]]]:
+    """ Finds the dates written in spanish in a stream of documents, one at a time.
+
+    Parameters
+    ----------
+    texts : Iterable[str]
+        The documents intended to scan. It can be a generator, so the documents 
+        do not need to be in memory at once.
+    default_year : Optional[int], optional
+        The year of the dates written without year. If None, the dates without year 
+        are not returned, by default None.
+
+    Yields
+    ------
+    List[Tuple[int, int, datetime.date]]
+        The dates of every document, as `find_dates` returns them.
+    """
+    for text in texts:
+        yield find_dates(text, default_year)
+
+
+_PAGE_EDITS_PATTERN = re.compile(r'(?P<hyphen>(?<=\w)-[ \t]*(?:\r?\n[ \t]*)+(?=\w))|\s{2,}|[^\S ]')
+
+
+class OffsetMap:
+    """
+        Maps every character of a text merged from several pages to the page and the 
+        character of the raw page it comes from. It stores only the runs of characters
+        copied without changes, so its size grows with the edits, not with the text.
+
+    Attributes
+    --------
+    - OffsetMap.clean_starts
+        Where every run starts in the merged text.
+    - OffsetMap.pages
+        The page of every run.
+    - OffsetMap.raw_starts
+        Where every run starts in its raw page.
+
+    Methods
+    -------
+    - OffsetMap.to_raw
+    - OffsetMap.span_to_raw
+
+    Examples
+    -------
+    >>> from nlptools.parsing import merge_pages
+    >>> text, offsets = merge_pages(['Raul LESCA-\\n\\nNO, nacida', 'en  Pico'])
+    >>> text
+    'Raul LESCANO, nacida en Pico'
+    >>> offsets.to_raw(11)
+    (0, 14)
+    >>> offsets.span_to_raw(21, 28)
+    [(1, 0, 8)]
+    """
+    def __init__(self, clean_starts: Sequence[int], pages: Sequence[int], raw_starts: Sequence[int], length: int):
+        self.clean_starts = np.asarray(clean_starts, dtype=np.int64)
+        self.pages = np.asarray(pages, dtype=np.int32)
+        self.raw_starts = np.asarray(raw_starts, dtype=np.int64)
+        self._length = length
+
+
+    def __len__(self) -> int:
+        return self._length
+
+
+    def __repr__(self) -> str:
+        return f'OffsetMap(length={self._length}, runs={len(self.clean_starts)})'
+
+
+    @property
+    def nbytes(self) -> int:
+        """ The memory used by the arrays of the map.
+        """
+        return self.clean_starts.nbytes + self.pages.nbytes + self.raw_starts.nbytes
+
+
+    def to_raw(self, positions):
+        """ Projects positions of the merged text to their pages and positions in the raw pages.
+
+        Parameters
+        ----------
+        positions : {int, array-like}
+            One position or many positions of the merged text.
+
+        Returns
+        -------
+        Tuple
+            The pages and the raw positions, as integers when one position is given or
+            as arrays otherwise. The space added between two pages is mapped to the end 
+            of the previous page.
+
+        Raises
+        ------
+        IndexError
+            If a position is outside the merged text.
+        """
+        array = np.asarray(positions, dtype=np.int64)
+        if array.size and (array.min() < 0 or array.max() >= self._length):
+            raise IndexError(f'Positions must be between 0 and {self._length - 1}.')
+        runs = np.searchsorted(self.clean_starts, array, side='right') - 1
+        pages = self.pages[runs]
+        raw = self.raw_starts[runs] + (array - self.clean_starts[runs])
+        if array.ndim == 0:
+            return int(pages), int(raw)
+
+        return pages, raw
+
+
+    def span_to_raw(self, start: int, end: int) -> List[Tuple[int, int, int]]:
+        """ Projects a span of the merged text, such as an entity, to the raw pages.
+
+        Parameters
+        ----------
+        start : int
+            Where the span starts in the merged text.
+        end : int
+            Where the span ends in the merged text, not included.
+
+        Returns
+        -------
+        List[Tuple[int, int, int]]
+            The page, the raw start and the raw end of the span in every page it covers,
+            usually only one.
+        """
+        if end <= start:
+            return []
+        pages, raw = self.to_raw(np.arange(start, end))
+        breaks = np.flatnonzero(np.diff(pages)) + 1
+        bounds = zip(np.r_[0, breaks], np.r_[breaks, len(pages)])
+
+        return [
+            (int(pages[first]), int(raw[first]), int(raw[last - 1]) + 1)
+            for first, last in bounds
+        ]
+
+
+def _page_text(page) -> str:
+    return page if isinstance(page, str) else page['lectura']
+
+
+def merge_pages(
+        pages: Union[Mapping, Sequence],
+        remove_accents: bool = True
+    ) -> Tuple[str, OffsetMap]:
+    """ Merges the OCR text of the pages of a document into one clean text, keeping track 
+        of where every character comes from.
+
+        Words split by a hyphen at the end of a line, as 'LESCA-\\n\\nNO', are joined, 
+        keeping the hyphen between digits, as in a CUIT split across lines. Any run of 
+        whitespace becomes one space and the pages are joined by a space.
+
+    Parameters
+    ----------
+    pages : {Mapping, Sequence}
+        The pages in order, as the 'pages' of the example data, with the raw text in 
+        'lectura', or as strings.
+    remove_accents : bool, optional
+        Whether to remove the accents of the vowels, as `remove_tildes` does, by default True.
+
+    Returns
+    -------
+    Tuple[str, OffsetMap]
+        The merged text and the map of its characters to the raw pages.
+    """
+    if isinstance(pages, Mapping):
+        pages = pages.values()
+    pieces = []
+    clean_starts, page_numbers, raw_starts = [], [], []
+    length = 0
+
+    def add(piece: str, page: int, raw_start: int):
+        nonlocal length
+        if piece:
+            pieces.append(piece)
+            clean_starts.append(length)
+            page_numbers.append(page)
+            raw_starts.append(raw_start)
+            length += len(piece)
+
+    previous_end = None
+    for page, raw in enumerate(map(_page_text, pages)):
+        if not raw.strip():
+            continue
+        start, end = len(raw) - len(raw.lstrip()), len(raw.rstrip())
+        if previous_end is not None:
+            if pieces[-1][-2:-1].isalpha() and pieces[-1].endswith('-') and raw[start].isalpha():
+                pieces[-1] = pieces[-1][:-1]
+                length -= 1
+            else:
+                add(' ', *previous_end)
+        position = start
+        for edit in _PAGE_EDITS_PATTERN.finditer(raw, start, end):
+            add(raw[position:edit.start()], page, position)
+            if not edit.group('hyphen'):
+                add(' ', page, edit.start())
+            elif raw[edit.start() - 1].isdigit() and raw[edit.end()].isdigit():
+                add('-', page, edit.start())
+            position = edit.end()
+        add(raw[position:end], page, position)
+        previous_end = (page, len(raw))
+
+    text = ''.join(pieces)
+
+    return remove_tildes(text) if remove_accents else text, OffsetMap(clean_starts, page_numbers, raw_starts, length)
+
+
+def merge_pages_many(
+        documents: Iterable[Union[Mapping, Sequence]],
+        remove_accents: bool = True
+    ) -> Iterator[Tuple[str, OffsetMap]]:
+    """ Merges the pages of a stream of documents, one at a time.
+
+    Parameters
+    ----------
+    documents : Iterable[Union[Mapping, Sequence]]
+        The pages of every document, as `merge_pages` accepts them. It can be a 
+        generator, so only one document needs to be in memory at once.
+    remove_accents : bool, optional
+        Whether to remove the accents of the vowels, by default True.
+
+    Yields
+    ------
+    Tuple[str, OffsetMap]
+        The merged text and the offset map of every document.
+    """
+    for pages in documents:
+        yield merge_pages(pages, remove_accents)
+
+
+_ID_SEPARATOR = r'[ \t]*[-‐–—.]?\s*'
+
+_ID_PATTERN = re.compile(
+    r'(?:(?P<tax_label>(?i:C\.?\s?U\.?\s?I\.?\s?(?P<tax_kind>[TL])\.?))\s*(?i:N[°º.o]?\s*)?:?\s*)?'
+    r'(?<![\d.,/$-])(?P<prefix>\d{2})' + _ID_SEPARATOR + r'(?P<number>\d{8}|\d{1,2}\.\d{3}\.\d{3})'
+    + _ID_SEPARATOR + r'(?P<check>\d)(?![\d/]|[.,]\d)'
+    r'|(?P<dni_label>(?i:D\.?\s?N\.?\s?I\.?|documento\s+n[aá]cional\s+de\s+identidad|documento)'
+    r'(?:\s*(?i:N[°º.o]|n[uú]mero|nro\.?))?)\s*:?\s*(?<![\d.,/$-])(?P<labelled_dni>\d{1,2}\.?\d{3}\.?\d{3})(?![\d/]|[.,]\d)'
+    r'|(?<![\d.,/$-])(?<!\$\s)(?<!(?i:pesos)\s)(?<!(?i:pesos):\s)(?P<dni>\d{1,2}\.\d{3}\.\d{3})(?![\d/]|[.,]\d)(?!\s+(?i:de\s+)?(?i:pesos|cuotas|acciones|votos))'
+)
+
+_SPELLED_AMOUNT_BEFORE_PATTERN = _LazyPattern(f"(?<!\\w){_NUMBER_WORD}\\s*\\(\\s*$", re.IGNORECASE)
+
+_PARENTHESIS_AFTER_PATTERN = re.compile(r'\s*(?:\.?-)?\s*\)')
+
+_CUIT_WEIGHTS = np.array([5, 4, 3, 2, 7, 6, 5, 4, 3, 2], dtype=np.int64)
+
+_CUIT_CHECK_DIGITS = np.array([0, 9, 9, 8, 7, 6, 5, 4, 3, 2, 1], dtype=np.int64)
+
+
+def validate_cuits(values: Iterable[str]) -> np.ndarray:
+    """ Validates the check digit of a batch of CUIT or CUIL numbers at once.
+
+    Parameters
+    ----------
+    values : Iterable[str]
+        The numbers, with or without hyphens, such as '27-17636488-8' or '27176364888'.
+
+    Returns
+    -------
+    np.ndarray
+        A boolean array, True where the value has 11 digits and a correct check digit.
+
+    Examples
+    -------
+    >>> from nlptools.parsing import validate_cuits
+    >>> validate_cuits(['27-17636488-8', '27-17636488-7', '30-5000031'])
+    array([ True, False, False])
+    """
+    digits = [re.sub(r'[^0-9]', '', value) for value in values]
+    valid = np.array([len(value) == 11 for value in digits], dtype=bool)
+    if not valid.any():
+        return valid
+    numbers = np.frombuffer(
+        ''.join(value for value, ok in zip(digits, valid) if ok).encode('ascii'),
+        dtype=np.uint8
+    ).reshape(-1, 11).astype(np.int64) - ord('0')
+    remainders = numbers[:, :10] @ _CUIT_WEIGHTS % 11
+    valid[valid] = _CUIT_CHECK_DIGITS[remainders] == numbers[:, 10]
+
+    return valid
+
+
+def _is_spelled_amount_digits(text: str, start: int, end: int) -> bool:
+    """ Checks if a number is in parentheses after an amount in words, as in 'MIL (1.000.000)'.
+    """
+    return (
+        _PARENTHESIS_AFTER_PATTERN.match(text, end) is not None
+        and _SPELLED_AMOUNT_BEFORE_PATTERN.search(text[max(0, start - 40):start]) is not None
+    )
+
+
+def find_ids(text: str, validate: bool = True) -> List[Tuple[int, int, str, str]]:
+    """ Finds the argentine DNI, CUIT and CUIL numbers in a text.
+
+        The text is scanned once. A CUIT or CUIL can have any of its hyphens, or none, 
+        and can be split across lines, as in 'C.U.I.T.: 27-\\n17636488-8'. A DNI is found 
+        when it has the dots of `data_augmentation.id_generator`, as in '17.636.488', 
+        or after a label such as 'D.N.I.' or 'documento nacional de identidad número'. 
+        A number without a label is not a DNI after '$' or 'pesos', before 'pesos', 
+        'cuotas', 'acciones' or 'votos', nor in parentheses after an amount in words, 
+        as in 'QUINIENTOS MIL (1.500.000)'.
+
+    Parameters
+    ----------
+    text : str
+        The text intended to scan.
+    validate : bool, optional
+        Whether to drop the CUIT and CUIL numbers with a wrong check digit, by default True.
+
+    Returns
+    -------
+    List[Tuple[int, int, str, str]]
+        The start and end of every number in the text, its kind, one of 'DNI', 'CUIT' 
+        or 'CUIL', and its digits without separators. The kind is 'CUIL' only when the 
+        text says so.
+
+    Examples
+    -------
+    >>> from nlptools.parsing import find_ids
+    >>> find_ids('DNI 17.636.488, C.U.I.L.: 27-\\n17636488-8')
+    [(4, 14, 'DNI', '17636488'), (26, 40, 'CUIL', '27176364888')]
+    """
+    found = []
+    for match in _ID_PATTERN.finditer(text):
+        if match.group('prefix'):
+            kind = 'CUIL' if (match.group('tax_kind') or 'T').upper() == 'L' else 'CUIT'
+            start, end = match.start('prefix'), match.end('check')
+            value = match.group('prefix') + match.group('number').replace('.', '') + match.group('check')
+        else:
+            group = 'labelled_dni' if match.group('labelled_dni') else 'dni'
+            kind, start, end = 'DNI', match.start(group), match.end(group)
+            value = match.group(group).replace('.', '')
+            if group == 'dni' and _is_spelled_amount_digits(text, start, end):
+                continue
+        found.append((start, end, kind, value))
+
+    if validate:
+        taxes = [i for i, (_, _, kind, _) in enumerate(found) if kind != 'DNI']
+        invalid = {i for i, ok in zip(taxes, validate_cuits(found[i][3] for i in taxes)) if not ok}
+        found = [item for i, item in enumerate(found) if i not in invalid]
+
+    return found
+
+
+def find_ids_many(texts: Iterable[str], validate: bool = True) -> Iterator[List[Tuple[int, int, str, str]]]:
+    """ Finds the argentine DNI, CUIT and CUIL numbers in a stream of documents, one at a time.
+
+    Parameters
+    ----------
+    texts : Iterable[str]
+        The documents intended to scan. It can be a generator, so the documents 
+        do not need to be in memory at once.
+    validate : bool, optional
+        Whether to drop the CUIT and CUIL numbers with a wrong check digit, by default True.
+
+    Yields
+    ------
+    List[Tuple[int, int, str, str]]
+        The numbers of every document, as `find_ids` returns them.
+    """
+    for text in texts:
+        yield find_ids(text, validate)
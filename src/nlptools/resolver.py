@@ -0,0 +1,331 @@
+"""
+    Tools to resolve the company names extracted from documents, with all their
+    variants and OCR noise, into the canonical companies of the bundled dataset.
+
+Classes
+-------
+- CompanyResolver
+    Resolves raw company names into canonical ids using a cached fuzzy index.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+from nlptools import _lazy_module
+from nlptools.comparison import FuzzyIndex
+from nlptools.datasets import _get_source
+from nlptools.parsing import remove_tildes
+
+pd = _lazy_module('pandas')
+
+
+_QUOTES = re.compile(r'["“”‘’«»\'`´]')
+
+_SEPARATORS = re.compile(r'[^\w.&]+')
+
+_LEGAL_FORMS = {
+    'SOCIEDAD POR ACCIONES SIMPLIFICADA UNIPERSONAL': 'SASU',
+    'SOCIEDAD DE RESPONSABILIDAD LIMITADA': 'SRL',
+    'SOCIEDAD ANONIMA UNIPERSONAL': 'SAU',
+    'SOCIEDAD POR ACCIONES SIMPLIFICADA': 'SAS',
+    'SOCIEDAD EN COMANDITA POR ACCIONES': 'SCA',
+    'SOCIEDAD EN COMANDITA SIMPLE': 'SCS',
+    'SOCIEDAD DE HECHO': 'SH',
+    'SOCIEDAD COLECTIVA': 'SC',
+    'SOCIEDAD ANONIMA': 'SA',
+}
+
+_LEGAL_CODES = {'SASU', 'SRL', 'SAU', 'SAS', 'SCA', 'SCS', 'SH', 'SC', 'SA', 'SAIC', 'SACIF', 'SAPEM', 'SE'}
+
+_FULL_LEGAL_FORM = re.compile(
+    r'\s(' + '|'.join(sorted(_LEGAL_FORMS, key=len, reverse=True)) + r')\s*\.?$'
+)
+
+_SHORT_LEGAL_FORM = re.compile(
+    r'\s((?:[A-Z]\s?\.\s?){1,5}[A-Z]?|(?:[A-Z]\s){1,4}[A-Z]|'
+    + '|'.join(sorted(_LEGAL_CODES, key=len, reverse=True))
+    + r')\.?\s*$'
+)
+
+
+def _is_legal_code(letters: str) -> bool:
+    """ Whether some letters are the code of a legal form, or one truncated or with a letter 
+        misread by the OCR, such as 'S' or 'SRB'. Every code starts with 'S'.
+    """
+    return letters[:1] == 'S' and any(
+        code.startswith(letters)
+        or (len(code) == len(letters) and sum(a != b for a, b in zip(code, letters)) <= 1)
+        for code in _LEGAL_CODES
+    )
+
+
+def _split_legal_form(name: str) -> Tuple[str, Optional[str]]:
+    """ Separates the legal form at the end of a company name from the rest of the name.
+
+    Parameters
+    ----------
+    name : str
+        A raw company name.
+
+    Returns
+    -------
+    Tuple[str, Optional[str]]
+        The normalized name without the legal form, and the canonical code of the
+        legal form, such as 'SRL' or 'SA'. The code is None if there is no legal form
+        or if it can not be recognized, for example when the OCR truncated it.
+    """
+    if not name.isascii():
+        name = remove_tildes(name)
+    text = _QUOTES.sub(' ', name.upper())
+    text = ' '.join(_SEPARATORS.sub(' ', text).split()).strip(' ,')
+    legal_form = None
+
+    match = _FULL_LEGAL_FORM.search(text)
+    if match:
+        legal_form = _LEGAL_FORMS[match.group(1)]
+        text = text[:match.start(1)]
+    else:
+        match = _SHORT_LEGAL_FORM.search(text)
+        if match:
+            for letter in re.finditer(r'[A-Z]', match.group(1)):
+                letters = re.sub(r'[^A-Z]', '', match.group(1)[letter.start():])
+                if _is_legal_code(letters):
+                    legal_form = letters if letters in _LEGAL_CODES else None
+                    text = text[:match.start(1) + letter.start()]
+                    break
+
+    return ' '.join(text.replace('.', ' ').split()), legal_form
+
+
+def normalize_company_name(name: str) -> str:
+    """ Normalizes a company name removing the legal form, quotes, accents and case differences.
+
+    Parameters
+    ----------
+    name : str
+        A raw company name, as extracted from a document.
+
+    Returns
+    -------
+    str
+        The name in uppercase, without accents, quotes, punctuation nor legal form.
+
+    Examples
+    -------
+    >>> from nlptools.resolver import normalize_company_name
+    >>> normalize_company_name('“CONFECOM S.R.L."')
+    'CONFECOM'
+    >>> normalize_company_name('Confecom s.R.b.')
+    'CONFECOM'
+    >>> normalize_company_name('BANCO DE SAN JUAN SOCIEDAD ANÓNIMA')
+    'BANCO DE SAN JUAN'
+    """
+    return _split_legal_form(name)[0]
+
+
+@lru_cache(maxsize=None)
+def _companies_index(index_path: Optional[str] = None) -> Tuple[FuzzyIndex, list, list, list]:
+    """ Builds, once per process, the fuzzy index over the bundled companies dataset.
+
+    Parameters
+    ----------
+    index_path : Optional[str], optional
+        A file where the index is stored. If it exists the index is loaded from it,
+        otherwise it is built and saved there, by default None.
+
+    Returns
+    -------
+    Tuple[FuzzyIndex, list, list, list]
+        The index over the normalized names, the canonical ids, the canonical names
+        and the legal forms of every company.
+    """
+    return _build_index(_get_source('companies'), index_path)
+
+
+def _source_fingerprint(names: List[str]) -> str:
+    """ Identifies the names of a companies table, to know if a stored index was built from it.
+    """
+    digest = hashlib.sha256('\x00'.join(names).encode('utf-8')).hexdigest()
+    return f'{len(names)}:{digest}'
+
+
+def _build_index(
+        source: pd.DataFrame,
+        index_path: Optional[str] = None,
+        id_column: str = 'cuit',
+        name_column: str = 'name'
+    ) -> Tuple[FuzzyIndex, list, list, list]:
+    """ Builds the fuzzy index over the normalized names of a companies table.
+
+    Parameters
+    ----------
+    source : pd.DataFrame
+        A table with, at least, an id column and a name column.
+    index_path : Optional[str], optional
+        A file where the index is stored. If it exists and was built from the same names
+        the index is loaded from it, otherwise it is built and saved there, along with
+        a fingerprint of the names, by default None.
+    id_column : str, optional
+        The column with the canonical id, by default 'cuit'.
+    name_column : str, optional
+        The column with the canonical name, by default 'name'.
+
+    Returns
+    -------
+    Tuple[FuzzyIndex, list, list, list]
+        The index over the normalized names, the canonical ids, the canonical names
+        and the legal forms of every company.
+    """
+    source = source.dropna(subset=[name_column])
+    ids = source[id_column].tolist()
+    names = source[name_column].tolist()
+    split = [_split_legal_form(name) for name in names]
+    legal_forms = [legal_form for _, legal_form in split]
+
+    fingerprint = _source_fingerprint(names)
+    fingerprint_path = f'{index_path}.fingerprint'
+    stored = None
+    if index_path and os.path.exists(index_path) and os.path.exists(fingerprint_path):
+        with open(fingerprint_path, 'r', encoding='utf-8') as file:
+            stored = file.read()
+
+    if stored == fingerprint:
+        index = FuzzyIndex.load(index_path)
+    else:
+        index = FuzzyIndex([normalized for normalized, _ in split])
+        if index_path:
+            index.save(index_path)
+            with open(fingerprint_path, 'w', encoding='utf-8') as file:
+                file.write(fingerprint)
+
+    return index, ids, names, legal_forms
+
+
+class CompanyResolver:
+    """
+        Resolves raw company names into the canonical companies of a dataset, using
+        a fuzzy index built once and a cache of the most recent resolutions.
+
+    Attributes
+    --------
+    - CompanyResolver.threshold
+        The level of similarity required to accept a resolution.
+    - CompanyResolver.candidates
+        How many similar names are compared to prefer the one with the same legal form.
+
+    Methods
+    -------
+    - CompanyResolver.resolve
+    - CompanyResolver.resolve_many
+    - CompanyResolver.cache_info
+    - CompanyResolver.cache_clear
+
+    Examples
+    -------
+    >>> from nlptools.resolver import CompanyResolver
+    >>> resolver = CompanyResolver()
+    >>> resolver.resolve('BANCO BBVA ARGENTINA s.a."')
+    ('30500003193', 'BANCO BBVA ARGENTINA S.A.', 1.0)
+    """
+    def __init__(
+            self,
+            source: pd.DataFrame = None,
+            threshold: float = 0.85,
+            cache_size: int = 10000,
+            candidates: int = 10,
+            index_path: str = None,
+            id_column: str = 'cuit',
+            name_column: str = 'name'
+        ):
+        if source is None:
+            self._index, self._ids, self._names, self._legal_forms = _companies_index(index_path)
+        else:
+            self._index, self._ids, self._names, self._legal_forms = _build_index(
+                source, index_path, id_column, name_column)
+        self.threshold = threshold
+        self.candidates = candidates
+        self._resolve_cached = lru_cache(maxsize=cache_size)(self._resolve)
+
+
+    def _resolve(self, name: str) -> Optional[Tuple[str, str, float]]:
+        """ Resolves a company name without looking at the cache.
+
+        Parameters
+        ----------
+        name : str
+            A raw company name.
+
+        Returns
+        -------
+        Optional[Tuple[str, str, float]]
+            The canonical id, the canonical name and the score, or None if no company is similar enough.
+        """
+        normalized, legal_form = _split_legal_form(name)
+        matches = self._index.extract_best(normalized, self.candidates, self.threshold)
+        if not matches:
+            return None
+
+        best_score = matches[0][1]
+        best = [position for _, score, position in matches if score == best_score]
+        same_form = [position for position in best if legal_form and self._legal_forms[position] == legal_form]
+        position = (same_form or best)[0]
+
+        return self._ids[position], self._names[position], best_score
+
+
+    def resolve(self, name: str) -> Optional[Tuple[str, str, float]]:
+        """ Resolves a raw company name into a canonical company.
+
+        Parameters
+        ----------
+        name : str
+            A company name as extracted from a document, such as 'CONFECOM s.R.b.'.
+
+        Returns
+        -------
+        Optional[Tuple[str, str, float]]
+            The canonical id, the canonical name and the similarity score of the normalized
+            names. If several companies are equally similar, the one with the same legal form
+            is preferred. Returns None if no company is similar enough.
+        """
+        if not isinstance(name, str) or not name.strip():
+            return None
+
+        return self._resolve_cached(name)
+
+
+    def resolve_many(self, names: Iterable[str]) -> List[Optional[Tuple[str, str, float]]]:
+        """ Resolves a batch of raw company names, resolving repeated names only once.
+
+        Parameters
+        ----------
+        names : Iterable[str]
+            Company names as extracted from documents.
+
+        Returns
+        -------
+        List[Optional[Tuple[str, str, float]]]
+            The resolution of every name, in the same order, as `CompanyResolver.resolve` returns it.
+        """
+        names = list(names)
+        resolved = {}
+        for name in names:
+            if name not in resolved:
+                resolved[name] = self.resolve(name)
+
+        return [resolved[name] for name in names]
+
+
+    def cache_info(self):
+        """ Returns the hits, misses and size of the cache of recent resolutions.
+        """
+        return self._resolve_cached.cache_info()
+
+
+    def cache_clear(self):
+        """ Empties the cache of recent resolutions.
+        """
+        self._resolve_cached.cache_clear()
@@ -1,12 +1,14 @@
 """ This module contains everything you need to train a SpaCy NER model.
 """
+from __future__ import annotations
+
 from typing import List, Union
 from datetime import datetime
+from nlptools import _lazy_module
 from nlptools.comparison import is_similar_word
-from tqdm.autonotebook import trange
 import numpy as np
-import spacy
-from spacy.util import minibatch, compounding
+
+spacy = _lazy_module('spacy')
 
 
 
@@ -78,6 +80,9 @@ def train_new_model(
         A trained model capable to recognize the target entities to a certain extent.
     """
 
+    from spacy.util import minibatch, compounding
+    from tqdm.autonotebook import trange
+
     if target_device=='gpu':
         spacy.prefer_gpu()
    
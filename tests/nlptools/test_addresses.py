@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+import pytest
+from nlptools import data_augmentation
+from nlptools.addresses import AddressIndex
+
+
+class TestAddressIndex:
+    source = pd.DataFrame({
+        'provincia': [
+            'Ciudad Autónoma de Buenos Aires', 'Ciudad Autónoma de Buenos Aires', 'Provincia de Buenos Aires',
+            'Provincia de Buenos Aires', 'Provincia de Buenos Aires', 'Provincia de Córdoba',
+            'Provincia de Córdoba', 'Provincia de Córdoba',
+        ],
+        'departamento': [
+            'Comuna 12', 'Comuna 13', 'La Matanza', 'La Matanza', 'La Matanza', 'Capital', 'Capital', 'Colón',
+        ],
+        'nombre': [
+            'PICO', 'AV CABILDO', 'SAN MARTIN', 'CALLE 1356', 'PICO', 'SAN MARTIN', 'AV GRL PAZ', 'SAN MARTIN',
+        ],
+    })
+
+    def test_structure(self):
+        index = AddressIndex(self.source)
+        assert index.provincias == sorted(set(self.source['provincia'])) and len(index) == 8
+        assert index.departamentos == ['Comuna 12', 'Comuna 13', 'La Matanza', 'Capital', 'Colón']
+        assert index.provincia_starts.tolist() == [0, 2, 3, 5]
+        assert index.departamento_starts.tolist() == [0, 1, 2, 5, 7, 8]
+        assert index.streets.dtype == np.int32 and index.street_departamento.dtype == np.int16
+        triples = set(zip(self.source['nombre'], self.source['departamento'], self.source['provincia']))
+        assert set(index.take(range(len(index))).itertuples(index=False, name=None)) == triples
+
+    def test_sample(self):
+        index = AddressIndex(self.source)
+        assert index.sample(50, seed=1).tolist() == index.sample(50, seed=1).tolist()
+        drawn = index.take(index.sample(200, provincia='cordoba', seed=2))
+        assert set(drawn['provincia']) == {'Provincia de Córdoba'} and set(drawn['departamento']) == {'Capital', 'Colón'}
+        drawn = index.take(index.sample(50, departamento='partido de la matanza', seed=3))
+        assert set(drawn['nombre']) == {'SAN MARTIN', 'CALLE 1356', 'PICO'}
+        with pytest.raises(KeyError):
+            index.sample(1, provincia='Provincia de Salta')
+        with pytest.raises(KeyError):
+            index.sample(1, departamento='Capital', provincia='Provincia de Buenos Aires')
+
+    def test_prefix_and_lookups(self):
+        index = AddressIndex(self.source)
+        assert index.streets_with_prefix('avenida') == ['AV CABILDO', 'AV GRL PAZ']
+        assert index.streets_with_prefix('Av. General P') == ['AV GRL PAZ']
+        assert index.streets_with_prefix('s', provincia='Provincia de Buenos Aires') == ['SAN MARTIN']
+        assert index.streets_with_prefix('p', departamento='Comuna 13') == []
+        assert index.provincias[index.find_provincia('Capital Federal')] == 'Ciudad Autónoma de Buenos Aires'
+        assert index.provincias[index.find_provincia('Pcia. de Cordoba')] == 'Provincia de Córdoba'
+        assert index.find_provincia('Salta') is None
+        assert index.departamentos[index.find_departamento('partido de La Matanza')] == 'La Matanza'
+        assert index.find_departamento('Capital', 'Provincia de Buenos Aires') is None
+
+    @pytest.mark.parametrize('address, expected', [
+        ('Pico 4785, ciudad autonoma de buenos Aires', ('PICO', '4785', 'Comuna 12', 'Ciudad Autónoma de Buenos Aires')),
+        ('Pico 10, piso 3, departamento B, partido de La Matanza, Provincia de Buenos Aires', ('PICO', '10', 'La Matanza', 'Provincia de Buenos Aires')),
+        ('Calle 1356 3270, Provincia de Buenos Aires', ('CALLE 1356', '3270', 'La Matanza', 'Provincia de Buenos Aires')),
+        ('San Martín Nº 12, departamento de Capital, Córdoba', ('SAN MARTIN', '12', 'Capital', 'Provincia de Córdoba')),
+        ('San Martin 12, Córdoba', ('SAN MARTIN', '12', None, 'Provincia de Córdoba')),
+        ('Avenida General Paz 500, de esta ciudad', ('AV GRL PAZ', '500', 'Capital', 'Provincia de Córdoba')),
+        ('Av. Cabildo 2040, Provincia de Córdoba', (None, None, None, 'Provincia de Córdoba')),
+        ('Calle Falsa 123', (None, None, None, None)),
+    ])
+    def test_normalize(self, address, expected):
+        normalized = AddressIndex(self.source).normalize(address)
+        assert (normalized['calle'], normalized['altura'], normalized['departamento'], normalized['provincia']) == expected
+
+    def test_normalize_many(self):
+        index = AddressIndex(self.source)
+        addresses = ['Pico 1, CABA', None, 'Pico 1, CABA']
+        assert index.normalize_many(addresses) == [index.normalize('Pico 1, CABA'), None, index.normalize('Pico 1, CABA')]
+
+
+class TestAddressGenerator:
+    def test_consistent_combinations(self, monkeypatch):
+        index = AddressIndex(TestAddressIndex.source)
+        monkeypatch.setattr(data_augmentation, 'address_index', lambda shared=None: index)
+        pairs = set(zip(TestAddressIndex.source['departamento'], TestAddressIndex.source['provincia']))
+        legal = data_augmentation.address_generator(50, legal=True, seed=1)
+        assert {tuple(address.split(', ', 1)) for address in legal} <= pairs
+
+        addresses = data_augmentation.address_generator(100, seed=1)
+        assert len(addresses) == 100
+        for address, normalized in zip(addresses, index.normalize_many(addresses)):
+            assert normalized['calle'] is not None
+            if not address.endswith('ciudad'):
+                assert normalized['provincia'] is not None
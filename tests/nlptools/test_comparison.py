@@ -1,3 +1,4 @@
+import pickle
 import pytest
 from unittest import mock
 from rapidfuzz import fuzz
@@ -7,8 +8,20 @@ from nlptools.comparison import (
     similar_word_in_sentence, 
     is_sentence_contained_in_longer_sentence,
     get_similar_word_in_sentence,
-    any_word_in_sentence
+    any_word_in_sentence,
+    any_word_in_sentences,
+    score_matrix,
+    similar_pairs,
+    FuzzyIndex,
+    PreparedQuery,
+    PreparedCorpus,
+    locate_sentence,
+    locate_entities,
+    extract_best_words,
+    get_best_similar_word,
+    KeywordScanner
 )
+from nlptools.example import example_data
     
 
 
@@ -99,4 +112,247 @@ class TestCompareFunctions:
                 ratio_func='QRatio'
         )
         assert isinstance(fourth_test, bool)
-        assert fourth_test == False
\ No newline at end of file
+        assert fourth_test == False
+
+
+class TestBatchFunctions:
+    words = ['hola', 'Hola', 'como', 'te', 'va?', 'todo', 'bien', 'bueno', 'chau', '', 'BUENO!']
+    keywords = ['hola', 'chau', 'va', 'buenos', 'ninguna', '']
+
+    @pytest.mark.parametrize('ratio_func', ['ratio', 'QRatio'])
+    @pytest.mark.parametrize('threshold', [0.0, 0.5, 0.7, 0.8, 1.0])
+    def test_score_matrix_matches_is_similar_word(self, ratio_func, threshold):
+        scores = score_matrix(self.keywords, self.words, threshold, ratio_func)
+        assert scores.shape == (len(self.keywords), len(self.words))
+        for i, keyword in enumerate(self.keywords):
+            for j, word in enumerate(self.words):
+                expected = is_similar_word(keyword, word, threshold, ratio_func)
+                assert (scores[i, j] > threshold) == expected
+
+    @pytest.mark.parametrize('ratio_func', ['ratio', 'QRatio'])
+    def test_similar_pairs(self, ratio_func):
+        pairs = similar_pairs(self.keywords, self.words, 0.7, ratio_func, lowercase=True)
+        expected = [
+            (i, j)
+            for i, keyword in enumerate(self.keywords)
+            for j, word in enumerate(self.words)
+            if is_similar_word(keyword.lower(), word.lower(), 0.7, ratio_func)
+        ]
+        assert [(i, j) for i, j, _ in pairs] == expected
+        assert all(score > 0.7 for _, _, score in pairs)
+
+    def test_any_word_in_sentence_strict_threshold(self):
+        assert any_word_in_sentence(['abc'], ['abd', 'xyz'], 2 / 3 - 1e-9) == True
+        assert any_word_in_sentence(['abc'], ['abd', 'xyz'], 0.7) == False
+        assert any_word_in_sentence(['abc'], [], 0.5) == False
+
+    def test_invalid_ratio_func(self):
+        with pytest.raises(KeyError):
+            score_matrix(['a'], ['b'], ratio_func='WRatio')
+
+
+
+class TestFuzzyIndex:
+    vocabulary = [
+        'BANCO BBVA ARGENTINA S.A.', 'BANCO DE SAN JUAN S A', 'CONFECOM S.R.L.', 
+        'Confecom SA', 'OFICOM S.R.L.', '', 'ACME SRL', 'CAME SRL', 'confecom s.r.l.'
+    ]
+    queries = ['confecom srl', 'CONFECOM S.', 'Banco de San Juan', 'acme', 'zzz', '']
+
+    @pytest.mark.parametrize('ratio_func', ['ratio', 'QRatio'])
+    @pytest.mark.parametrize('threshold', [0.0, 0.5, 0.8, 0.95])
+    def test_search_matches_linear_scan(self, ratio_func, threshold):
+        index = FuzzyIndex(self.vocabulary, ratio_func)
+        for query in self.queries:
+            expected = [
+                w 
+                for w in self.vocabulary 
+                if is_similar_sentence(w.lower(), query.lower(), threshold, ratio_func)
+            ]
+            assert [w for w, _, _ in index.search(query, threshold)] == expected
+            assert index.get_similar_word(query, threshold) == get_similar_word_in_sentence(
+                query, self.vocabulary, threshold, ratio_func)
+            assert index.similar_word(query, threshold) == similar_word_in_sentence(
+                query, self.vocabulary, threshold, ratio_func)
+
+    @pytest.mark.parametrize('limit', [1, 2, 5])
+    def test_extract_best_matches_extract_best_words(self, limit):
+        index = FuzzyIndex(self.vocabulary)
+        for query in self.queries:
+            assert index.extract_best(query, limit, 0.5) == extract_best_words(query, self.vocabulary, limit, 0.5)
+
+    def test_save_and_load(self, tmp_path):
+        index = FuzzyIndex(self.vocabulary)
+        filepath = str(tmp_path / 'index.pkl')
+        index.save(filepath)
+        loaded = FuzzyIndex.load(filepath)
+        assert len(loaded) == len(index)
+        assert loaded.search('confecom srl') == index.search('confecom srl')
+
+
+
+class TestPreparedObjects:
+    sentence = ['La', 'Razón', 'social', 'es', 'CONFECOM', '', 'S.R.L.']
+
+    @pytest.mark.parametrize('ratio_func', ['ratio', 'QRatio'])
+    @pytest.mark.parametrize('word', ['razon', 'Confecom', 'srl', 'nada', ''])
+    def test_same_results_as_plain_strings(self, ratio_func, word):
+        query = PreparedQuery(word)
+        corpus = PreparedCorpus(self.sentence)
+        for threshold in [0.5, 0.8]:
+            assert similar_word_in_sentence(query, corpus, threshold, ratio_func) == \
+                   similar_word_in_sentence(word, self.sentence, threshold, ratio_func)
+            assert get_similar_word_in_sentence(query, corpus, threshold, ratio_func) == \
+                   get_similar_word_in_sentence(word, self.sentence, threshold, ratio_func)
+            assert any_word_in_sentence(PreparedCorpus([word], lowercase=False), self.sentence, threshold, ratio_func) == \
+                   any_word_in_sentence([word], self.sentence, threshold, ratio_func)
+
+    def test_remove_accents(self):
+        query = PreparedQuery('RAZÓN', remove_accents=True)
+        assert query.normalized == 'razon'
+        assert query.processed('QRatio') == 'razon'
+        assert is_similar_word(query, PreparedQuery('Razon'), 0.99)
+        assert get_similar_word_in_sentence(query, PreparedCorpus(self.sentence, remove_accents=True), 0.99) == 'Razón'
+        assert is_sentence_contained_in_longer_sentence(
+            PreparedQuery('La Razón', remove_accents=True), 'la razon social es confecom')
+
+
+
+class TestLocateSentence:
+    text = 'Raul Alberto LESCA-\n\nNO, nacida el 10 de marzo de 1966, y Yamila Belén LESCANO, nacida el 6 de marzo'
+
+    def test_best_alignment(self):
+        start, end, score = locate_sentence('Yamila Belen LESCANO', self.text)[0]
+        assert self.text[start:end] == 'Yamila Belén LESCANO'
+        assert score > 0.9
+
+    def test_top_k_alignments_do_not_overlap(self):
+        alignments = locate_sentence('de marzo de', self.text, 0.8, top_k=3)
+        assert len(alignments) == 2
+        assert alignments[0][1] <= alignments[1][0] or alignments[1][1] <= alignments[0][0]
+        assert [self.text[start:end] for start, end, _ in alignments] == ['de marzo de', 'de marzo']
+        assert locate_sentence('de marzo de', self.text, 0.8, top_k=1) == alignments[:1]
+        assert locate_sentence('de marzo de', self.text, 0.8, top_k=0) == []
+
+    def test_length_changing_lowercase(self):
+        text = 'La firma de İSTANBUL TEXTIL S.A. y de ANKARA S.A.'
+        start, end, score = locate_sentence('İstanbul Textil', text)[0]
+        assert text[start:end] == 'İSTANBUL TEXTIL' and score == 1.0
+        located = locate_entities([{'text': 'İstanbul Textil'}, {'text': 'Ankara'}], text)
+        assert [(text[e['start']:e['end']], e['score']) for e in located] == [('İSTANBUL TEXTIL', 1.0), ('ANKARA', 1.0)]
+
+    def test_query_longer_than_text(self):
+        assert locate_sentence('abcdef', 'abcde') == [(0, 5, pytest.approx(0.909, abs=1e-3))]
+        assert locate_sentence('LESCANO', 'Lescan')[0][:2] == (0, 6)
+        assert locate_sentence('abcdef', 'xyz') == [] and locate_sentence('abcdef', '') == []
+        assert locate_entities([{'text': 'Lescano'}], 'Lescan')[0]['end'] == 6
+
+    def test_not_found(self):
+        assert locate_sentence('sociedad anonima', self.text) == []
+        assert locate_sentence('', self.text) == []
+
+    def test_locate_entities(self):
+        entities = example_data['entities']['tags']
+        located = locate_entities(entities, example_data['text'])
+        assert [(e['start'], e['end']) for e in located] == [(e['start'], e['end']) for e in entities]
+        assert all(e['score'] == 1.0 for e in located)
+
+        raw_text = ''.join(page['lectura'] for page in example_data['pages'].values())
+        located = locate_entities(entities, raw_text)
+        assert raw_text[located[0]['start']:located[0]['end']] == 'Raul Alberto Lescano'
+        assert all(e['score'] > 0.9 for e in located)
+
+
+
+class TestTopK:
+    words = ['Aple', 'The', 'apple', 'Apples', '', 'APPLE', 'appel']
+
+    @pytest.mark.parametrize('ratio_func', ['ratio', 'QRatio'])
+    @pytest.mark.parametrize('limit', [1, 2, 3, 10])
+    def test_extract_best_words_matches_full_sort(self, ratio_func, limit):
+        scorer = fuzz.ratio if ratio_func == 'ratio' else fuzz.QRatio
+        scored = [(w, scorer(w.lower(), 'apple') / 100, i) for i, w in enumerate(self.words) if w]
+        expected = sorted(
+            [x for x in scored if x[1] > 0.5],
+            key=lambda x: (-x[1], x[2])
+        )[:limit]
+        assert extract_best_words('Apple', self.words, limit, 0.5, ratio_func) == expected
+
+    def test_get_best_similar_word(self):
+        assert get_similar_word_in_sentence('apple', self.words) == 'Aple'
+        assert get_best_similar_word('apple', self.words) == 'apple'
+        assert get_best_similar_word('apple', PreparedCorpus(self.words)) == 'apple'
+        assert get_best_similar_word('pear', self.words) is None
+
+
+class TestBackends:
+    keywords = ['sociedad', 'capital', 'gerente', 'Apple', 'Sociedad']
+    words = example_data['text'].split()
+
+    @pytest.mark.parametrize('backend', ['serial', 'thread', 'process'])
+    @pytest.mark.parametrize('chunksize', [None, 1, 7])
+    def test_same_result_as_serial(self, backend, chunksize):
+        expected = score_matrix(self.keywords, self.words, 0.5)
+        scores = score_matrix(self.keywords, self.words, 0.5, backend=backend, n_jobs=2, chunksize=chunksize)
+        assert (scores == expected).all()
+        scores = score_matrix(self.words, self.keywords, 0.5, backend=backend, n_jobs=2, chunksize=chunksize)
+        assert (scores == expected.T).all()
+        assert similar_pairs(self.keywords, self.words, backend=backend, n_jobs=2, chunksize=chunksize) == \
+            similar_pairs(self.keywords, self.words)
+
+    @pytest.mark.parametrize('backend', ['serial', 'thread', 'process'])
+    def test_any_word_in_sentences(self, backend):
+        sentences = [self.words[i:i + 20] for i in range(0, len(self.words), 20)] + [[]]
+        expected = [any_word_in_sentence(['gerente'], sentence) for sentence in sentences]
+        assert any_word_in_sentences(['gerente'], sentences, backend=backend, n_jobs=2) == expected
+        assert True in expected and False in expected
+
+    def test_invalid_backend(self):
+        with pytest.raises(KeyError):
+            score_matrix(self.keywords, self.words, backend='gpu')
+        with pytest.raises(KeyError):
+            any_word_in_sentences(self.keywords, [self.words], backend='gpu')
+
+
+class TestKeywordScanner:
+    words = example_data['text'].split()
+    keywords = ['SOCIEDAD', 'socios', 'Gerentte', 'capital.', '$', 'inexistente']
+
+    @pytest.mark.parametrize('ratio_func', ['ratio', 'QRatio'])
+    @pytest.mark.parametrize('threshold', [0.0, 0.6, 0.8, 0.95, 1.0])
+    def test_same_as_any_word_in_sentence(self, ratio_func, threshold):
+        sentences = [self.words[i:i + 15] for i in range(0, len(self.words), 15)]
+        for keywords in [self.keywords, self.keywords[-1:], self.keywords[2:4]]:
+            scanner = KeywordScanner(keywords, threshold, ratio_func)
+            expected = [any_word_in_sentence(keywords, s, threshold, ratio_func) for s in sentences]
+            assert [scanner.contains(s) for s in sentences] == expected
+            assert scanner.contains_many([' '.join(s) for s in sentences]) == expected
+
+    @pytest.mark.parametrize('threshold', [0.8, 0.95])
+    def test_punctuated_keywords(self, threshold):
+        keywords = ['á!b', 's.r.l', 'x-y']
+        sentences = [['á', 'b'], ['á!b'], ['á?b'], ['s', 'r', 'l'], ['S.R.L'], ['x', 'y'], ['x-y', 'z']]
+        scanner = KeywordScanner(keywords, threshold, 'QRatio')
+        expected = [any_word_in_sentence(keywords, s, threshold, 'QRatio') for s in sentences]
+        assert [scanner.contains(s) for s in sentences] == expected
+        assert expected == [False, True, True, False, True, False, True]
+
+    def test_find(self):
+        scanner = KeywordScanner(['gerente', 'capital social', 'S.A.'], 0.8, lowercase=True)
+        text = 'El capital social y la Gerente de  ACME S.A. gerentes capital'
+        assert scanner.find(text) == [
+            (3, 17, 'capital social', 1.0),
+            (23, 30, 'gerente', 1.0),
+            (40, 44, 'S.A.', 1.0),
+            (45, 53, 'gerente', 0.9333333333333332),
+        ]
+        assert text[45:53] == 'gerentes'
+        assert scanner.contains('capital social') and not scanner.contains('capital')
+
+    @pytest.mark.parametrize('backend', ['serial', 'thread', 'process'])
+    def test_pickle_and_backends(self, backend):
+        scanner = pickle.loads(pickle.dumps(KeywordScanner(self.keywords, 0.8, lowercase=True)))
+        documents = [' '.join(self.words[i:i + 50]) for i in range(0, len(self.words), 50)]
+        expected = [scanner.contains(d) for d in documents]
+        assert scanner.contains_many(documents, backend=backend, n_jobs=2, chunksize=3) == expected
+        assert True in expected and False in expected
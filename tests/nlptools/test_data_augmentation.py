@@ -0,0 +1,94 @@
+import collections
+import datetime
+import re
+import pytest
+from nlptools.data_augmentation import (
+    TaggedDoc,
+    aporte_generator,
+    capital_generator,
+    date_formatter,
+    id_generator,
+    mandato_generator,
+    random_date_generator,
+    tipicidad_generator,
+    vigencia_generator
+)
+
+
+def _frequencies(values, key) -> collections.Counter:
+    counts = collections.Counter(key(value) for value in values)
+    return collections.Counter({category: count / len(values) for category, count in counts.items()})
+
+
+def _assert_equivalent(scalar, batch, key, size=4000, tolerance=0.04):
+    expected = _frequencies([scalar() for _ in range(size)], key)
+    drawn = _frequencies(batch(size), key)
+    assert set(drawn) <= set(expected)
+    assert max(abs(expected[category] - drawn[category]) for category in expected) < tolerance
+
+
+class TestBatchGenerators:
+    @pytest.mark.parametrize('generator', [
+        random_date_generator, id_generator, capital_generator, aporte_generator,
+        mandato_generator, vigencia_generator, tipicidad_generator,
+    ])
+    def test_seed_and_size(self, generator):
+        values = generator(seed=3, n=50)
+        assert len(values) == 50 and values == generator(seed=3, n=50)
+        assert generator(n=0) == []
+
+    def test_dates(self):
+        dates = random_date_generator(2000, 1, 1, 2000, 3, 1, seed=1, n=500)
+        assert all(datetime.date(2000, 1, 1) <= date < datetime.date(2000, 3, 1) for date in dates)
+        assert random_date_generator(1991, 2, 1, 1991, 2, 1, n=3) == [datetime.date(1991, 2, 1)] * 3
+
+    @pytest.mark.parametrize('formality', ['basic', 'basic2', 'mixed', 'mixed2', 'regular', 'formal', 'veryformal'])
+    @pytest.mark.parametrize('include_year', [True, False])
+    def test_date_formatter(self, formality, include_year):
+        dates = random_date_generator(seed=2, n=40) + [datetime.date(2020, 3, 5), datetime.date(1999, 12, 31)]
+        assert date_formatter(dates, formality, include_year) == [
+            date_formatter(date, formality, include_year) for date in dates
+        ]
+
+    def test_date_formatter_random(self):
+        date = datetime.date(1945, 12, 27)
+        formats = {date_formatter(date, formality) for formality in ['basic', 'basic2', 'mixed', 'mixed2', 'regular', 'formal', 'veryformal']}
+        _assert_equivalent(lambda: date_formatter(date), lambda size: date_formatter([date] * size), lambda value: value)
+        assert set(date_formatter([date] * 200, seed=1)) == formats
+        with pytest.raises(KeyError):
+            date_formatter([date], 'unknown')
+
+    def test_ids(self):
+        assert all(re.fullmatch(r'\d{1,2}\.\d{3}\.\d{3}', value) for value in id_generator(seed=1, n=300))
+        assert all(re.fullmatch(r'(2\d|3[0-5])-\d{8}-[1-9]', value) for value in id_generator(cuit=True, seed=1, n=300))
+        _assert_equivalent(lambda: id_generator(cuit=True), lambda size: id_generator(cuit=True, n=size), lambda value: value[:2])
+
+    def test_capital(self):
+        assert not any(re.search(r'\d', value) for value in capital_generator('written', n=300))
+        assert all(re.fullmatch(r'.+ \(\$ [\d.]+\)|\$[\d.]+ \(.+\)', value) for value in capital_generator('mixed', n=300))
+        assert all(re.fullmatch(r'(\d{1,2}\.)?\d{1,3}\.[05]00', value) for value in capital_generator('number', n=300))
+        _assert_equivalent(
+            capital_generator, lambda size: capital_generator(n=size),
+            lambda value: (value[0].isdigit(), value.startswith('$'), '(' in value, 'mill' in value, value.count('.'))
+        )
+        with pytest.raises(KeyError):
+            capital_generator('unknown', n=3)
+
+    def test_phrases(self):
+        _assert_equivalent(aporte_generator, lambda size: aporte_generator(n=size), lambda value: type(value))
+        _assert_equivalent(mandato_generator, lambda size: mandato_generator(n=size), lambda value: value)
+        _assert_equivalent(vigencia_generator, lambda size: vigencia_generator(n=size), lambda value: type(value), tolerance=0.03)
+        _assert_equivalent(tipicidad_generator, lambda size: tipicidad_generator(n=size), lambda value: value)
+        assert {type(value) for value in vigencia_generator(n=300)} == {int, str}
+        assert all(1 <= value <= 100 for value in vigencia_generator(n=300) if isinstance(value, int))
+
+
+class TestTaggedDoc:
+    def test_index_augmentation(self):
+        document = {'doc_id': 'doc', 'text': 'ab cd ef', 'entities': {'tags': [
+            {'start': 6, 'end': 8, 'tag': 'c', 'text': 'ef', 'new_text': 'EF'},
+            {'start': 0, 'end': 2, 'tag': 'a', 'text': 'ab', 'new_text': 'ABCD'},
+            {'start': 3, 'end': 5, 'tag': 'b', 'text': 'cd', 'new_text': 'C'},
+        ]}}
+        entities = TaggedDoc(document).index_augmentation()
+        assert [(e['new_text'], e['start'], e['end']) for e in entities] == [('ABCD', 0, 4), ('C', 5, 6), ('EF', 7, 9)]
@@ -0,0 +1,259 @@
+import json
+import multiprocessing
+import os
+import pickle
+import numpy as np
+import pandas as pd
+import pytest
+from nlptools import datasets
+from nlptools.corpus import CorpusWriter, ShardedCorpus
+from nlptools.datasets import (
+    DatasetCache,
+    StringColumn,
+    _get_source,
+    _read_columnar,
+    _read_csv_source,
+    _write_columnar,
+    clear_dataset_cache,
+    columnar_cache_dir,
+    dataset_cache_info,
+    load_columnar,
+    load_dataset,
+    load_source,
+    sample_positions,
+    set_dataset_cache_budget,
+    share_datasets
+)
+
+
+@pytest.fixture(scope='module', autouse=True)
+def cache_dir(tmp_path_factory):
+    previous = os.environ.get('NLPTOOLS_CACHE_DIR')
+    os.environ['NLPTOOLS_CACHE_DIR'] = str(tmp_path_factory.mktemp('nlptools_cache'))
+    yield os.environ['NLPTOOLS_CACHE_DIR']
+    if previous is None:
+        del os.environ['NLPTOOLS_CACHE_DIR']
+    else:
+        os.environ['NLPTOOLS_CACHE_DIR'] = previous
+
+
+def _shared_sample(handle):
+    from nlptools.data_augmentation import random_name_generator
+    return random_name_generator(20, 'company', seed=5, shared=handle)
+
+
+def _fake_loader(data_name):
+    return pd.DataFrame({'name': [data_name * 100] * 100})
+
+
+class TestDatasetCache:
+    def test_loads_once_and_views_are_read_only(self):
+        clear_dataset_cache()
+        calles = _get_source('calles')
+        first = calles.loc[0, 'nombre']
+        calles.loc[0, 'nombre'] = 'MODIFICADA'
+        calles['nueva'] = 1
+        again = _get_source('calles')
+        assert again.loc[0, 'nombre'] == first and 'nueva' not in again.columns
+        info = dataset_cache_info()['calles']
+        assert info['loads'] == 1 and info['hits'] == 1 and info['cached']
+        assert info['bytes'] > 0 and info['load_time'] > 0
+        assert _get_source('unknown') is None
+
+    def test_budget_and_eviction(self):
+        size = DatasetCache(loader=_fake_loader).get('a').memory_usage(index=True, deep=True).sum()
+        cache = DatasetCache(max_bytes=int(2.5 * size), loader=_fake_loader)
+        cache.get('a'), cache.get('b'), cache.get('a'), cache.get('c')
+        assert 'a' in cache and 'c' in cache and 'b' not in cache
+        assert cache.nbytes <= cache.max_bytes
+        assert cache.info()['b'] == {'cached': False, 'bytes': size, 'load_time': pytest.approx(0, abs=1), 'loads': 1, 'hits': 0}
+        cache.get('b')
+        assert cache.info()['b']['loads'] == 2
+
+    def test_lowering_budget(self, monkeypatch):
+        cache = DatasetCache(loader=_fake_loader)
+        monkeypatch.setattr(datasets, '_DATASET_CACHE', cache)
+        cache.get('a'), cache.get('b')
+        size = cache.info()['a']['bytes']
+        set_dataset_cache_budget(int(1.5 * size))
+        assert 'a' not in cache and 'b' in cache and cache.nbytes <= cache.max_bytes
+        set_dataset_cache_budget(1000)
+        assert 'b' not in cache and cache.nbytes == 0 and not cache.info()['b']['cached']
+        cache.get('b')
+        assert 'b' not in cache and cache.info()['b']['loads'] == 2
+
+    def test_clear(self):
+        cache = DatasetCache(max_bytes=0, loader=_fake_loader)
+        assert cache.get('a')['name'].iloc[0] == 'a' * 100 and 'a' not in cache
+        cache = DatasetCache(loader=_fake_loader)
+        cache.get('a'), cache.get('b')
+        cache.clear('a')
+        assert 'a' not in cache and 'b' in cache and cache.info()['a']['loads'] == 1
+        cache.clear()
+        assert cache.info() == {} and cache.nbytes == 0
+
+
+class TestColumnar:
+    frame = pd.DataFrame({'name': ['Ñandú', None, '', 'Peñarol S.A.'], 'cuit': ['1', '2', '3', None]})
+
+    def test_string_column(self):
+        column = StringColumn.from_values(self.frame['name'])
+        assert column.to_list() == ['Ñandú', None, '', 'Peñarol S.A.']
+        assert column.take([3, 1, 0, 3]) == ['Peñarol S.A.', None, 'Ñandú', 'Peñarol S.A.']
+        assert column[0] == 'Ñandú' and column[1] is None and len(column) == 4
+        assert StringColumn.from_values([]).to_list() == [] and StringColumn.from_values([]).take([]) == []
+
+    def test_write_and_verify(self, tmp_path):
+        directory = str(tmp_path / 'small')
+        _write_columnar(self.frame, directory, 'checksum')
+        dataset = _read_columnar('small', directory, verify=True)
+        assert isinstance(dataset.column('name').data, np.memmap)
+        assert dataset.to_pandas().equals(self.frame.astype(str).where(self.frame.notna()))
+        assert dataset.to_pandas(['cuit']).columns.tolist() == ['cuit'] and len(dataset) == 4
+        with pytest.raises(KeyError):
+            dataset.column('dni')
+
+        with open(os.path.join(directory, '0.data.npy'), 'r+b') as file:
+            file.seek(-1, os.SEEK_END)
+            file.write(b'X')
+        _read_columnar('small', directory)
+        with pytest.raises(ValueError):
+            _read_columnar('small', directory, verify=True)
+        with open(os.path.join(directory, 'meta.json')) as file:
+            meta = json.load(file)
+        meta['rows'] = 5
+        with open(os.path.join(directory, 'meta.json'), 'w') as file:
+            json.dump(meta, file)
+        with pytest.raises(ValueError):
+            _read_columnar('small', directory)
+
+    def test_bundled_dataset(self, cache_dir):
+        assert columnar_cache_dir() == cache_dir
+        dataset = load_columnar('companies')
+        assert dataset.directory.startswith(cache_dir) and os.path.basename(dataset.directory).startswith('companies-')
+        assert dataset.to_pandas().equals(_read_csv_source('companies'))
+        with open(os.path.join(dataset.directory, 'meta.json'), 'w') as file:
+            file.write('{}')
+        assert load_columnar('companies').to_pandas(['name']).equals(_read_csv_source('companies')[['name']])
+
+
+class TestLoadSource:
+    def test_projection_and_sampling(self):
+        full = _read_csv_source('companies')
+        assert load_source('companies', ['name']).equals(full[['name']])
+        sample = load_source('companies', ['name', 'cuit'], n=50, seed=7)
+        positions = sample_positions(len(full), 50, seed=7)
+        assert sample.index.tolist() == positions.tolist() and len(set(positions.tolist())) == 50
+        assert sample.values.tolist() == full[['name', 'cuit']].iloc[positions].values.tolist()
+        assert load_source('companies', ['name'], n=50, seed=7).equals(sample[['name']])
+        assert not load_source('companies', ['name'], n=50, seed=8).equals(sample[['name']])
+
+    def test_same_values_without_columnar_cache(self, monkeypatch):
+        expected = load_source('companies', ['name'], n=20, seed=3)
+        monkeypatch.setattr(datasets, '_columnar_or_none', lambda data_name: None)
+        assert load_source('companies', ['name'], n=20, seed=3).equals(expected)
+        with pytest.raises(KeyError):
+            load_source('companies', ['nombre'], n=20)
+
+    def test_spec(self):
+        assert sample_positions(5).tolist() == [0, 1, 2, 3, 4]
+        assert sorted(sample_positions(5, 5, seed=1).tolist()) == [0, 1, 2, 3, 4]
+        assert len(sample_positions(2, 10, replace=True, seed=1)) == 10
+        with pytest.raises(ValueError):
+            sample_positions(2, 10)
+        with pytest.raises(KeyError):
+            load_source('unknown')
+        with pytest.raises(KeyError):
+            load_source('companies', ['nombre'], n=2)
+
+
+class TestCorpus:
+    documents = [
+        {'doc_id': f'estatuto_{number}', 'text': f'Sociedad número {number}', 'entities': {'tags': []}}
+        for number in range(10)
+    ]
+
+    def test_streaming_and_random_access(self, tmp_path):
+        root = str(tmp_path / 'corpus')
+        with CorpusWriter(root, shard_bytes=200) as writer:
+            assert writer.add_many(self.documents[:6]) == [document['doc_id'] for document in self.documents[:6]]
+        shards = sorted(name for name in os.listdir(root) if name.startswith('shard-'))
+        assert len(shards) > 1
+        sizes = {name: os.path.getsize(os.path.join(root, name)) for name in shards}
+
+        with CorpusWriter(root) as writer:
+            writer.add_many(self.documents[6:])
+            with pytest.raises(KeyError):
+                writer.add(self.documents[0])
+        assert all(os.path.getsize(os.path.join(root, name)) == size for name, size in list(sizes.items())[:-1])
+
+        corpus = ShardedCorpus(root)
+        assert list(corpus) == self.documents and len(corpus) == 10
+        assert corpus['estatuto_7'] == self.documents[7] and corpus['estatuto_2'] == self.documents[2]
+        assert 'estatuto_11' not in corpus and corpus.get('estatuto_11') is None
+        corpus.close()
+
+    def test_interrupted_write(self, tmp_path):
+        root = str(tmp_path / 'corpus')
+        with CorpusWriter(root) as writer:
+            writer.add_many(self.documents[:2])
+        with open(os.path.join(root, 'shard-00000.jsonl'), 'ab') as file:
+            file.write(b'{"doc_id": "estatuto_')
+        with open(os.path.join(root, 'index.jsonl'), 'ab') as file:
+            file.write(b'["estatuto_')
+        assert list(ShardedCorpus(root)) == self.documents[:2]
+        with CorpusWriter(root) as writer:
+            writer.add(self.documents[2])
+        assert list(ShardedCorpus(root)) == self.documents[:3]
+
+    def test_spacy_examples_and_load_dataset(self, tmp_path, monkeypatch):
+        example = ('La sociedad Ñandú S.A.', {'entities': [(12, 22, 'NOMBRE')]})
+        with CorpusWriter(str(tmp_path / 'corpus')) as writer:
+            assert writer.add(example) == 'doc_00000000'
+        monkeypatch.setenv('NLPTOOLS_ESTATUTOS_DIR', str(tmp_path))
+        corpus = load_dataset('estatutos')
+        assert isinstance(corpus, ShardedCorpus) and list(corpus.spacy_examples()) == [example]
+        assert corpus['doc_00000000']['entities']['tags'][0]['text'] == 'Ñandú S.A.'
+        with pytest.raises(KeyError):
+            load_dataset('calles')
+        with pytest.raises(FileNotFoundError):
+            load_dataset('estatutos', root=str(tmp_path / 'missing'))
+
+
+class TestSharedDatasets:
+    def test_handle_reads_shared_memory(self):
+        with share_datasets(['companies'], columns={'companies': ['name']}) as shared:
+            handle = pickle.loads(pickle.dumps(shared.handle))
+            assert len(pickle.dumps(shared.handle)) < 2048 and handle == shared.handle and 'companies' in handle
+            assert not isinstance(handle.dataset('companies').column('name').data, np.memmap)
+            assert load_source('companies', ['name'], n=30, seed=2, shared=handle).equals(
+                load_source('companies', ['name'], n=30, seed=2)
+            )
+            assert load_source('calles', ['nombre'], n=3, seed=2, shared=handle).equals(
+                load_source('calles', ['nombre'], n=3, seed=2)
+            )
+            with pytest.raises(KeyError):
+                handle.dataset('calles')
+            with pytest.raises(KeyError):
+                load_source('companies', ['cuit'], n=3, shared=handle)
+        with pytest.raises(KeyError):
+            share_datasets(['unknown'])
+
+    def test_read_after_close(self):
+        shared = share_datasets(['companies'], columns={'companies': ['name']})
+        column = shared.handle.dataset('companies').column('name')
+        expected = column.take([0, 1])
+        shared.close()
+        for read in [lambda: column.take([0, 1]), lambda: column[0], column.to_list, lambda: len(column)]:
+            with pytest.raises(ValueError, match='was closed'):
+                read()
+        shared.close()
+        assert expected == load_source('companies', ['name'])['name'].iloc[:2].to_list()
+
+    def test_worker_processes(self):
+        from nlptools.data_augmentation import random_name_generator
+        expected = random_name_generator(20, 'company', seed=5)
+        with share_datasets(['companies'], columns={'companies': ['name']}) as shared:
+            with multiprocessing.get_context('spawn').Pool(2) as pool:
+                results = pool.map(_shared_sample, [shared.handle] * 2)
+        assert results == [expected, expected]
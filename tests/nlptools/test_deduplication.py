@@ -0,0 +1,35 @@
+import pytest
+from nlptools.example import example_data
+from nlptools.deduplication import find_duplicates, DuplicateReport
+
+
+class TestFindDuplicates:
+    text = example_data['text']
+    documents = [
+        {'doc_id': 'original', 'text': text, 'entities': {'tags': []}},
+        {'doc_id': 'rescan', 'text': text.replace('sociedad', 'sociedod', 5), 'entities': {'tags': []}},
+        {'doc_id': 'other', 'text': text[::-1], 'entities': {'tags': []}},
+        {'doc_id': 'same_company', 'text': 'Contrato de CONFECOM', 
+         'entities': {'tags': [{'tag': 'razon_social', 'text': 'CONFECOM S.R.L."'}]}},
+        {'doc_id': 'same_company_rescan', 'text': 'Contrato de CONFECOM.', 
+         'entities': {'tags': [{'tag': 'razon_social', 'text': 'Confecom S.R.L.'}]}},
+    ]
+
+    @pytest.mark.parametrize('n_jobs', [1, 2])
+    def test_clusters(self, n_jobs):
+        report = find_duplicates(self.documents, threshold=0.9, n_jobs=n_jobs, chunksize=1)
+        assert isinstance(report, DuplicateReport)
+        assert sorted(report.clusters) == [['original', 'rescan'], ['same_company', 'same_company_rescan']]
+        assert report.stats['documents'] == 5
+        assert report.stats['candidate_pairs'] < report.stats['possible_pairs']
+
+    def test_blocking_keys(self):
+        report = find_duplicates(self.documents, threshold=0.9, blocking=['razon_social'], n_jobs=1)
+        assert report.clusters == [['same_company', 'same_company_rescan']]
+        with pytest.raises(KeyError):
+            find_duplicates(self.documents, blocking=['address'])
+
+    def test_plain_texts(self):
+        report = find_duplicates(['pesos cincuenta mil', 'pesos cincuenta mil.', 'cuotas'], n_jobs=1)
+        assert report.clusters == [[0, 1]]
+        assert report.pairs[0][:2] == (0, 1)
@@ -0,0 +1,43 @@
+import subprocess
+import sys
+import pytest
+import nlptools
+from nlptools import parsing
+
+
+def _loaded_after_import(module: str) -> list:
+    code = (
+        f'import sys, {module}\n'
+        "print(*[name for name in ['pandas', 'spacy', 'num2words', 'spa2num', 'tqdm']"
+        " if type(sys.modules.get(name)).__name__ == 'module'])"
+    )
+    return subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout.split()
+
+
+class TestLazyImports:
+    @pytest.mark.parametrize('module', [
+        'nlptools', 'nlptools.parsing', 'nlptools.comparison', 'nlptools.datasets',
+        'nlptools.data_augmentation', 'nlptools.resolver', 'nlptools.training',
+    ])
+    def test_heavy_dependencies_are_not_imported(self, module):
+        loaded = _loaded_after_import(module)
+        assert not set(loaded) & {'pandas', 'spacy', 'num2words', 'spa2num', 'tqdm'}
+        if module == 'nlptools':
+            assert loaded == []
+
+    def test_namespace(self):
+        assert nlptools.remove_tildes is parsing.remove_tildes
+        assert nlptools.parsing is parsing
+        assert nlptools.load_source.__module__ == 'nlptools.datasets'
+        assert set(nlptools.__all__) <= set(dir(nlptools))
+        with pytest.raises(AttributeError):
+            nlptools.unknown
+
+    def test_exports_exist(self):
+        for name in nlptools.__all__:
+            assert getattr(nlptools, name) is not None
+
+    def test_lazy_module(self):
+        assert nlptools._lazy_module('json') is sys.modules['json']
+        with pytest.raises(ModuleNotFoundError):
+            nlptools._lazy_module('nlptools_missing_module')
@@ -0,0 +1,292 @@
+import datetime
+import re
+import numpy as np
+import pandas as pd
+import pytest
+from num2words import num2words
+from spa2num.converter import to_number
+from nlptools.data_augmentation import date_formatter, id_generator
+from nlptools.example import example_data
+from nlptools.parsing import (
+    clear_conversion_cache,
+    conversion_cache_info,
+    find_amounts,
+    find_amounts_many,
+    find_dates,
+    find_dates_many,
+    find_ids,
+    find_ids_many,
+    merge_pages,
+    merge_pages_many,
+    parse_date,
+    parse_dates,
+    number_to_words,
+    number_to_words_many,
+    words_to_numbers,
+    words_to_numbers_many,
+    remove_tildes, 
+    validate_cuits,
+    retokenizer,
+    TextNormalizer,
+    Tokenizer,
+    get_tokenizer,
+    register_tokenizer
+)
+
+
+def _reference_remove_tildes(text):
+    for accented, plain in zip('ÁÉÍÓÚÄËÏÖÜÀÈÌÒÙáéíóúäëïöüàèìòù', 'AEIOUAEIOUAEIOUaeiouaeiouaeiou'):
+        text = text.replace(accented, plain)
+    return text
+
+
+_REFERENCE_PATTERNS = {
+    'alphanumeric': re.compile(r'\b(\w?\w+)', re.IGNORECASE),
+    'alphabetic': re.compile(r'\b([A-Za-zÀ-ÖØ-öø-ÿ]?[A-Za-zÀ-ÖØ-öø-ÿ]+)', re.IGNORECASE),
+    'numeric': re.compile(r'([0-9]+[.,]?[0-9]+([.,]?[0-9]+)?([.,]?[0-9]+)?([.,][0-9]+)?)'),
+    'Name': re.compile(
+        r'(?:[A-ZÀ-ÿ][A-Za-zÀ-ÖØ-öø-ÿ]+\s?)+(?:(?:[a-zà-ÿ]{1,4}\s)?(?:[A-ZÀ-ÿ][A-Za-zÀ-ÖØ-öø-ÿ]+\s?)+)'
+    ),
+}
+
+
+class TestTextNormalizer:
+    texts = example_data['text'].split('\n') + ['ÁÉÍÓÚ äëïöü ÀÈÌÒÙ Ññ Çç', '', 'x\x00y']
+
+    def test_remove_tildes_is_unchanged(self):
+        every_char = ''.join(chr(i) for i in range(1, 0x3000))
+        assert remove_tildes(every_char) == _reference_remove_tildes(every_char)
+        assert [remove_tildes(t) for t in self.texts] == [_reference_remove_tildes(t) for t in self.texts]
+
+    @pytest.mark.parametrize('mode', ['table', 'unicode'])
+    @pytest.mark.parametrize('lowercase', [False, True])
+    def test_batches_match_single_texts(self, mode, lowercase):
+        normalizer = TextNormalizer(mode, lowercase)
+        expected = [normalizer.normalize(t) for t in self.texts]
+        assert normalizer.normalize_many(self.texts) == expected
+        assert normalizer.normalize_many(iter(self.texts)) == expected
+        series = pd.Series(self.texts + [None], index=range(10, 10 + len(self.texts) + 1), name='text')
+        normalized = normalizer.normalize_many(series)
+        assert normalized.tolist()[:-1] == expected
+        assert pd.isna(normalized.iloc[-1])
+        assert normalized.index.equals(series.index) and normalized.name == 'text'
+
+    def test_modes(self):
+        assert TextNormalizer().normalize('Peñarol Ñandú Ç') == 'Peñarol Ñandu Ç'
+        assert TextNormalizer(lowercase=True).normalize('PEÑAROL ÁNGEL') == 'peñarol angel'
+        assert TextNormalizer('unicode').normalize('Peñarol Ñandú Ç') == 'Penarol Nandu C'
+        assert TextNormalizer('unicode', lowercase=True)('ÅNGSTRÖM') == 'angstrom'
+        assert TextNormalizer().normalize_many([]) == []
+        with pytest.raises(KeyError):
+            TextNormalizer('ascii')
+
+
+class TestTokenizer:
+    texts = [page['lectura'] for page in example_data['pages'].values()] + [example_data['text'], '']
+
+    @pytest.mark.parametrize('style', ['alphanumeric', 'alphabetic', 'numeric', 'Name', None, 'unknown'])
+    def test_retokenizer_is_unchanged(self, style):
+        for text in self.texts:
+            expected = _REFERENCE_PATTERNS[style].findall(text) if style in _REFERENCE_PATTERNS else text.split()
+            assert retokenizer(text, style=style) == expected
+            assert retokenizer(text, pattern=r'\d+', style=style) == re.findall(r'\d+', text)
+
+    @pytest.mark.parametrize('style', ['alphanumeric', 'alphabetic', 'numeric', 'Name', None])
+    def test_offsets(self, style):
+        tokenizer = get_tokenizer(style)
+        assert get_tokenizer(style) is tokenizer
+        for (tokens, offsets), text in zip(tokenizer.tokenize_many(iter(self.texts)), self.texts):
+            assert tokens == tokenizer.tokenize(text)
+            assert offsets.shape == (len(tokens), 2) and offsets.dtype == np.int64
+            assert [text[start:end] for start, end in offsets] == tokens
+        if style == 'numeric':
+            tokens = tokenizer.tokenize(self.texts[-2])
+            assert tokens and tokens == [groups[0] for groups in retokenizer(self.texts[-2], style=style)]
+
+    def test_custom_patterns(self):
+        tokenizer = register_tokenizer('test_cuit', r'\b(\d{2})-\d{8}-\d\b')
+        assert retokenizer('CUIT 30-71596183-7 y 20-12345678-9', style='test_cuit') == ['30', '20']
+        assert tokenizer.tokenize_with_offsets('CUIT 30-71596183-7')[1].tolist() == [[5, 7]]
+        assert Tokenizer(r'[a-z]+', flags=re.IGNORECASE).tokenize('Hola Mundo 2') == ['Hola', 'Mundo']
+        with pytest.raises(KeyError):
+            get_tokenizer('not_registered')
+
+
+class TestNumberConversion:
+    numbers = [0, 1, 9, 15, 31, 99, 101, 1900, 1999, 2050, 2051, 5000, 35000, 1000000, 1234567, '05', 12.5]
+
+    def test_outputs_are_unchanged(self):
+        for to in ['cardinal', 'ordinal']:
+            for number in self.numbers:
+                if to == 'ordinal' and isinstance(number, float):
+                    continue
+                assert number_to_words(number, to=to) == num2words(number, lang='es', to=to)
+        assert number_to_words(21, lang='en') == num2words(21, lang='en')
+        for words in ['cinco', 'mil novecientos noventa', 'dos mil quinientos millones', 'trescientos mil']:
+            assert words_to_numbers(words) == to_number(words)
+
+    def test_batches_match_single_values(self):
+        assert number_to_words_many(iter(self.numbers)) == [number_to_words(n) for n in self.numbers]
+        assert number_to_words_many([1, 2], to='ordinal') == ['primero', 'segundo']
+        texts = [number_to_words(n) for n in [5, 1990, 5, 2500000000]]
+        assert words_to_numbers_many(texts) == [5, 1990, 5, 2500000000]
+
+    def test_statistics(self):
+        clear_conversion_cache()
+        number_to_words(1990)
+        number_to_words(1234567)
+        number_to_words(1234567)
+        info = conversion_cache_info()['number_to_words']
+        assert info['table_hits'] == 1 and info['hits'] == 1 and info['misses'] == 1 and info['currsize'] == 1
+        assert info['table_size'] > 0 and info['maxsize'] > 0
+        clear_conversion_cache()
+        info = conversion_cache_info()['number_to_words']
+        assert info['table_hits'] == info['hits'] == info['currsize'] == 0
+
+
+class TestFindAmounts:
+    def test_example_pages(self):
+        pages = [page['lectura'] for page in example_data['pages'].values()]
+        amounts = list(find_amounts_many(iter(pages)))
+        assert [[pages[i][start:end] for start, end, _, _ in found] for i, found in enumerate(amounts)] == [
+            ['CINCUENTA\nmil ($50.000)'], [], ['veintidós', 'dos']
+        ]
+        assert amounts[0][0][2:] == (50000, 50000) and [value for *_, value, _ in amounts[2]] == [22, 2]
+
+    @pytest.mark.parametrize('number', [2, 16, 21, 45, 100, 101, 999, 1000, 1945, 2050, 35000, 118541, 1200000, 2500000000])
+    def test_round_trip(self, number):
+        words = number_to_words(number)
+        assert find_amounts(f'la suma de {words} pesos') == [(11, 11 + len(words), number, None)]
+        assert find_amounts(words.upper())[0][2] == number
+
+    def test_noise_and_splits(self):
+        assert find_amounts('CIN-\n\nCUENTA MIL') == [(0, 16, 50000, None)]
+        assert find_amounts('veintidós de febrero de dos mil veinte') == [(0, 9, 22, None), (24, 38, 2020, None)]
+        assert find_amounts('cinco cinco') == [(0, 5, 5, None), (6, 11, 5, None)]
+        assert find_amounts('treinta y mil') == [(0, 7, 30, None), (10, 13, 1000, None)]
+        assert find_amounts('una sociedad de un socio') == []
+        assert find_amounts('un ( 1 ) voto y cinco mil (5.000,50)') == [(0, 8, 1, 1), (16, 36, 5000, 5000)]
+        assert find_amounts('CIENTO VEINTE MIL ($ 120.000.-)') == [(0, 31, 120000, 120000)]
+        assert find_amounts('diez mil ($10.000,00 -)') == [(0, 23, 10000, 10000)]
+        assert find_amounts('doscientosmil 50000 en un 23 por ciento') == []
+        assert find_amounts('ciento cinco y ciento mil') == [(0, 12, 105, None), (22, 25, 1000, None)]
+
+
+class TestDates:
+    styles = ['basic', 'basic2', 'mixed', 'mixed2', 'regular', 'formal', 'veryformal']
+    dates = [datetime.date(1900, 1, 1), datetime.date(1945, 12, 27), datetime.date(2000, 2, 29), 
+             datetime.date(2016, 7, 16), datetime.date(2021, 11, 21), datetime.date(2050, 3, 31)]
+
+    @pytest.mark.parametrize('style', styles)
+    def test_round_trip(self, style):
+        for date in self.dates:
+            text = date_formatter(date, style)
+            assert parse_date(text) == date
+            assert parse_date(text.upper()) == date
+            assert parse_date(remove_tildes(text)) == date
+            assert find_dates(f'el {text}, y') == [(3, 3 + len(text), date)]
+            without_year = date_formatter(date, style, include_year=False)
+            assert parse_date(without_year) is None
+            assert parse_date(without_year, default_year=date.year) == date
+
+    def test_batches(self):
+        texts = [date_formatter(date, style) for date in self.dates for style in self.styles] + ['30/02/2020', 'hoy']
+        assert parse_dates(iter(texts)) == [parse_date(text) for text in texts]
+        assert parse_dates(texts)[-2:] == [None, None]
+        documents = [example_data['text'], 'el 1º de Enero de 2020 y 05/11', '']
+        assert list(find_dates_many(iter(documents), 2021)) == [find_dates(text, 2021) for text in documents]
+
+    def test_find_in_text(self):
+        text = 'CUIT 27-17636488-8, nacida el 6 de marzo de 1990, cierra el 31 de diciembre de cada año'
+        assert find_dates(text) == [(30, 48, datetime.date(1990, 3, 6))]
+        assert find_dates(text, 2021)[1] == (60, 75, datetime.date(2021, 12, 31))
+        assert find_dates('a veintidós de febrero de dos\n\nargentina') == []
+        assert find_dates('vigésimo primer día del mes de mayo del año dos mil uno.')[0][2] == datetime.date(2001, 5, 21)
+
+
+class TestMergePages:
+    pages = example_data['pages']
+
+    def test_example_pages(self):
+        text, offsets = merge_pages(self.pages)
+        raw = [page['lectura'] for page in self.pages.values()]
+        assert 'Raul Alberto LESCANO, nacida' in text and 'C.U.I.T.: 27-17636488-8' in text
+        assert '  ' not in text and '\n' not in text and remove_tildes(text) == text
+        assert len(offsets) == len(text) and len(offsets.clean_starts) < len(text) // 10
+        pages, positions = offsets.to_raw(np.arange(len(text)))
+        for char, page, position in zip(text, pages, positions):
+            original = raw[page][position] if position < len(raw[page]) else ' '
+            assert char == remove_tildes(original) or (char == ' ' and original.isspace())
+
+    def test_spans(self):
+        text, offsets = merge_pages(['ab re-\n', '  gistro 27-\n17636488-8\n\n'], remove_accents=False)
+        assert text == 'ab registro 27-17636488-8'
+        assert offsets.span_to_raw(3, 11) == [(0, 3, 5), (1, 2, 8)]
+        assert offsets.span_to_raw(12, 25) == [(1, 9, 23)]
+        assert offsets.to_raw(14) == (1, 11)
+        with pytest.raises(IndexError):
+            offsets.to_raw(len(text))
+        assert merge_pages([])[0] == '' and merge_pages(['', ' \n'])[0] == ''
+
+    def test_blank_pages(self):
+        assert merge_pages(['\n', 'texto'])[0] == 'texto'
+        text, offsets = merge_pages([' \n', 're-\n', '\n\t', 'gistro', '\n'], remove_accents=False)
+        assert text == 'registro'
+        assert offsets.span_to_raw(0, 8) == [(1, 0, 2), (3, 0, 6)]
+
+    def test_many(self):
+        documents = [self.pages, ['Año  índice'], {}]
+        merged = list(merge_pages_many(iter(documents)))
+        assert [text for text, _ in merged] == [merge_pages(pages)[0] for pages in documents]
+        assert merged[1][0] == 'Año indice'
+
+
+def _check_digit(number):
+    remainder = sum(int(digit) * weight for digit, weight in zip(number, [5, 4, 3, 2, 7, 6, 5, 4, 3, 2])) % 11
+    return '012345678990'[11 - remainder]
+
+
+class TestFindIds:
+    def test_example_pages(self):
+        pages = [page['lectura'] for page in example_data['pages'].values()]
+        found = list(find_ids_many(iter(pages)))
+        assert [(kind, value) for kind, value in [item[2:] for item in found[0]]] == [
+            ('DNI', '17636488'), ('CUIT', '27176364888'), ('DNI', '41048026'), ('CUIL', '27410480269')
+        ]
+        assert [pages[0][start:end] for start, end, _, _ in found[0]][1] == '27-\n17636488-8'
+        assert [value for *_, value in find_ids(example_data['text'])] == [
+            '17636488', '27176364888', '41048026', '27410480269', '17636488'
+        ]
+
+    def test_generated_ids(self):
+        for seed in range(1, 50):
+            dni = id_generator(seed=seed)
+            cuit = id_generator(cuit=True, seed=seed)
+            cuit = cuit[:-1] + _check_digit(cuit.replace('-', '')[:10])
+            text = f'DNI {dni}, CUIT\n{cuit}.'
+            assert find_ids(text) == [
+                (4, 4 + len(dni), 'DNI', dni.replace('.', '')),
+                (text.index(cuit), text.index(cuit) + 13, 'CUIT', cuit.replace('-', '')),
+            ]
+
+    def test_noise_and_validation(self):
+        text = 'c.u.i.t n° 30 50000319 3, D.N.I.: 41048026, $ 1.000.000, 2.000.000 de pesos, 5.965/63'
+        assert find_ids(text) == [(11, 24, 'CUIT', '30500003193'), (34, 42, 'DNI', '41048026')]
+        assert find_ids('la suma de pesos 50.000.000, PESOS: 1.500.000 y Pesos\n2.000.000') == []
+        assert find_ids('pesos 50.000.000, DNI 41.048.026') == [(22, 32, 'DNI', '41048026')]
+        assert find_ids('la suma de PESOS UN MILLÓN QUINIENTOS MIL (1.500.000)') == []
+        assert find_ids('un millon quinientos mil ( 1.500.000.- )') == []
+        assert find_ids('dividido en 1.500.000 cuotas, 2.000.000 de acciones y 3.000.000 VOTOS') == []
+        assert find_ids('Juan Pérez (17.636.488), DNI (41.048.026)') == [
+            (12, 22, 'DNI', '17636488'), (30, 40, 'DNI', '41048026')
+        ]
+        assert find_ids('CUIT 30-50000319-4') == []
+        assert find_ids('CUIT 30-50000319-4', validate=False) == [(5, 18, 'CUIT', '30500003194')]
+
+    def test_validate_cuits(self):
+        values = ['27-17636488-8', '27410480269', '30-50000319-3', '30-50000319-4', '3050000319', '']
+        assert validate_cuits(values).tolist() == [True, True, True, False, False, False]
+        numbers = [f'{prefix}{number:08d}' for prefix in (20, 23, 27, 30, 33) for number in range(0, 10 ** 8, 7654321)]
+        cuits = [number + _check_digit(number) for number in numbers]
+        assert validate_cuits(cuits).all()
+        assert validate_cuits([]).shape == (0,)
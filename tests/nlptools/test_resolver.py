@@ -0,0 +1,78 @@
+import pandas as pd
+import pytest
+from nlptools.resolver import CompanyResolver, normalize_company_name
+
+
+class TestNormalizeCompanyName:
+    @pytest.mark.parametrize('name', [
+        'CONFECOM S.R.L."',
+        '“Confecom s.r.l.”',
+        'CONFECOM s.R.b.',
+        'CONFECOM S.',
+        'CONFECOM SOCIEDAD DE RESPONSABILIDAD LIMITADA',
+        'CONFECOM SRL',
+        'CONFECOM SRL.',
+        'CONFECOM S R L.',
+        '"CONFECOM SAIC."',
+    ])
+    def test_variants(self, name):
+        assert normalize_company_name(name) == 'CONFECOM'
+
+    def test_keeps_name(self):
+        assert normalize_company_name('Panadería Ñandú S.A.') == 'PANADERIA ÑANDU'
+        assert normalize_company_name('GRUPO X') == 'GRUPO X'
+        assert normalize_company_name('A.B.C. S.A.') == 'A B C'
+
+    @pytest.mark.parametrize('name, expected', [
+        ('A B C', 'A B C'),
+        ('A.B.C.', 'A B C'),
+        ('X Y Z S.A.', 'X Y Z'),
+        ('A B S A', 'A B'),
+        ('J P S R L', 'J P'),
+        ('ACME SA.', 'ACME'),
+    ])
+    def test_single_letters(self, name, expected):
+        assert normalize_company_name(name) == expected
+
+
+class TestCompanyResolver:
+    source = pd.DataFrame({
+        'cuit': ['30111111111', '30222222222', '30333333333', '30444444444'],
+        'dni': ['11111111', '22222222', '33333333', '44444444'],
+        'name': ['CONFECOM S.R.L.', 'CONFECOM S.A.', 'BANCO DE SAN JUAN S.A.', None],
+    })
+
+    def test_resolve(self):
+        resolver = CompanyResolver(self.source)
+        assert resolver.resolve('CONFECOM S.R.L."') == ('30111111111', 'CONFECOM S.R.L.', 1.0)
+        assert resolver.resolve('Confecom Sociedad Anónima') == ('30222222222', 'CONFECOM S.A.', 1.0)
+        assert resolver.resolve('CONFECOM s.R.b.')[0] in ('30111111111', '30222222222')
+        assert resolver.resolve('Bnco de San Juan SA')[0] == '30333333333'
+        assert resolver.resolve('Molinos Río de la Plata') is None
+        assert resolver.resolve('') is None
+
+    def test_resolve_many_and_cache(self):
+        resolver = CompanyResolver(self.source, cache_size=2)
+        names = ['CONFECOM S.R.L.', 'BANCO DE SAN JUAN', 'CONFECOM S.R.L.', 'Molinos']
+        resolved = resolver.resolve_many(names)
+        assert resolved == [resolver.resolve(name) for name in names]
+        assert [result and result[0] for result in resolved] == ['30111111111', '30333333333', '30111111111', None]
+        info = resolver.cache_info()
+        assert info.maxsize == 2 and info.currsize == 2 and info.hits > 0
+        resolver.cache_clear()
+        assert resolver.cache_info().currsize == 0
+
+    def test_index_path(self, tmp_path):
+        index_path = str(tmp_path / 'companies.idx')
+        CompanyResolver(self.source, index_path=index_path)
+        resolver = CompanyResolver(self.source, index_path=index_path)
+        assert resolver.resolve('BANCO DE SAN JUAN')[0] == '30333333333'
+
+    def test_index_path_with_changed_source(self, tmp_path):
+        index_path = str(tmp_path / 'companies.idx')
+        CompanyResolver(self.source, index_path=index_path)
+        changed = pd.DataFrame({'cuit': ['30555555555'], 'name': ['ZZZ S.A.']})
+        resolver = CompanyResolver(changed, index_path=index_path)
+        assert resolver.resolve('ZZZ SA') == ('30555555555', 'ZZZ S.A.', 1.0)
+        assert resolver.resolve('CONFECOM S.R.L.') is None
+        assert CompanyResolver(changed, index_path=index_path).resolve('ZZZ SA')[0] == '30555555555'